@@ -28,6 +28,7 @@ import argparse
 import sys
 import time
 from pathlib import Path
+from typing import Optional
 
 
 def find_pytorch_model(export_folder: Path) -> Path:
@@ -51,7 +52,11 @@ def build_tensorrt_engine(
     output_path: Path,
     fp16: bool = True,
     workspace: int = 4,
-    verbose: bool = True
+    verbose: bool = True,
+    int8: bool = False,
+    calib_data: Optional[Path] = None,
+    batch: int = 1,
+    dynamic: bool = False
 ) -> bool:
     """
     Build TensorRT engine from PyTorch model.
@@ -62,6 +67,10 @@ def build_tensorrt_engine(
         fp16: Enable FP16 precision (faster, slightly less accurate)
         workspace: Max workspace size in GB
         verbose: Print detailed build log
+        int8: Enable INT8 precision (needs calib_data; FP16 stays enabled as fallback)
+        calib_data: Dataset YAML whose val images are used for INT8 calibration
+        batch: Max batch size baked into the engine
+        dynamic: Build with dynamic batch/shape profiles
         
     Returns:
         True if successful, False otherwise
@@ -89,11 +98,17 @@ def build_tensorrt_engine(
     print(f"PyTorch Model: {pt_path}")
     print(f"Output: {output_path}")
     print(f"FP16: {fp16}")
+    print(f"INT8: {int8}" + (f" (calibration: {calib_data})" if int8 else ""))
+    print(f"Batch: {batch}{' (dynamic)' if dynamic else ''}")
     print(f"Workspace: {workspace}GB")
     print("=" * 70)
     print()
     
     # Check if TensorRT is available
+    if int8 and (calib_data is None or not calib_data.exists()):
+        print("❌ INT8 needs a calibration dataset YAML: --calib-data /path/to/data.yaml")
+        return False
+    
     try:
         import tensorrt as trt
         print(f"✓ TensorRT version: {trt.__version__}")
@@ -137,14 +152,20 @@ def build_tensorrt_engine(
         print()
         
         # Export to TensorRT
-        # Ultralytics will automatically build the engine
-        model.export(
+        # Ultralytics will automatically build the engine (INT8 runs an entropy
+        # calibrator over the dataset's val images)
+        export_kwargs = dict(
             format="engine",
             imgsz=imgsz,
             half=fp16,
             workspace=workspace,
+            batch=batch,
+            dynamic=dynamic,
             verbose=verbose
         )
+        if int8:
+            export_kwargs.update(int8=True, data=str(calib_data))
+        model.export(**export_kwargs)
         
         elapsed = time.time() - start_time
         
@@ -207,6 +228,9 @@ Examples:
   # Build with custom settings
   python build_tensorrt_engine.py /path/to/svo_model_folder/ --workspace 2 --no-fp16
   
+  # INT8 engine for batched inference (calibrated on the dataset's val images)
+  python build_tensorrt_engine.py /path/to/svo_model_folder/ --int8 --calib-data /path/to/data.yaml --batch 8 --dynamic
+  
   # Build from specific ONNX file
   python build_tensorrt_engine.py --onnx-path /path/to/model.onnx --output /path/to/output.engine
 """
@@ -237,6 +261,31 @@ Examples:
         help="Disable FP16 precision (use FP32, slower but more accurate)"
     )
     
+    parser.add_argument(
+        "--int8",
+        action="store_true",
+        help="Enable INT8 precision (requires --calib-data)"
+    )
+    
+    parser.add_argument(
+        "--calib-data",
+        type=Path,
+        help="Dataset YAML used for INT8 calibration"
+    )
+    
+    parser.add_argument(
+        "--batch",
+        type=int,
+        default=1,
+        help="Max batch size of the engine (default: 1)"
+    )
+    
+    parser.add_argument(
+        "--dynamic",
+        action="store_true",
+        help="Build with dynamic batch/input shapes"
+    )
+    
     parser.add_argument(
         "--workspace",
         type=int,
@@ -280,7 +329,11 @@ Examples:
         output_path=output_path,
         fp16=not args.no_fp16,
         workspace=args.workspace,
-        verbose=args.verbose
+        verbose=args.verbose,
+        int8=args.int8,
+        calib_data=args.calib_data,
+        batch=args.batch,
+        dynamic=args.dynamic
     )
     
     return 0 if success else 1
@@ -254,6 +254,11 @@ class SVOPipelineScenario(BenchmarkScenario):
         self.depth_hz = None  # Depth refresh rate (None = every frame)
         self.depth_frame_count = 0  # Track frames with depth computation
         self.last_valid_detections = []  # Cache last detections for frame skipping
+        self._bgr_buffer = None  # Reused model input buffer (see run_frame)
+        self._preview_buffers = [None, None]  # Alternating RGB preview buffers
+        self._preview_idx = 0
+        self.preview_size = None  # Max (width, height) of preview frames (None = full resolution)
+        self._preview_small = None  # Reused downscaled BGR frame for the preview
     
     def setup(self, config: Dict[str, Any]) -> bool:
         """
@@ -273,7 +278,11 @@ class SVOPipelineScenario(BenchmarkScenario):
                 - depth_mode: Depth mode string (NEURAL_LIGHT, NEURAL, NEURAL_PLUS)
                 - depth_hz: Depth refresh rate in Hz (None=every frame, 1-10 for frame skipping)
                 - loading_progress_callback: Function to call with loading progress
-                - preview_callback: Function to call with preview image
+                - preview_callback: Function to call with preview image. The array is a
+                  reused buffer: return False if the frame was dropped (not handed on),
+                  so the buffer is rewritten next frame instead of the one being shown
+                - preview_size: Optional (max_width, max_height) preview frames are
+                  downscaled to fit (None = full resolution)
         
         Returns:
             True if setup successful, False otherwise
@@ -290,6 +299,7 @@ class SVOPipelineScenario(BenchmarkScenario):
             self.save_annotations_only = config.get('save_annotations_only', False)
             self.output_dir = config.get('output_dir')
             self.preview_callback = config.get('preview_callback')
+            self.preview_size = config.get('preview_size')
             self.loading_progress_callback = config.get('loading_progress_callback')
             
             # Get depth mode from config
@@ -401,7 +411,8 @@ class SVOPipelineScenario(BenchmarkScenario):
         Processes the entire SVO2 file frame by frame.
         
         Returns:
-            Dictionary with detections, timings, and metadata
+            Dictionary with detections, timings, and metadata. 'depth_means'
+            holds each detection's mean depth as a float32 array (-1 = none).
         """
         import pyzed.sl as sl
         import cv2
@@ -428,9 +439,10 @@ class SVOPipelineScenario(BenchmarkScenario):
         self.camera.retrieve_image(self.image, sl.VIEW.LEFT)
         timings['grab'] = (time.time() - grab_start) * 1000
         
-        # Convert to numpy for YOLO
-        img_np = self.image.get_data()[:, :, :3]  # Remove alpha channel
-        img_bgr = cv2.cvtColor(img_np, cv2.COLOR_RGBA2BGR)
+        # Convert to numpy for YOLO: one conversion pass straight from the 4-channel
+        # view into a reused buffer (drops alpha, same channel order as before)
+        img_bgr = self._bgr_buffer = cv2.cvtColor(self.image.get_data(), cv2.COLOR_RGBA2BGR,
+                                                  dst=self._bgr_buffer)
         
         # 2. Run inference
         inference_start = time.time()
@@ -453,7 +465,11 @@ class SVOPipelineScenario(BenchmarkScenario):
             frame_interval = max(1, int(svo_fps / self.depth_hz))
             compute_depth = (self.frame_index % frame_interval == 0)
         
-        if compute_depth:
+        boxes = results[0].boxes
+        
+        # Depth is only read inside boxes (and shown for frames with detections):
+        # skip the full-frame depth transfer when nothing was detected
+        if compute_depth and len(boxes) > 0:
             # Retrieve depth once for all boxes
             self.camera.retrieve_measure(self.depth, sl.MEASURE.DEPTH)
             depth_np = self.depth.get_data()
@@ -462,7 +478,8 @@ class SVOPipelineScenario(BenchmarkScenario):
             # Skip depth computation, use cached detections from last frame
             depth_np = None
         
-        for box in results[0].boxes:
+        depth_means = np.full(len(boxes), -1.0, dtype=np.float32)
+        for box_idx, box in enumerate(boxes):
             x1, y1, x2, y2 = map(int, box.xyxy[0].tolist())
             
             if depth_np is not None:
@@ -490,6 +507,7 @@ class SVOPipelineScenario(BenchmarkScenario):
                 std_depth = 0.0
                 valid_pixels = 0
             
+            depth_means[box_idx] = mean_depth
             detections.append({
                 'class': int(box.cls[0]),
                 'confidence': float(box.conf[0]),
@@ -500,7 +518,7 @@ class SVOPipelineScenario(BenchmarkScenario):
             })
         
         # Cache detections if we computed depth
-        if depth_np is not None:
+        if compute_depth:
             self.last_valid_detections = detections
         
         timings['depth'] = (time.time() - depth_start) * 1000
@@ -566,30 +584,41 @@ class SVOPipelineScenario(BenchmarkScenario):
             annotation_filename = f"frame_{self.frame_index:06d}.txt"
             annotation_path = Path(self.output_dir) / annotation_filename
             
-            if annotation_lines:  # Only save if there are detections
-                with open(annotation_path, 'w') as f:
-                    f.write('\n'.join(annotation_lines))
-            else:
-                # Create empty file to maintain frame index consistency
-                annotation_path.touch()
+            # One unbuffered write (an empty file keeps frame index consistency)
+            with open(annotation_path, 'wb', buffering=0) as f:
+                f.write('\n'.join(annotation_lines).encode())
             
             timings['save'] = (time.time() - save_start) * 1000
         
         # Send preview to GUI (always, regardless of save mode or detections)
         if self.preview_callback:
-            # Create annotated image for preview (show frame even if no detections)
-            preview_img = img_bgr.copy()
+            # Create annotated image for preview (show frame even if no detections):
+            # downscale to the preview size first (the GUI never shows more), then
+            # convert to RGB for Qt display straight into a reused buffer and draw
+            # on that (colors below are RGB). Two buffers alternate so the GUI can
+            # still be reading the previously handed-on one.
+            preview_src, scale = img_bgr, 1.0
+            if self.preview_size:
+                frame_h, frame_w = img_bgr.shape[:2]
+                scale = min(self.preview_size[0] / frame_w, self.preview_size[1] / frame_h, 1.0)
+                if scale < 1.0:
+                    preview_src = self._preview_small = cv2.resize(
+                        img_bgr, (max(1, round(frame_w * scale)), max(1, round(frame_h * scale))),
+                        dst=self._preview_small, interpolation=cv2.INTER_AREA)
+            idx = self._preview_idx
+            preview_rgb = self._preview_buffers[idx] = cv2.cvtColor(
+                preview_src, cv2.COLOR_BGR2RGB, dst=self._preview_buffers[idx])
             
             # Draw detections if any
             if detections:
                 for det in detections:
-                    x1, y1, x2, y2 = det['bbox']
+                    x1, y1, x2, y2 = (int(c * scale) for c in det['bbox'])
                     conf = det['confidence']
                     depth = det['depth_mean']
                     
                     # Draw bbox
-                    color = (0, 255, 0) if det['class'] == 0 else (0, 0, 255)
-                    cv2.rectangle(preview_img, (x1, y1), (x2, y2), color, 2)
+                    color = (0, 255, 0) if det['class'] == 0 else (255, 0, 0)
+                    cv2.rectangle(preview_rgb, (x1, y1), (x2, y2), color, 2)
                     
                     # Draw label with confidence and depth
                     if depth > 0:
@@ -599,18 +628,18 @@ class SVOPipelineScenario(BenchmarkScenario):
                     
                     # Label background
                     label_size, _ = cv2.getTextSize(label, cv2.FONT_HERSHEY_SIMPLEX, 0.5, 1)
-                    cv2.rectangle(preview_img, (x1, y1 - 20), (x1 + label_size[0], y1), color, -1)
-                    cv2.putText(preview_img, label, (x1, y1 - 5), 
+                    cv2.rectangle(preview_rgb, (x1, y1 - 20), (x1 + label_size[0], y1), color, -1)
+                    cv2.putText(preview_rgb, label, (x1, y1 - 5), 
                                cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
             
-            # Convert to RGB for Qt display
-            preview_rgb = cv2.cvtColor(preview_img, cv2.COLOR_BGR2RGB)
-            self.preview_callback(preview_rgb)
+            if self.preview_callback(preview_rgb) is not False:
+                self._preview_idx ^= 1
         
         self.frame_index += 1
         
         return {
             'detections': detections,
+            'depth_means': depth_means,
             'timings': timings,
             'frame_index': self.frame_index,
             'total_frames': self.total_frames,
@@ -1,30 +1,233 @@
 """YOLO Annotation Checker - Visual verification of bounding box annotations."""
 from __future__ import annotations
 
+import errno
+import functools
+import os
+import re
+import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 from PySide6 import QtCore, QtGui, QtWidgets
-from PIL import Image, ImageDraw
 
 # YOLO training folder structure
 DIRECTIONS = ["0_far", "1_S", "2_SE", "3_E", "4_NE", "5_N", "6_NW", "7_W", "8_SW"]
 POSITIONS = ["Bot", "Horizon", "Top"]
 DISTANCES = ["near", "mid", "far"]
 
+# Overlay color (RGB) and name per class id: target_close (0), target_far (1)
+CLASS_COLORS = ((0, 255, 0), (255, 0, 0))
+CLASS_NAMES = ("target_close", "target_far")
 
+# Index offsets rendered ahead of time (Left/Right step 1, Up/Down step 5)
+_PREFETCH_OFFSETS = (1, -1, 2, -2, 5, -5)
+
+# ZoomableLabel zoom limit; renders are capped at the label size times this so
+# full zoom stays sharp. Caps are rounded up to a step so small resizes reuse the cache
+_MAX_ZOOM = 5.0
+_RENDER_CAP_STEP = 256
+
+# Leading class id of YOLO label lines, per class (0 = target_close, 1 = target_far)
+_CLASS_ID_RES = {class_id: re.compile(rf"^{class_id}(?=\s)", re.MULTILINE) for class_id in (0, 1)}
+
+
+@dataclass(frozen=True, slots=True)
 class AnnotationPair:
-    """Pair of image and YOLO label file with bucket location."""
-    def __init__(self, image: Path, label: Optional[Path] = None, bucket_path: str = ""):
-        self.image = image
-        self.label = label if label and label.exists() else None
-        self.bucket_path = bucket_path  # e.g., "1_S/Bot/near"
+    """Pair of image and YOLO label file with bucket location.
+    
+    ``label`` is None when the image has no label file.
+    """
+    image: Path
+    label: Optional[Path] = None
+    bucket_path: str = ""  # e.g., "1_S/Bot/near"
+
+
+@functools.lru_cache(maxsize=1)
+def _overlay_fonts() -> Tuple[QtGui.QFont, QtGui.QFont]:
+    """Create the overlay fonts (label, bucket info) once, on first render.
+    
+    Created lazily because QFont needs the QApplication to exist.
+    """
+    font = QtGui.QFont("DejaVu Sans Mono")
+    font.setStyleHint(QtGui.QFont.Monospace)
+    font.setPixelSize(14)
+    font_small = QtGui.QFont(font)
+    font_small.setPixelSize(12)
+    return font, font_small
+
+
+def _count_jpgs(bucket_path: str) -> int:
+    """Count ``*.jpg`` files in a bucket directory (0 if it does not exist).
+    
+    Takes a plain string path so hot counting loops can build paths with
+    ``os.path.join`` instead of allocating intermediate ``Path`` objects.
+    """
+    try:
+        with os.scandir(bucket_path) as entries:
+            return sum(
+                1 for entry in entries
+                if entry.name.endswith(".jpg") and not entry.name.startswith(".")
+            )
+    except OSError:
+        return 0
+
+
+def _move_file(src: Path, dst: Path) -> None:
+    """Move a file, using a single atomic rename when src and dst share a filesystem."""
+    try:
+        os.replace(src, dst)
+    except OSError as exc:
+        if exc.errno != errno.EXDEV:
+            raise
+        shutil.move(str(src), str(dst))  # Cross-device: copy + delete
+
+
+def _read_yolo_labels(label_path: Path) -> np.ndarray:
+    """Parse a YOLO label file into an (N, 5) float32 array.
+    
+    Columns are class_id, x_center, y_center, width, height (normalized).
+    Lines that do not have exactly 5 fields are skipped.
+    """
+    # Labels are plain ASCII: split raw bytes, skipping the text decoding layer
+    rows = [parts for parts in (line.split() for line in label_path.read_bytes().splitlines())
+            if len(parts) == 5]
+    if not rows:
+        return np.empty((0, 5), dtype=np.float32)
+    # Bytes rows form an "S" array; numpy parses it to float in one cast
+    return np.array(rows).astype(np.float32)
+
+
+def _yolo_to_pixels(boxes: np.ndarray, width: int, height: int) -> np.ndarray:
+    """Convert (N, 5) YOLO rows to an (N, 4) int32 array of x1, y1, x2, y2 pixels."""
+    scale = np.array([width, height, width, height], dtype=np.float32)
+    xywh = boxes[:, 1:5] * scale
+    half_wh = xywh[:, 2:4] / 2
+    return np.concatenate(
+        (xywh[:, 0:2] - half_wh, xywh[:, 0:2] + half_wh), axis=1
+    ).astype(np.int32)
+
+
+def _render_annotated(
+    pair: AnnotationPair, max_size: Optional[Tuple[int, int]] = None
+) -> Tuple[QtGui.QImage, int]:
+    """Decode an image and draw its YOLO boxes with QPainter.
+    
+    If ``max_size`` is given, the image is decoded directly at a size that
+    fits it (the JPEG decoder scales during decode, so the full-resolution
+    frame is never materialized). Returns the QImage and the number of boxes
+    drawn. Painting on a QImage is safe from worker threads.
+    """
+    reader = QtGui.QImageReader(str(pair.image))
+    if max_size:
+        source_size = reader.size()
+        if source_size.isValid() and (
+            source_size.width() > max_size[0] or source_size.height() > max_size[1]
+        ):
+            reader.setScaledSize(source_size.scaled(max_size[0], max_size[1], QtCore.Qt.KeepAspectRatio))
+    image = reader.read()
+    if image.isNull():
+        raise IOError(f"Bild konnte nicht gelesen werden: {pair.image.name} ({reader.errorString()})")
+    img_width, img_height = image.width(), image.height()
+    num_boxes = 0
+    
+    # Draw bounding boxes if label exists
+    if pair.label:
+        boxes = _read_yolo_labels(pair.label)
+        num_boxes = len(boxes)
+        corners = _yolo_to_pixels(boxes, img_width, img_height)
+        class_ids = boxes[:, 0].astype(np.int32)
+        
+        if num_boxes:
+            # Grayscale JPEGs would swallow the colored overlay
+            if image.format() != QtGui.QImage.Format_RGB32:
+                image = image.convertToFormat(QtGui.QImage.Format_RGB32)
+            
+            font, font_small = _overlay_fonts()
+            metrics = QtGui.QFontMetrics(font)
+            metrics_small = QtGui.QFontMetrics(font_small)
+            
+            # Prepare bucket info text
+            bucket_info = pair.bucket_path  # e.g., "1_S/Bot/near" or "0_far"
+            bucket_width = metrics_small.horizontalAdvance(bucket_info)
+            text_height = metrics.height() + metrics_small.height() + 4
+            
+            # Per-class pens/colors built once per image; any id > 0 renders as target_far
+            colors = [QtGui.QColor(*rgb) for rgb in CLASS_COLORS]
+            pens = [QtGui.QPen(color, 3) for color in colors]
+            class_ids = np.minimum(class_ids, len(CLASS_NAMES) - 1)
+            
+            painter = QtGui.QPainter(image)
+            for cid, (x1, y1, x2, y2) in zip(class_ids.tolist(), corners.tolist()):
+                color = colors[cid]
+                class_name = CLASS_NAMES[cid]
+                
+                # Draw rectangle with thicker lines
+                painter.setPen(pens[cid])
+                painter.setBrush(QtCore.Qt.NoBrush)
+                painter.drawRect(x1, y1, x2 - x1, y2 - y1)
+                
+                # Position text above bbox (or below if too close to top)
+                text_y = max(2, y1 - 38) if y1 > 40 else y2 + 5
+                
+                # Draw black background for better readability
+                text_width = max(metrics.horizontalAdvance(class_name), bucket_width)
+                painter.fillRect(x1 - 2, text_y - 2, text_width + 6, text_height + 4, QtCore.Qt.black)
+                
+                # Draw class name (larger, colored)
+                painter.setFont(font)
+                painter.setPen(color)
+                painter.drawText(x1, text_y + metrics.ascent(), class_name)
+                
+                # Draw bucket info below class name (smaller, white)
+                painter.setFont(font_small)
+                painter.setPen(QtCore.Qt.white)
+                painter.drawText(x1, text_y + 18 + metrics_small.ascent(), bucket_info)
+            painter.end()
+    
+    return image, num_boxes
+
+
+class _RenderSignals(QtCore.QObject):
+    """Signal carrier for background render tasks (QRunnable cannot emit)."""
+    rendered = QtCore.Signal(str, QtGui.QImage, int)  # (cache key, annotated image, box count)
+    failed = QtCore.Signal(str, str)  # (cache key, error message)
+
+
+class _ImageLoader(QtCore.QRunnable):
+    """Decode and annotate an image on the thread pool.
+    
+    The QImage is handed back to the GUI thread, where it is turned into a
+    QPixmap (pixmaps may only be created on the GUI thread).
+    """
+    
+    def __init__(self, pair: AnnotationPair, signals: _RenderSignals,
+                 max_size: Optional[Tuple[int, int]] = None, key: Optional[str] = None):
+        super().__init__()
+        self.pair = pair
+        self.signals = signals
+        self.max_size = max_size
+        self.key = key if key is not None else str(pair.image)
+    
+    def run(self) -> None:
+        key = self.key
+        try:
+            image, num_boxes = _render_annotated(self.pair, self.max_size)
+        except Exception as exc:
+            self.signals.failed.emit(key, str(exc))
+            return
+        self.signals.rendered.emit(key, image, num_boxes)
 
 
 class ZoomableLabel(QtWidgets.QLabel):
     """Label widget with zoom and pan support."""
     
+    resized = QtCore.Signal()
+    
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._pixmap: Optional[QtGui.QPixmap] = None
@@ -60,7 +263,7 @@ class ZoomableLabel(QtWidgets.QLabel):
         
         # Zoom in/out with mouse wheel
         if angle > 0:
-            new_zoom = min(self._zoom * 1.2, 5.0)  # Max 5x zoom
+            new_zoom = min(self._zoom * 1.2, _MAX_ZOOM)  # Max 5x zoom
         else:
             new_zoom = max(self._zoom / 1.2, 1.0)  # Min 1x zoom
         
@@ -171,9 +374,22 @@ class ZoomableLabel(QtWidgets.QLabel):
             self._panning = False
             self.setCursor(QtCore.Qt.OpenHandCursor if self._zoom > 1.0 else QtCore.Qt.ArrowCursor)
     
+    def resizeEvent(self, event: QtGui.QResizeEvent) -> None:
+        """Let the owner re-render at a larger size if needed."""
+        super().resizeEvent(event)
+        self.resized.emit()
+    
+    def showEvent(self, event: QtGui.QShowEvent) -> None:
+        """Render a pixmap that was set while the label was hidden."""
+        super().showEvent(event)
+        self._update_display()
+    
     def _update_display(self) -> None:
         """Update the displayed image with current zoom and pan."""
-        if self._pixmap is None:
+        if self._pixmap is None or self._pixmap.isNull():
+            return
+        # Skip degenerate sizes (startup, collapsed splitters) to avoid relayout storms
+        if not self.isVisible() or self.width() < 4 or self.height() < 4:
             return
         
         if self._zoom == 1.0:
@@ -216,6 +432,23 @@ class BarChartWidget(QtWidgets.QWidget):
     
     bar_clicked = QtCore.Signal(str)  # Emitted when a bar is clicked (label)
     
+    # Shared paint resources (colors are safe at import time, fonts need a QGuiApplication)
+    _COLOR_SEL = QtGui.QColor(76, 175, 80)  # Green when selected
+    _COLOR_BAR = QtGui.QColor(33, 150, 243)  # Blue
+    _COLOR_AXIS = QtGui.QColor(100, 100, 100)
+    _COLOR_GRID = QtGui.QColor(200, 200, 200, 100)
+    _TITLE_FONT: Optional[QtGui.QFont] = None
+    _VALUE_FONT: Optional[QtGui.QFont] = None
+    _LABEL_FONT: Optional[QtGui.QFont] = None
+    
+    @classmethod
+    def _init_fonts(cls) -> None:
+        """Create the shared fonts once, after the QApplication exists."""
+        if cls._TITLE_FONT is None:
+            cls._TITLE_FONT = QtGui.QFont("Arial", 14, QtGui.QFont.Bold)
+            cls._VALUE_FONT = QtGui.QFont("Arial", 10, QtGui.QFont.Bold)
+            cls._LABEL_FONT = QtGui.QFont("Arial", 9)
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.data: List[Tuple[str, int]] = []  # [(label, value), ...]
@@ -223,21 +456,50 @@ class BarChartWidget(QtWidgets.QWidget):
         self.selected_bar: Optional[int] = None
         self.setMinimumHeight(300)
         self.setCursor(QtCore.Qt.PointingHandCursor)
+        self._init_fonts()
+        
+        # Cached chart recording, rebuilt only when data or size change
+        self._picture = QtGui.QPicture()
+        self._bar_rects: List[QtCore.QRectF] = []
+        self._dirty: bool = True
     
     def set_data(self, data: List[Tuple[str, int]], title: str = "") -> None:
         """Set chart data and title."""
         self.data = data
         self.title = title
         self.selected_bar = None
+        self._dirty = True
         self.update()
     
+    def resizeEvent(self, event: QtGui.QResizeEvent) -> None:
+        """Invalidate the cached chart when the widget size changes."""
+        self._dirty = True
+        super().resizeEvent(event)
+    
     def paintEvent(self, event: QtGui.QPaintEvent) -> None:
-        """Draw the bar chart."""
+        """Replay the cached chart and draw the selection on top."""
         if not self.data:
             return
         
+        if self._dirty:
+            self._rebuild_picture()
+            self._dirty = False
+        
         painter = QtGui.QPainter(self)
-        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+        painter.drawPicture(0, 0, self._picture)
+        
+        # Selection overlay: recolor the selected bar without re-recording the chart
+        if self.selected_bar is not None and self.selected_bar < len(self._bar_rects):
+            painter.fillRect(self._bar_rects[self.selected_bar], self._COLOR_SEL)
+    
+    def _rebuild_picture(self) -> None:
+        """Record the bar chart into a QPicture for cheap repaints."""
+        self._picture = QtGui.QPicture()
+        self._bar_rects = []
+        painter = QtGui.QPainter(self._picture)
+        # Bars, axes and grid are pixel-aligned: no AA needed, only keep text smooth
+        painter.setRenderHint(QtGui.QPainter.Antialiasing, False)
+        painter.setRenderHint(QtGui.QPainter.TextAntialiasing, True)
         
         width = self.width()
         height = self.height()
@@ -252,11 +514,12 @@ class BarChartWidget(QtWidgets.QWidget):
         chart_height = height - margin_top - margin_bottom
         
         if chart_width <= 0 or chart_height <= 0:
+            painter.end()
             return
         
         # Draw title
         if self.title:
-            painter.setFont(QtGui.QFont("Arial", 14, QtGui.QFont.Bold))
+            painter.setFont(self._TITLE_FONT)
             painter.drawText(QtCore.QRect(0, 10, width, 40), QtCore.Qt.AlignCenter, self.title)
         
         # Find max value
@@ -270,38 +533,38 @@ class BarChartWidget(QtWidgets.QWidget):
         spacing = (chart_width / num_bars) * 0.3 / 2  # Remaining space split
         
         # Draw bars
+        painter.setBrush(self._COLOR_BAR)
+        painter.setFont(self._VALUE_FONT)
         for i, (label, value) in enumerate(self.data):
             bar_height = (value / max_value) * chart_height
             x = margin_left + i * (chart_width / num_bars) + spacing
             y = margin_top + chart_height - bar_height
             
-            # Choose color
-            if self.selected_bar == i:
-                color = QtGui.QColor(76, 175, 80)  # Green when selected
-            else:
-                color = QtGui.QColor(33, 150, 243)  # Blue
-            
-            # Draw bar
-            painter.setBrush(color)
+            # Draw bar (selection is drawn as an overlay in paintEvent)
+            bar_rect = QtCore.QRectF(x, y, bar_width, bar_height)
+            self._bar_rects.append(bar_rect)
             painter.setPen(QtCore.Qt.NoPen)
-            painter.drawRect(QtCore.QRectF(x, y, bar_width, bar_height))
+            painter.drawRect(bar_rect)
             
             # Draw value on top of bar
             painter.setPen(QtCore.Qt.black)
-            painter.setFont(QtGui.QFont("Arial", 10, QtGui.QFont.Bold))
             value_rect = QtCore.QRectF(x, y - 25, bar_width, 20)
             painter.drawText(value_rect, QtCore.Qt.AlignCenter, str(value))
-            
-            # Draw label below bar
-            painter.save()
-            painter.translate(x + bar_width / 2, height - margin_bottom + 10)
-            painter.rotate(45)
-            painter.setFont(QtGui.QFont("Arial", 9))
+        
+        # Draw labels below bars (rotated 45°, set transform directly instead of save/restore)
+        painter.setFont(self._LABEL_FONT)
+        painter.setRenderHint(QtGui.QPainter.Antialiasing, True)  # Rotated text benefits from AA
+        for bar_rect, (label, _) in zip(self._bar_rects, self.data):
+            transform = QtGui.QTransform()
+            transform.translate(bar_rect.center().x(), height - margin_bottom + 10)
+            transform.rotate(45)
+            painter.setTransform(transform)
             painter.drawText(0, 0, label)
-            painter.restore()
+        painter.resetTransform()
+        painter.setRenderHint(QtGui.QPainter.Antialiasing, False)
         
         # Draw Y-axis
-        painter.setPen(QtGui.QColor(100, 100, 100))
+        painter.setPen(self._COLOR_AXIS)
         painter.drawLine(margin_left, margin_top, margin_left, margin_top + chart_height)
         
         # Draw X-axis
@@ -309,16 +572,18 @@ class BarChartWidget(QtWidgets.QWidget):
                         margin_left + chart_width, margin_top + chart_height)
         
         # Draw Y-axis labels
-        painter.setFont(QtGui.QFont("Arial", 9))
+        painter.setFont(self._LABEL_FONT)
         for i in range(6):  # 0, 20%, 40%, 60%, 80%, 100%
             val = int(max_value * i / 5)
             y_pos = margin_top + chart_height - (chart_height * i / 5)
             painter.drawText(QtCore.QRectF(0, y_pos - 10, margin_left - 10, 20), 
                            QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter, str(val))
             # Draw grid line
-            painter.setPen(QtGui.QColor(200, 200, 200, 100))
+            painter.setPen(self._COLOR_GRID)
             painter.drawLine(margin_left, int(y_pos), margin_left + chart_width, int(y_pos))
-            painter.setPen(QtGui.QColor(100, 100, 100))
+            painter.setPen(self._COLOR_AXIS)
+        
+        painter.end()
     
     def mousePressEvent(self, event: QtGui.QMouseEvent) -> None:
         """Handle bar clicks."""
@@ -436,12 +701,10 @@ class StatisticsDialog(QtWidgets.QDialog):
         # Aggregate distances across all positions
         distance_totals = {dist: 0 for dist in DISTANCES}
         
+        root_str = str(self.training_root)
         for pos in POSITIONS:
             for dist in DISTANCES:
-                bucket_path = self.training_root / direction / pos / dist
-                if bucket_path.exists():
-                    count = len(list(bucket_path.glob("*.jpg")))
-                    distance_totals[dist] += count
+                distance_totals[dist] += _count_jpgs(os.path.join(root_str, direction, pos, dist))
         
         data = [(dist, count) for dist, count in distance_totals.items() if count > 0]
         total = sum(count for _, count in data)
@@ -451,27 +714,22 @@ class StatisticsDialog(QtWidgets.QDialog):
     
     def _count_direction(self, direction: str) -> int:
         """Count total images in a direction."""
-        total = 0
+        root_str = str(self.training_root)
         if direction == "0_far":
-            bucket_path = self.training_root / direction
-            if bucket_path.exists():
-                total = len(list(bucket_path.glob("*.jpg")))
-        else:
-            for pos in POSITIONS:
-                for dist in DISTANCES:
-                    bucket_path = self.training_root / direction / pos / dist
-                    if bucket_path.exists():
-                        total += len(list(bucket_path.glob("*.jpg")))
+            return _count_jpgs(os.path.join(root_str, direction))
+        total = 0
+        for pos in POSITIONS:
+            for dist in DISTANCES:
+                total += _count_jpgs(os.path.join(root_str, direction, pos, dist))
         return total
     
     def _count_position(self, direction: str, position: str) -> int:
         """Count total images in a direction/position combination."""
-        total = 0
-        for dist in DISTANCES:
-            bucket_path = self.training_root / direction / position / dist
-            if bucket_path.exists():
-                total += len(list(bucket_path.glob("*.jpg")))
-        return total
+        root_str = str(self.training_root)
+        return sum(
+            _count_jpgs(os.path.join(root_str, direction, position, dist))
+            for dist in DISTANCES
+        )
     
     def _on_bar_clicked(self, label: str) -> None:
         """Handle bar click for drill-down."""
@@ -505,7 +763,29 @@ class CheckerWindow(QtWidgets.QMainWindow):
         self.view_mode: str = "all"  # "all" = all in direction, "specific" = specific bucket
         self.pairs: List[AnnotationPair] = []
         self.current_index: int = 0
+        # Bucket relative path -> start index in self.pairs / number of images
+        self._bucket_offset: Dict[str, int] = {}
+        self._bucket_size: Dict[str, int] = {}
         self._bucket_stats: dict = {}  # Statistics for current direction
+        # Sorted annotation pairs per bucket dir, reused while the dir mtime is unchanged
+        self._bucket_cache: Dict[Path, Tuple[int, List[AnnotationPair]]] = {}
+        self._scan_pool = ThreadPoolExecutor(max_workers=16, thread_name_prefix="bucket-scan")
+        
+        # Annotated pixmaps are cached by image path + render cap (see _cache_key)
+        # and rendered on the thread pool
+        QtGui.QPixmapCache.setCacheLimit(512 * 1024)  # KB -> 512 MB
+        self._render_signals = _RenderSignals()
+        self._render_signals.rendered.connect(self._on_rendered)
+        self._render_signals.failed.connect(self._on_render_failed)
+        self._render_pending: set = set()
+        self._box_counts: dict = {}  # Cache key -> number of boxes, filled by the renderer
+        self._display_key: Optional[str] = None  # Cache key the label should currently show
+        self._render_cap: Tuple[int, int] = (0, 0)  # Max render size, only ever grows
+        # Re-render the current image once a resize that grows the cap settles
+        self._resize_debounce = QtCore.QTimer(self)
+        self._resize_debounce.setSingleShot(True)
+        self._resize_debounce.setInterval(150)
+        self._resize_debounce.timeout.connect(self._on_label_resized)
         
         self._init_ui()
         
@@ -589,6 +869,7 @@ class CheckerWindow(QtWidgets.QMainWindow):
         self.image_label.setAlignment(QtCore.Qt.AlignCenter)
         self.image_label.setMinimumSize(800, 600)
         self.image_label.setStyleSheet("border: 2px solid #333; background-color: #1e1e1e;")
+        self.image_label.resized.connect(self._resize_debounce.start)
         scroll = QtWidgets.QScrollArea()
         scroll.setWidget(self.image_label)
         scroll.setWidgetResizable(True)
@@ -715,22 +996,21 @@ class CheckerWindow(QtWidgets.QMainWindow):
         direction = self.current_direction
         total = 0
         
+        root_str = str(self.training_root)
+        
         if direction == "0_far":
             # Just one folder
-            bucket_path = self.training_root / direction
-            if bucket_path.exists():
-                count = len(list(bucket_path.glob("*.jpg")))
+            count = _count_jpgs(os.path.join(root_str, direction))
+            if count:
                 self._bucket_stats["0_far"] = count
                 total = count
         else:
             # Iterate through all position/distance combinations
             for pos in POSITIONS:
                 for dist in DISTANCES:
-                    bucket_path = self.training_root / direction / pos / dist
-                    if bucket_path.exists():
-                        count = len(list(bucket_path.glob("*.jpg")))
-                        key = f"{pos}/{dist}"
-                        self._bucket_stats[key] = count
+                    count = _count_jpgs(os.path.join(root_str, direction, pos, dist))
+                    if count:
+                        self._bucket_stats[f"{pos}/{dist}"] = count
                         total += count
         
         # Update stats label
@@ -750,35 +1030,36 @@ class CheckerWindow(QtWidgets.QMainWindow):
             return
             
         self.pairs = []
+        self._bucket_offset.clear()
+        self._bucket_size.clear()
         direction = self.current_direction
         
-        if self.view_mode == "all":
-            # Load all images from this direction
-            if direction == "0_far":
-                bucket_path = self.training_root / direction
-                if bucket_path.exists():
-                    self._load_from_bucket(bucket_path, direction)
-            else:
-                # Load from all position/distance combinations in order
-                for pos in POSITIONS:
-                    for dist in DISTANCES:
-                        bucket_path = self.training_root / direction / pos / dist
-                        if bucket_path.exists():
-                            rel_path = f"{direction}/{pos}/{dist}"
-                            self._load_from_bucket(bucket_path, rel_path)
+        # Collect (bucket_path, relative_path) in display order first
+        buckets: List[Tuple[Path, str]] = []
+        if direction == "0_far":
+            buckets.append((self.training_root / direction, direction))
+        elif self.view_mode == "all":
+            # Load from all position/distance combinations in order
+            for pos in POSITIONS:
+                for dist in DISTANCES:
+                    buckets.append((self.training_root / direction / pos / dist, f"{direction}/{pos}/{dist}"))
         else:
             # Load from specific bucket only
-            if direction == "0_far":
-                bucket_path = self.training_root / direction
-                if bucket_path.exists():
-                    self._load_from_bucket(bucket_path, direction)
-            else:
-                position = self.position_combo.currentText()
-                distance = self.distance_combo.currentText()
-                bucket_path = self.training_root / direction / position / distance
-                rel_path = f"{direction}/{position}/{distance}"
-                if bucket_path.exists():
-                    self._load_from_bucket(bucket_path, rel_path)
+            position = self.position_combo.currentText()
+            distance = self.distance_combo.currentText()
+            buckets.append((self.training_root / direction / position / distance,
+                            f"{direction}/{position}/{distance}"))
+        
+        # Scan buckets concurrently (directory syscalls release the GIL);
+        # map() yields results in submission order, preserving the traversal order
+        if len(buckets) == 1:
+            results = [self._scan_bucket(*buckets[0])]
+        else:
+            results = self._scan_pool.map(lambda bucket: self._scan_bucket(*bucket), buckets)
+        for (_, rel_path), bucket_pairs in zip(buckets, results):
+            self._bucket_offset[rel_path] = len(self.pairs)
+            self._bucket_size[rel_path] = len(bucket_pairs)
+            self.pairs.extend(bucket_pairs)
                     
         self.current_index = 0
         self._update_display()
@@ -786,12 +1067,30 @@ class CheckerWindow(QtWidgets.QMainWindow):
         # Update reclassify button state based on loaded images
         self.reclassify_btn.setEnabled(len(self.pairs) > 0)
         
-    def _load_from_bucket(self, bucket_path: Path, relative_path: str) -> None:
-        """Load all images from a specific bucket."""
-        images = sorted(bucket_path.glob("*.jpg"))
-        for img in images:
-            label = img.with_suffix(".txt")
-            self.pairs.append(AnnotationPair(img, label, relative_path))
+    def _scan_bucket(self, bucket_path: Path, relative_path: str) -> List[AnnotationPair]:
+        """Return annotation pairs for all images in a bucket (thread-safe)."""
+        try:
+            mtime_ns = bucket_path.stat().st_mtime_ns
+            cached = self._bucket_cache.get(bucket_path)
+            if cached is not None and cached[0] == mtime_ns:
+                return cached[1]
+            # One readdir pass; label existence comes from the same listing, no per-image stat
+            with os.scandir(bucket_path) as it:
+                names = [e.name for e in it if not e.name.startswith(".")]
+        except FileNotFoundError:
+            return []
+        label_names = {name for name in names if name.endswith(".txt")}
+        pairs = []
+        for name in sorted(name for name in names if name.endswith(".jpg")):
+            label_name = name[:-4] + ".txt"
+            pairs.append(AnnotationPair(
+                bucket_path / name,
+                bucket_path / label_name if label_name in label_names else None,
+                relative_path,
+            ))
+        # Pairs are immutable, so the cached list can be shared across reloads
+        self._bucket_cache[bucket_path] = (mtime_ns, pairs)
+        return pairs
         
     def _navigate(self, delta: int) -> None:
         """Navigate through images with auto-advance across buckets in 'all' mode."""
@@ -810,6 +1109,7 @@ class CheckerWindow(QtWidgets.QMainWindow):
     def _update_display(self) -> None:
         """Update image display with annotations overlay."""
         if not self.pairs:
+            self._display_key = None
             self.image_label.setText("Keine Bilder geladen")
             self.index_label.setText("0 / 0")
             self.location_label.setText("")
@@ -822,136 +1122,98 @@ class CheckerWindow(QtWidgets.QMainWindow):
         
         # Update index label with bucket-specific info
         if self.view_mode == "all":
-            # Show global position and current bucket info
-            # Count images in current bucket for context
-            current_bucket_images = [p for p in self.pairs if p.bucket_path == pair.bucket_path]
-            bucket_index = current_bucket_images.index(pair) + 1 if pair in current_bucket_images else 0
+            # Show global position and current bucket info (O(1) via precomputed offsets)
+            bucket_index = self.current_index - self._bucket_offset[pair.bucket_path] + 1
             self.index_label.setText(
                 f"Gesamt: {self.current_index + 1} / {len(self.pairs)} | "
-                f"Bucket: {bucket_index} / {len(current_bucket_images)}"
+                f"Bucket: {bucket_index} / {self._bucket_size[pair.bucket_path]}"
             )
         else:
             # Just show position in current bucket
             self.index_label.setText(f"{self.current_index + 1} / {len(self.pairs)}")
         
-        # Load and display image with annotations
-        try:
-            img = Image.open(pair.image)
-            img_width, img_height = img.size
-            
-            # Draw bounding boxes if label exists
-            if pair.label:
-                draw = ImageDraw.Draw(img)
-                
-                # Try to load a font for better text rendering
-                try:
-                    from PIL import ImageFont
-                    # Use a monospace font if available, fallback to default
-                    try:
-                        font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf", 14)
-                        font_small = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf", 12)
-                    except (OSError, IOError):
-                        font = ImageFont.load_default()
-                        font_small = font
-                except ImportError:
-                    font = None
-                    font_small = None
-                
-                with open(pair.label, "r") as f:
-                    for line in f:
-                        parts = line.strip().split()
-                        if len(parts) != 5:
-                            continue
-                            
-                        class_id, x_center, y_center, width, height = map(float, parts)
-                        
-                        # Convert YOLO normalized coordinates to pixel coordinates
-                        x_center_px = x_center * img_width
-                        y_center_px = y_center * img_height
-                        w_px = width * img_width
-                        h_px = height * img_height
-                        
-                        x1 = int(x_center_px - w_px / 2)
-                        y1 = int(y_center_px - h_px / 2)
-                        x2 = int(x_center_px + w_px / 2)
-                        y2 = int(y_center_px + h_px / 2)
-                        
-                        # Color based on class: target_close (0) = green, target_far (1) = red
-                        color = (0, 255, 0) if int(class_id) == 0 else (255, 0, 0)
-                        
-                        # Draw rectangle with thicker lines
-                        draw.rectangle([x1, y1, x2, y2], outline=color, width=3)
-                        
-                        # Draw class label
-                        class_name = "target_close" if int(class_id) == 0 else "target_far"
-                        
-                        # Prepare bucket info text
-                        bucket_info = pair.bucket_path  # e.g., "1_S/Bot/near" or "0_far"
-                        
-                        # Position text above bbox (or below if too close to top)
-                        text_y = max(2, y1 - 38) if y1 > 40 else y2 + 5
-                        
-                        # Draw text background for better readability
-                        if font:
-                            # Measure text size
-                            bbox_class = draw.textbbox((0, 0), class_name, font=font)
-                            bbox_bucket = draw.textbbox((0, 0), bucket_info, font=font_small)
-                            text_width = max(bbox_class[2] - bbox_class[0], bbox_bucket[2] - bbox_bucket[0])
-                            text_height = (bbox_class[3] - bbox_class[1]) + (bbox_bucket[3] - bbox_bucket[1]) + 4
-                        else:
-                            # Estimate text size for default font
-                            text_width = max(len(class_name) * 8, len(bucket_info) * 7)
-                            text_height = 32
-                        
-                        # Draw semi-transparent background
-                        bg_x1 = x1 - 2
-                        bg_y1 = text_y - 2
-                        bg_x2 = x1 + text_width + 4
-                        bg_y2 = text_y + text_height + 2
-                        
-                        # Draw black background with some transparency (PIL doesn't support alpha well, so use solid)
-                        draw.rectangle([bg_x1, bg_y1, bg_x2, bg_y2], fill=(0, 0, 0))
-                        
-                        # Draw class name (larger, colored)
-                        draw.text((x1, text_y), class_name, fill=color, font=font)
-                        
-                        # Draw bucket info below class name (smaller, white)
-                        bucket_y = text_y + (18 if font else 16)
-                        draw.text((x1, bucket_y), bucket_info, fill=(255, 255, 255), font=font_small)
+        # Show annotated image from cache, otherwise render it in the background
+        self._update_render_cap()
+        self._display_key = self._cache_key(pair.image)
+        pixmap = QtGui.QPixmap()
+        if QtGui.QPixmapCache.find(self._display_key, pixmap) and self._display_key in self._box_counts:
+            self.image_label.setPixmap(pixmap)
+            self._update_status(pair, self._box_counts[self._display_key])
+        else:
+            self.status_label.setText(f"{pair.image.name} - Lade...")
+            self._load_pixmap_async(pair)
+        # Queue prefetching after this event so the current image goes first
+        QtCore.QTimer.singleShot(0, self._prefetch_neighbours)
             
-            # Convert PIL Image to QPixmap
-            img_rgb = img.convert("RGB")
-            data = img_rgb.tobytes("raw", "RGB")
-            qimage = QtGui.QImage(
-                data, 
-                img_width, 
-                img_height, 
-                img_width * 3, 
-                QtGui.QImage.Format_RGB888
+    def _update_status(self, pair: AnnotationPair, num_boxes: int) -> None:
+        """Show file name and annotation count (counted by the renderer, no extra read)."""
+        if pair.label:
+            self.status_label.setText(
+                f"{pair.image.name} - {num_boxes} Annotation(en) | "
+                f"Scroll zum Zoomen, Drag zum Verschieben"
             )
-            pixmap = QtGui.QPixmap.fromImage(qimage)
-            
-            # Use zoomable label
+        else:
+            self.status_label.setText(
+                f"{pair.image.name} - Keine Annotation! | "
+                f"Scroll zum Zoomen, Drag zum Verschieben"
+            )
+    
+    def _update_render_cap(self) -> bool:
+        """Grow the render cap to the label size times the zoom limit; True if it grew."""
+        size = self.image_label.size()
+        step = _RENDER_CAP_STEP
+        cap = tuple(max(step, -(-int(v * _MAX_ZOOM) // step) * step)
+                    for v in (size.width(), size.height()))
+        cap = (max(cap[0], self._render_cap[0]), max(cap[1], self._render_cap[1]))
+        grew = cap != self._render_cap
+        self._render_cap = cap
+        return grew
+    
+    def _cache_key(self, image: Path) -> str:
+        """QPixmapCache key of ``image`` rendered at the current render cap."""
+        return f"{image}@{self._render_cap[0]}x{self._render_cap[1]}"
+    
+    def _on_label_resized(self) -> None:
+        """Re-render the current image if the label outgrew the cached renders."""
+        if self._update_render_cap() and self.pairs:
+            self._update_display()
+    
+    def _load_pixmap_async(self, pair: AnnotationPair) -> None:
+        """Queue decode + annotation of a pair on the thread pool (once per image and cap)."""
+        key = self._cache_key(pair.image)
+        if key in self._render_pending:
+            return
+        self._render_pending.add(key)
+        QtCore.QThreadPool.globalInstance().start(
+            _ImageLoader(pair, self._render_signals, self._render_cap, key))
+    
+    def _prefetch_neighbours(self) -> None:
+        """Render the images reachable by the next keypress (±1, ±5) in the background."""
+        for offset in _PREFETCH_OFFSETS:
+            index = self.current_index + offset
+            if not 0 <= index < len(self.pairs):
+                continue
+            pair = self.pairs[index]
+            if not QtGui.QPixmapCache.find(self._cache_key(pair.image), QtGui.QPixmap()):
+                self._load_pixmap_async(pair)
+    
+    def _on_rendered(self, key: str, image: QtGui.QImage, num_boxes: int) -> None:
+        """Cache a background-rendered image and show it if it is still current."""
+        self._render_pending.discard(key)
+        pixmap = QtGui.QPixmap.fromImage(image)
+        QtGui.QPixmapCache.insert(key, pixmap)
+        self._box_counts[key] = num_boxes
+        if key == self._display_key:
             self.image_label.setPixmap(pixmap)
-            
-            # Update status with label info
-            if pair.label:
-                with open(pair.label, "r") as f:
-                    num_boxes = sum(1 for _ in f)
-                self.status_label.setText(
-                    f"{pair.image.name} - {num_boxes} Annotation(en) | "
-                    f"Scroll zum Zoomen, Drag zum Verschieben"
-                )
-            else:
-                self.status_label.setText(
-                    f"{pair.image.name} - Keine Annotation! | "
-                    f"Scroll zum Zoomen, Drag zum Verschieben"
-                )
-                
-        except Exception as exc:
-            self.image_label.setText(f"Fehler beim Laden: {exc}")
-            self.status_label.setText(f"Fehler: {exc}")
-            
+            self._update_status(self.pairs[self.current_index], num_boxes)
+    
+    def _on_render_failed(self, key: str, message: str) -> None:
+        """Report a failed background render for the current image."""
+        self._render_pending.discard(key)
+        if key == self._display_key:
+            self.image_label.setText(f"Fehler beim Laden: {message}")
+            self.status_label.setText(f"Fehler: {message}")
+    
     def keyPressEvent(self, event: QtGui.QKeyEvent) -> None:
         """Handle keyboard shortcuts."""
         if event.key() == QtCore.Qt.Key_Left:
@@ -1070,32 +1332,32 @@ class CheckerWindow(QtWidgets.QMainWindow):
                     target_label.unlink()
             
             # Move image
-            import shutil
-            shutil.move(str(pair.image), str(target_img))
+            _move_file(pair.image, target_img)
+            for key in (self._cache_key(pair.image), self._cache_key(target_img)):
+                QtGui.QPixmapCache.remove(key)
+                self._box_counts.pop(key, None)
+            # mtime granularity may hide the change, so drop both bucket listings explicitly
+            self._bucket_cache.pop(pair.image.parent, None)
+            self._bucket_cache.pop(target_dir, None)
             
             # Move/update label if it exists
             if pair.label and pair.label.exists():
                 target_label = target_img.with_suffix(".txt")
                 
-                # Update class ID if moving between target_close (0) and target_far (1)
-                old_class = 0 if new_direction != "0_far" else 1
+                # Update class ID if moving between target_close (0) and target_far (1):
+                # the current class follows the source bucket, the new one the target
+                old_class = 1 if pair.bucket_path.split("/")[0] == "0_far" else 0
                 new_class = 1 if new_direction == "0_far" else 0
                 
                 if old_class != new_class:
-                    # Update class ID in label
-                    with open(pair.label, 'r') as f:
-                        lines = f.readlines()
-                    with open(target_label, 'w') as f:
-                        for line in lines:
-                            parts = line.strip().split()
-                            if parts:
-                                parts[0] = str(new_class)
-                                f.write(" ".join(parts) + "\n")
+                    # Relabel only old_class lines, with one regex pass over the whole file
+                    text = pair.label.read_text()
+                    target_label.write_text(_CLASS_ID_RES[old_class].sub(str(new_class), text))
                     # Delete old label
                     pair.label.unlink()
                 else:
                     # Just move the label
-                    shutil.move(str(pair.label), str(target_label))
+                    _move_file(pair.label, target_label)
             
             return True
             
@@ -1,4 +1,6 @@
 """Shared configuration defaults for the SVO2 Handler."""
+import functools
+import os
 from pathlib import Path
 from typing import List
 
@@ -9,16 +11,31 @@ CANDIDATE_OUTPUT_BASES: List[Path] = [
 ]
 
 
+@functools.lru_cache(maxsize=1)
 def pick_default_output_root() -> Path:
-    """Return the default export root based on existing mount points."""
+    """Return the default export root based on existing mount points.
+
+    ``SVO_OUTPUT_ROOT`` overrides the probe. The result is memoized so the
+    candidate mounts (which may sit behind autofs) are checked only once.
+    """
+    env_root = os.getenv("SVO_OUTPUT_ROOT")
+    if env_root:
+        return Path(env_root)
     for base in CANDIDATE_OUTPUT_BASES:
-        if base.exists():
-            return base / "SVO2_Frame_Export"
+        try:
+            if base.is_dir():
+                return base / "SVO2_Frame_Export"
+        except OSError:
+            continue
     return CANDIDATE_OUTPUT_BASES[0] / "SVO2_Frame_Export"
 
 
-# Default export root on the USB stick
-DEFAULT_OUTPUT_ROOT = pick_default_output_root()
+def __getattr__(name: str):
+    # Default export root on the USB stick, resolved on first access (not at import)
+    if name == "DEFAULT_OUTPUT_ROOT":
+        return pick_default_output_root()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # Supported stream labels for clarity across UI and manifests
 STREAM_LEFT = "left"
@@ -38,5 +55,9 @@ DEPTH_MODES = [
 ]
 DEFAULT_DEPTH_MODE = "NEURAL_PLUS"
 
+# Storage type of exported depth maps: meters as float32/float16, or millimetres as uint16
+DEPTH_DTYPES = ["float32", "float16", "uint16_mm"]
+DEFAULT_DEPTH_DTYPE = "float32"
+
 # Default training root (can be overridden in UI; persisted)
 DEFAULT_TRAINING_ROOT = "/media/angelo/DRONE_DATA1/YoloTrainingV1"
@@ -1,18 +1,20 @@
 """Helpers for deriving deterministic export paths for frame extraction."""
+import os
 from pathlib import Path
 from typing import Optional
 
-from .config import DEFAULT_OUTPUT_ROOT
+from .config import pick_default_output_root
 
 
 class OutputPathError(Exception):
     """Raised when the export output location is not writable or cannot be created."""
 
 
-def derive_export_dir(svo_path: Path, output_root: Path = DEFAULT_OUTPUT_ROOT) -> Path:
+def derive_export_dir(svo_path: Path, output_root: Optional[Path] = None) -> Path:
     """Build the export directory based on source folder and file name.
 
-    Pattern: output_root/<source_parent>_RAW_<svo_stem>/
+    Pattern: output_root/<source_parent>_RAW_<svo_stem>/ (output_root defaults to
+    pick_default_output_root()).
     Example: /media/angelo/DRONE_DATA/flight_20251027_132504/video.svo2
              -> /media/angelo/DRONE_DATA/SVO2_Frame_Export/flight_20251027_132504_RAW_video
     """
@@ -22,6 +24,8 @@ def derive_export_dir(svo_path: Path, output_root: Path = DEFAULT_OUTPUT_ROOT) -
     parent_name = svo_path.parent.name or "export"
     stem = svo_path.stem
     export_dir_name = f"{parent_name}_RAW_{stem}"
+    if output_root is None:
+        output_root = pick_default_output_root()
     return output_root / export_dir_name
 
 
@@ -38,6 +42,15 @@ def ensure_output_root_writable(output_root: Path) -> None:
             f"Export-Pfad {output_root} existiert nicht (Medium nicht gemountet?)."
         ) from exc
 
+    # Anonymous O_TMPFILE probe: no visible dirent, no create/unlink round trip
+    o_tmpfile = getattr(os, "O_TMPFILE", None)
+    if o_tmpfile is not None:
+        try:
+            os.close(os.open(output_root, os.O_WRONLY | o_tmpfile, 0o600))
+            return
+        except OSError:
+            pass  # Not supported here (tmpfs/NFS/FUSE) or denied; fall back below
+
     test_file = output_root / ".write_test"
     try:
         test_file.write_text("ok", encoding="utf-8")
@@ -50,11 +63,19 @@ def ensure_output_root_writable(output_root: Path) -> None:
 
 def latest_frame_in_dir(export_dir: Path) -> Optional[Path]:
     """Return the most recently modified frame file (jpg/png) in the export dir."""
-    if not export_dir.exists() or not export_dir.is_dir():
-        return None
-
-    candidates = list(export_dir.glob("*.jpg")) + list(export_dir.glob("*.png"))
-    if not candidates:
+    # Single directory walk; no intermediate candidate list
+    best: Optional[Path] = None
+    best_mtime = -1.0
+    try:
+        with os.scandir(export_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if not (name.endswith(".jpg") or name.endswith(".png")) or name.startswith("."):
+                    continue
+                mtime = entry.stat().st_mtime
+                if mtime > best_mtime:
+                    best_mtime = mtime
+                    best = Path(entry.path)
+    except (FileNotFoundError, NotADirectoryError):
         return None
-
-    return max(candidates, key=lambda p: p.stat().st_mtime)
+    return best
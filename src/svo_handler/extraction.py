@@ -2,21 +2,72 @@
 from __future__ import annotations
 
 import json
+import os
+import queue
 import shutil
 import subprocess
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Deque, Dict, List, Optional, Tuple
 
 import cv2
 import numpy as np
 from PySide6 import QtCore
 
-from .config import STREAM_LEFT, STREAM_RIGHT, DEPTH_MODES, DEFAULT_DEPTH_MODE
+from .config import STREAM_LEFT, STREAM_RIGHT, DEPTH_MODES, DEFAULT_DEPTH_MODE, DEFAULT_DEPTH_DTYPE
 from .export_paths import derive_export_dir
 from .ingestion import SvoIngestor, sl
+from .npy_io import save_npy, write_buffers
 from .options import FrameExportOptions
 
+try:
+    import simplejpeg  # type: ignore
+except ImportError:  # pragma: no cover
+    simplejpeg = None  # Optional: fall back to OpenCV's JPEG encoder.
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None  # Optional: stdlib json is used for the manifest.
+
+try:
+    from nvjpeg import NvJpeg  # type: ignore
+except ImportError:  # pragma: no cover
+    NvJpeg = None  # Optional: GPU JPEG encoding (nvjpeg-python) on NVIDIA/Jetson systems.
+
+# Frames buffered between pipeline stages (grab -> encode -> write); bounds memory use
+_PIPELINE_DEPTH = 4
+# Same quality (and 4:2:0 subsampling) cv2.imwrite uses by default
+_JPEG_QUALITY = 95
+_JPEG_PARAMS = [cv2.IMWRITE_JPEG_QUALITY, _JPEG_QUALITY]
+# Parallel JPEG encoders (the encode calls release the GIL)
+_ENCODE_WORKERS = min(4, os.cpu_count() or 1)
+# Frame writes kept in flight at once by the writer stage
+_WRITE_INFLIGHT = 4
+# Minimum seconds between preview/progress-ratio signals (the GUI can't redraw faster)
+_EMIT_INTERVAL = 0.1
+
+
+def _build_depth_mode_map() -> Dict[str, object]:
+    """Map DEPTH_MODES names to pyzed enums, falling back where an SDK lacks a mode."""
+    modes = sl.DEPTH_MODE
+    return {
+        "NEURAL_PLUS": getattr(modes, "NEURAL_PLUS", getattr(modes, "NEURAL", modes.PERFORMANCE)),
+        "NEURAL": getattr(modes, "NEURAL", getattr(modes, "NEURAL_PLUS", modes.PERFORMANCE)),
+        "ULTRA": getattr(modes, "ULTRA", modes.QUALITY),
+        "QUALITY": getattr(modes, "QUALITY", modes.PERFORMANCE),
+        "PERFORMANCE": getattr(modes, "PERFORMANCE", modes.NONE),
+        "NONE": modes.NONE,
+    }
+
+
+# Resolved once at import; empty without the ZED SDK (exports refuse to start then)
+_DEPTH_MODE_MAP = _build_depth_mode_map() if sl is not None else {}
+
 
 @dataclass
 class ExportSummary:
@@ -46,6 +97,144 @@ def _has_min_free_space(path: Path, min_bytes: int) -> bool:
     return usage.free >= min_bytes
 
 
+def _make_jpeg_encoder() -> Callable[[np.ndarray], bytes]:
+    """Return a BGRA -> JPEG bytes encoder, picking the backend once.
+
+    Preference: nvJPEG (GPU), simplejpeg (libjpeg-turbo), OpenCV (with OpenCL
+    colour conversion if a device is available). The returned
+    callable is owned by a single thread (the nvJPEG handle and the BGR
+    conversion buffer are created for and reused by that thread).
+    """
+    cvt_color, imencode, bgra2bgr = cv2.cvtColor, cv2.imencode, cv2.COLOR_BGRA2BGR
+    bgr_buf: Optional[np.ndarray] = None
+
+    if NvJpeg is not None:
+        try:
+            nv_encode = NvJpeg().encode
+        except Exception:  # No usable CUDA device/driver: use a CPU backend
+            nv_encode = None
+        if nv_encode is not None:
+            def encode(bgra: np.ndarray) -> bytes:
+                nonlocal bgr_buf
+                # nvJPEG takes 3-channel BGR; Huffman coding and DCT run on the GPU
+                bgr_buf = cvt_color(bgra, bgra2bgr, dst=bgr_buf)
+                return nv_encode(bgr_buf, _JPEG_QUALITY)
+            return encode
+
+    if simplejpeg is not None:
+        encode_jpeg = simplejpeg.encode_jpeg
+
+        def encode(bgra: np.ndarray) -> bytes:
+            # libjpeg-turbo reads BGRA directly: no cvtColor copy
+            return encode_jpeg(bgra, quality=_JPEG_QUALITY, colorspace="BGRA",
+                               colorsubsampling="420", fastdct=True)
+        return encode
+
+    if cv2.ocl.haveOpenCL():
+        # Transparent API: the colour conversion runs as an OpenCL kernel on the GPU/iGPU
+        cv2.ocl.setUseOpenCL(True)
+        umat = cv2.UMat
+
+        def encode(bgra: np.ndarray) -> bytes:
+            ok, jpeg = imencode(".jpg", cvt_color(umat(bgra), bgra2bgr), _JPEG_PARAMS)
+            if not ok:
+                raise RuntimeError("JPEG-Kodierung fehlgeschlagen")
+            return jpeg
+        return encode
+
+    def encode(bgra: np.ndarray) -> bytes:
+        nonlocal bgr_buf
+        bgr_buf = cvt_color(bgra, bgra2bgr, dst=bgr_buf)
+        ok, jpeg = imencode(".jpg", bgr_buf, _JPEG_PARAMS)
+        if not ok:
+            raise RuntimeError("JPEG-Kodierung fehlgeschlagen")
+        return jpeg
+    return encode
+
+
+def _copy_into_pooled(pool: queue.SimpleQueue, src: np.ndarray) -> np.ndarray:
+    """Copy ``src`` into a recycled buffer from ``pool``, allocating only if none fits."""
+    try:
+        buf = pool.get_nowait()
+    except queue.Empty:
+        buf = None
+    if buf is None or buf.shape != src.shape or buf.dtype != src.dtype:
+        buf = np.empty_like(src)
+    np.copyto(buf, src)
+    return buf
+
+
+def _convert_depth(depth_data: np.ndarray, depth_dtype: str) -> np.ndarray:
+    """Convert a float32 depth map (meters) to the configured storage type.
+
+    ``float16`` keeps meters at half the size; ``uint16_mm`` stores millimetres,
+    clipped to 0..65535 with invalid (NaN/inf) pixels written as 0.
+    """
+    if depth_dtype == "float16":
+        return depth_data.astype(np.float16)
+    if depth_dtype == "uint16_mm":
+        millimetres = np.multiply(depth_data, 1000.0, dtype=np.float32)
+        np.nan_to_num(millimetres, copy=False, nan=0.0, posinf=0.0, neginf=0.0)
+        np.clip(millimetres, 0, 65535, out=millimetres)
+        return millimetres.astype(np.uint16)
+    return depth_data
+
+
+def _write_frame_files(
+    filename: Path, jpeg, depth_data: Optional[np.ndarray], depth_pool: queue.SimpleQueue,
+    dir_fd: Optional[int] = None, depth_dtype: str = DEFAULT_DEPTH_DTYPE,
+) -> int:
+    """Write one exported frame: the encoded JPEG and, if present, its depth map.
+
+    With ``dir_fd`` (an open handle on the export dir) files are created by name
+    relative to it. The depth buffer is handed back to ``depth_pool`` once it
+    has been written. Returns the JPEG size in bytes.
+    """
+    depth_filename = filename.with_suffix(".npy")
+    if dir_fd is None:
+        write_buffers(filename, (jpeg,))
+    else:
+        write_buffers(filename.name, (jpeg,), dir_fd)
+        depth_filename = depth_filename.name
+    if depth_data is not None:
+        try:
+            save_npy(depth_filename, _convert_depth(depth_data, depth_dtype), dir_fd)
+        finally:
+            depth_pool.put(depth_data)
+    return memoryview(jpeg).nbytes
+
+
+def _write_manifest(manifest_path: Path, manifest: dict) -> None:
+    """Write the export manifest as indented JSON (orjson when available)."""
+    if orjson is not None:
+        manifest_path.write_bytes(orjson.dumps(manifest, option=orjson.OPT_INDENT_2))
+        return
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+
+
+class FrameCountWorker(QtCore.QThread):
+    """Count SVO frames off the GUI thread, on an already opened ingestor (closed when done)."""
+
+    count_progress = QtCore.Signal(int)
+    count_done = QtCore.Signal(int)  # 0 if counting failed or was cancelled
+
+    def __init__(self, ingestor: SvoIngestor, parent=None) -> None:
+        super().__init__(parent)
+        self._ingestor = ingestor
+        self._cancelled = False
+
+    def cancel(self) -> None:
+        self._cancelled = True
+
+    def run(self) -> None:
+        try:
+            total = self._ingestor.count_frames(self.count_progress.emit, lambda: self._cancelled)
+        finally:
+            self._ingestor.close()
+        self.count_done.emit(0 if self._cancelled else (total or 0))
+
+
 class FrameExportWorker(QtCore.QThread):
     progress = QtCore.Signal(str)
     frame_saved = QtCore.Signal(str)
@@ -111,43 +300,89 @@ class FrameExportWorker(QtCore.QThread):
         zed_mat = sl.Mat()
         depth_mat = sl.Mat()
         frame_idx = 0  # Index of successfully grabbed frames (NOT theoretical timestamp)
-        written = 0
-        last_frame_path: Optional[Path] = None
+        self._written = 0
+        self._last_frame_path: Optional[Path] = None
+        self._next_emit = 0.0
+        self._frame_entries: List[dict] = []  # Per-frame manifest records, in file order
+
+        # Seek mode: jump straight to the next kept frame instead of decoding the ones in between
+        seek = keep_every > 1 and not self.options.accurate_drop_counting
 
         self.progress.emit(f"Export nach {export_dir} gestartet (keep every {keep_every}).")
-        self.progress.emit("Hinweis: Zählt nur existierende Frames (dropped frames werden automatisch übersprungen).")
+        if seek:
+            self.progress.emit("Hinweis: Springt per SVO-Position (dropped frames werden nicht exakt berücksichtigt).")
+        else:
+            self.progress.emit("Hinweis: Zählt nur existierende Frames (dropped frames werden automatisch übersprungen).")
+
+        # Three-stage pipeline: this thread grabs, helper threads encode and write,
+        # so grab(N+1), encode(N) and write(N-1) overlap. Bounded queues apply back-pressure.
+        encode_q: queue.Queue = queue.Queue(maxsize=_PIPELINE_DEPTH)
+        write_q: queue.Queue = queue.Queue(maxsize=_PIPELINE_DEPTH)
+        # Frame/depth buffers handed back by the encoder/writer once they are consumed
+        frame_pool: queue.SimpleQueue = queue.SimpleQueue()
+        depth_pool: queue.SimpleQueue = queue.SimpleQueue()
+        encoder = threading.Thread(
+            target=self._encode_stage, args=(encode_q, write_q, frame_pool), name="export-encode", daemon=True
+        )
+        writer = threading.Thread(
+            target=self._write_stage, args=(write_q, export_dir, total_frames, depth_pool), name="export-write", daemon=True
+        )
+        encoder.start()
+        writer.start()
 
+        countdown = 1  # Grabs left until the next kept frame (first frame is kept)
+        # Hoisted out of the per-frame loop: SDK constants, bound methods, option lookups
+        success = sl.ERROR_CODE.SUCCESS
+        measure_depth = sl.MEASURE.DEPTH
+        grab = camera.grab
+        retrieve_image = camera.retrieve_image
+        retrieve_measure = camera.retrieve_measure
+        get_svo_position = camera.get_svo_position
+        set_svo_position = camera.set_svo_position
+        export_depth = self.options.export_depth
+        put_frame = encode_q.put
         try:
-            while not self._cancelled and camera.grab() == sl.ERROR_CODE.SUCCESS:
+            while not self._cancelled and grab() == success:
                 # frame_idx counts only successfully grabbed frames (dropped frames don't increment it)
                 # So keep_every correctly spaces exports even if source has frame drops
-                if frame_idx % keep_every == 0:
+                if seek:
+                    # Every grab lands on a kept frame; frame_idx follows the SVO position
+                    position = get_svo_position()
+                    if position < frame_idx:
+                        break  # Seek past the end was clamped: nothing new left
+                    frame_idx = position
+                    countdown = 1
+                countdown -= 1
+                if countdown == 0:
+                    countdown = keep_every
                     try:
-                        if camera.retrieve_image(zed_mat, view_enum) == sl.ERROR_CODE.SUCCESS:
-                            np_img = zed_mat.get_data()  # BGRA
-                            bgr = cv2.cvtColor(np_img, cv2.COLOR_BGRA2BGR)
-                            filename = export_dir / f"frame_{written:06d}.jpg"
-                            if cv2.imwrite(str(filename), bgr):
-                                written += 1
-                                last_frame_path = filename
-                                self.frame_saved.emit(str(filename))
-                                # Optional depth export
-                                if self.options.export_depth:
-                                    if camera.retrieve_measure(depth_mat, sl.MEASURE.DEPTH) == sl.ERROR_CODE.SUCCESS:
-                                        depth_data = depth_mat.get_data()
-                                        depth_filename = export_dir / f"frame_{written-1:06d}.npy"
-                                        np.save(depth_filename, depth_data)
-                                if total_frames:
-                                    self.progress_ratio.emit(min(1.0, frame_idx / max(1, total_frames)))
-                                if written % 100 == 0:
-                                    self.progress.emit(f"{written} Frames gespeichert…")
+                        if retrieve_image(zed_mat, view_enum) == success:
+                            # get_data(deep_copy=False) is a view on the sl.Mat, which the next grab()
+                            # overwrites: the stages get one copy, into recycled buffers
+                            bgra = _copy_into_pooled(frame_pool, zed_mat.get_data(deep_copy=False))
+                            depth_data = None
+                            # Optional depth export
+                            if export_depth:
+                                if retrieve_measure(depth_mat, measure_depth) == success:
+                                    depth_data = _copy_into_pooled(depth_pool, depth_mat.get_data(deep_copy=False))
+                            put_frame((frame_idx, bgra, depth_data))
                         else:
                             self.progress.emit(f"Frame {frame_idx} konnte nicht gelesen werden (weiter).")
                     except Exception as exc:
                         self.progress.emit(f"Frame {frame_idx} Fehler: {exc} (weiter).")
+                    if seek:
+                        if total_frames and frame_idx + keep_every >= total_frames:
+                            break
+                        set_svo_position(frame_idx + keep_every)
                 frame_idx += 1
         finally:
+            # Sentinel flushes both stages; frames already queued are still written
+            encode_q.put(None)
+            encoder.join()
+            writer.join()
             ingestor.close()
+        written = self._written
+        last_frame_path = self._last_frame_path
 
         if total_frames:
             self.progress_ratio.emit(1.0)
@@ -175,9 +410,10 @@ class FrameExportWorker(QtCore.QThread):
             "resolution": resolution,
             "export_depth": self.options.export_depth,
             "depth_mode": self.options.depth_mode,
+            "depth_dtype": self.options.depth_dtype,
+            "frames": self._frame_entries,
         }
-        with open(manifest_path, "w", encoding="utf-8") as f:
-            json.dump(manifest, f, indent=2)
+        _write_manifest(manifest_path, manifest)
 
         self.progress.emit(f"Fertig: {written} Frames geschrieben.")
         return ExportSummary(
@@ -188,18 +424,117 @@ class FrameExportWorker(QtCore.QThread):
             warning=warning,
         )
 
+    def _encode_stage(self, encode_q: queue.Queue, write_q: queue.Queue, frame_pool: queue.SimpleQueue) -> None:
+        """Pipeline stage (own thread): BGRA frames -> JPEG bytes, in grab order.
+
+        Frames are encoded on a small thread pool (all encoder backends release
+        the GIL); results are forwarded to the writer in submission order.
+        """
+        local = threading.local()
+
+        def encode(bgra: np.ndarray) -> bytes:
+            # Encoders keep per-thread state (BGR buffer, nvJPEG handle)
+            encoder = getattr(local, "encode", None)
+            if encoder is None:
+                encoder = local.encode = _make_jpeg_encoder()
+            try:
+                return encoder(bgra)
+            finally:
+                frame_pool.put(bgra)
+
+        pending: Deque[Tuple[Future, int, Optional[np.ndarray]]] = deque()
+        try:
+            with ThreadPoolExecutor(max_workers=_ENCODE_WORKERS, thread_name_prefix="export-jpeg") as pool:
+                while True:
+                    item = encode_q.get()
+                    if item is None:
+                        break
+                    frame_idx, bgra, depth_data = item
+                    pending.append((pool.submit(encode, bgra), frame_idx, depth_data))
+                    # Forward finished frames in order; only block once every worker is busy
+                    while pending and (len(pending) >= _ENCODE_WORKERS or pending[0][0].done()):
+                        self._forward_encoded(write_q, *pending.popleft())
+                while pending:
+                    self._forward_encoded(write_q, *pending.popleft())
+        finally:
+            write_q.put(None)
+
+    def _forward_encoded(
+        self, write_q: queue.Queue, future: Future, frame_idx: int, depth_data: Optional[np.ndarray]
+    ) -> None:
+        """Hand one encoded frame to the writer stage (or report its encode error)."""
+        try:
+            jpeg = future.result()
+        except Exception as exc:
+            self.progress.emit(f"Frame {frame_idx} Fehler: {exc} (weiter).")
+            return
+        write_q.put((frame_idx, jpeg, depth_data))
+
+    def _write_stage(
+        self, write_q: queue.Queue, export_dir: Path, total_frames: Optional[int], depth_pool: queue.SimpleQueue
+    ) -> None:
+        """Pipeline stage (own thread): write JPEG/depth files and report progress.
+
+        Files are numbered here, so numbering stays gapless even if a frame fails upstream.
+        Up to ``_WRITE_INFLIGHT`` frames are written concurrently so slow media see
+        several outstanding writes; completions are reported in submission order.
+        """
+        # Create files relative to one open directory handle (openat) instead of
+        # resolving the full export path again for every file
+        dir_fd: Optional[int] = None
+        if os.open in os.supports_dir_fd:
+            try:
+                dir_fd = os.open(export_dir, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+            except OSError:
+                dir_fd = None
+
+        inflight: Deque[Tuple[Future, Path, int]] = deque()
+        seq = 0
+        try:
+            with ThreadPoolExecutor(max_workers=_WRITE_INFLIGHT, thread_name_prefix="export-io") as io_pool:
+                while True:
+                    item = write_q.get()
+                    if item is None:
+                        break
+                    frame_idx, jpeg, depth_data = item
+                    filename = export_dir / f"frame_{seq:06d}.jpg"
+                    seq += 1
+                    future = io_pool.submit(
+                        _write_frame_files, filename, jpeg, depth_data, depth_pool, dir_fd, self.options.depth_dtype
+                    )
+                    inflight.append((future, filename, frame_idx))
+                    # Reap finished writes in order; only block once the queue depth is reached
+                    while inflight and (len(inflight) >= _WRITE_INFLIGHT or inflight[0][0].done()):
+                        self._finish_write(*inflight.popleft(), total_frames)
+                while inflight:
+                    self._finish_write(*inflight.popleft(), total_frames)
+        finally:
+            if dir_fd is not None:
+                os.close(dir_fd)
+
+    def _finish_write(self, future: Future, filename: Path, frame_idx: int, total_frames: Optional[int]) -> None:
+        """Account for one completed frame write and emit progress signals."""
+        try:
+            jpeg_bytes = future.result()
+        except Exception as exc:
+            self.progress.emit(f"Frame {frame_idx} Fehler: {exc} (weiter).")
+            return
+        self._written += 1
+        self._last_frame_path = filename
+        self._frame_entries.append({"file": filename.name, "source_frame": frame_idx, "bytes": jpeg_bytes})
+        # Coalesce cross-thread signals; the final frame is shown via ExportSummary
+        now = time.monotonic()
+        if now >= self._next_emit:
+            self._next_emit = now + _EMIT_INTERVAL
+            self.frame_saved.emit(str(filename))
+            if total_frames:
+                self.progress_ratio.emit(min(1.0, frame_idx / max(1, total_frames)))
+        if self._written % 100 == 0:
+            self.progress.emit(f"{self._written} Frames gespeichert…")
+
     @staticmethod
     def _resolve_depth_mode(name: str):
         """Map string depth mode to pyzed depth mode with safe fallback."""
         if not name:
             name = DEFAULT_DEPTH_MODE
-        upper = name.upper()
-        mode_map = {
-            "NEURAL_PLUS": getattr(sl.DEPTH_MODE, "NEURAL_PLUS", getattr(sl.DEPTH_MODE, "NEURAL", sl.DEPTH_MODE.PERFORMANCE)),
-            "NEURAL": getattr(sl.DEPTH_MODE, "NEURAL", getattr(sl.DEPTH_MODE, "NEURAL_PLUS", sl.DEPTH_MODE.PERFORMANCE)),
-            "ULTRA": getattr(sl.DEPTH_MODE, "ULTRA", sl.DEPTH_MODE.QUALITY),
-            "QUALITY": getattr(sl.DEPTH_MODE, "QUALITY", sl.DEPTH_MODE.PERFORMANCE),
-            "PERFORMANCE": getattr(sl.DEPTH_MODE, "PERFORMANCE", sl.DEPTH_MODE.NONE),
-            "NONE": sl.DEPTH_MODE.NONE,
-        }
-        return mode_map.get(upper, mode_map[DEFAULT_DEPTH_MODE])
+        return _DEPTH_MODE_MAP.get(name.upper(), _DEPTH_MODE_MAP[DEFAULT_DEPTH_MODE])
@@ -1,15 +1,19 @@
 """PySide6 GUI skeleton focused on frame extraction."""
 from __future__ import annotations
 
+import functools
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Set, Tuple
 
 from PySide6 import QtCore, QtGui, QtWidgets
 
-from .config import DEFAULT_OUTPUT_ROOT, DEFAULT_TARGET_FPS, STREAM_LEFT, STREAM_RIGHT, DEPTH_MODES, DEFAULT_DEPTH_MODE
-from .extraction import FrameExportWorker, ExportSummary
-from .ingestion import SvoIngestor
+from .config import (
+    pick_default_output_root, DEFAULT_TARGET_FPS, STREAM_LEFT, STREAM_RIGHT, DEPTH_MODES, DEFAULT_DEPTH_MODE,
+    DEPTH_DTYPES, DEFAULT_DEPTH_DTYPE,
+)
+from .extraction import FrameCountWorker, FrameExportWorker, ExportSummary
+from .ingestion import SvoIngestor, SvoMetadata
 from .export_paths import derive_export_dir, ensure_output_root_writable, OutputPathError
 from .options import FrameExportOptions
 
@@ -22,11 +26,17 @@ class FrameExportWindow(QtWidgets.QMainWindow):
 
         self.options = FrameExportOptions(
             svo_path=Path(),
-            output_root=DEFAULT_OUTPUT_ROOT,
+            output_root=pick_default_output_root(),
             stream=STREAM_LEFT,
             target_fps=DEFAULT_TARGET_FPS,
         )
 
+        # Metadata + frame count per (SVO path, mtime); re-selecting a file skips the SVO open
+        self._metadata_cache: Dict[Tuple[Path, int], Tuple[SvoMetadata, Optional[int]]] = {}
+        self._count_worker: Optional[FrameCountWorker] = None
+        # Every count worker still running (incl. cancelled ones), so teardown can wait on them
+        self._count_workers: Set[FrameCountWorker] = set()
+
         self._build_ui()
         self._wire_signals()
 
@@ -43,7 +53,7 @@ class FrameExportWindow(QtWidgets.QMainWindow):
         file_row.addWidget(browse_btn)
 
         output_root_row = QtWidgets.QHBoxLayout()
-        self.output_root_edit = QtWidgets.QLineEdit(str(DEFAULT_OUTPUT_ROOT))
+        self.output_root_edit = QtWidgets.QLineEdit(str(pick_default_output_root()))
         self.output_root_edit.setPlaceholderText("Export-Root (z.B. gemounteter USB-Stick)")
         output_root_btn = QtWidgets.QPushButton("Ordner wählen…")
         output_root_row.addWidget(QtWidgets.QLabel("Export-Root:"))
@@ -77,8 +87,12 @@ class FrameExportWindow(QtWidgets.QMainWindow):
         self.target_fps_slider.setValue(DEFAULT_TARGET_FPS)
         self.target_fps_value = QtWidgets.QLabel(f"Target FPS: {DEFAULT_TARGET_FPS}")
         self.skip_value = QtWidgets.QLabel("Keep every: 1 (source FPS unbekannt)")
-        self.depth_checkbox = QtWidgets.QCheckBox("Depth (32-bit .npy) mit exportieren")
+        self.depth_checkbox = QtWidgets.QCheckBox("Depth (.npy) mit exportieren")
         self.depth_checkbox.setChecked(False)
+        self.seek_checkbox = QtWidgets.QCheckBox(
+            "Schnell springen (set_svo_position – Frame-Drops werden nicht exakt berücksichtigt)"
+        )
+        self.seek_checkbox.setChecked(False)
         depth_mode_row = QtWidgets.QHBoxLayout()
         depth_mode_row.addWidget(QtWidgets.QLabel("Depth Mode:"))
         self.depth_mode_combo = QtWidgets.QComboBox()
@@ -87,10 +101,19 @@ class FrameExportWindow(QtWidgets.QMainWindow):
         if default_index >= 0:
             self.depth_mode_combo.setCurrentIndex(default_index)
         depth_mode_row.addWidget(self.depth_mode_combo)
+        depth_mode_row.addWidget(QtWidgets.QLabel("Depth-Format:"))
+        self.depth_dtype_combo = QtWidgets.QComboBox()
+        self.depth_dtype_combo.addItems(DEPTH_DTYPES)
+        self.depth_dtype_combo.setCurrentText(DEFAULT_DEPTH_DTYPE)
+        self.depth_dtype_combo.setToolTip(
+            "float32: Meter (32-bit) · float16: Meter (halbe Dateigröße) · uint16_mm: Millimeter (halbe Dateigröße)"
+        )
+        depth_mode_row.addWidget(self.depth_dtype_combo)
         depth_mode_row.addStretch()
         fps_layout.addWidget(self.target_fps_value)
         fps_layout.addWidget(self.target_fps_slider)
         fps_layout.addWidget(self.skip_value)
+        fps_layout.addWidget(self.seek_checkbox)
         fps_layout.addWidget(self.depth_checkbox)
         fps_layout.addLayout(depth_mode_row)
         fps_group.setLayout(fps_layout)
@@ -155,7 +178,7 @@ class FrameExportWindow(QtWidgets.QMainWindow):
             self.svo_path_edit.setText(file_path)
 
     def _choose_output_root(self) -> None:
-        dir_path = QtWidgets.QFileDialog.getExistingDirectory(self, "Export-Root wählen", str(DEFAULT_OUTPUT_ROOT))
+        dir_path = QtWidgets.QFileDialog.getExistingDirectory(self, "Export-Root wählen", str(pick_default_output_root()))
         if dir_path:
             self.output_root_edit.setText(dir_path)
 
@@ -165,6 +188,7 @@ class FrameExportWindow(QtWidgets.QMainWindow):
     def _on_svo_path_changed(self, text: str) -> None:
         path = Path(text)
         self.options.svo_path = path
+        self._cancel_frame_count()
         if path.exists():
             self._load_metadata(path)
         else:
@@ -174,7 +198,7 @@ class FrameExportWindow(QtWidgets.QMainWindow):
             self.total_frames_label.setText("Frames gesamt: -")
 
     def _on_output_root_changed(self, text: str) -> None:
-        root = Path(text) if text else DEFAULT_OUTPUT_ROOT
+        root = Path(text) if text else pick_default_output_root()
         self.options.output_root = root
 
     def _on_target_fps_changed(self, value: int) -> None:
@@ -185,6 +209,7 @@ class FrameExportWindow(QtWidgets.QMainWindow):
     def _on_depth_changed(self, state: int) -> None:
         self.options.export_depth = state == QtCore.Qt.Checked
         self.depth_mode_combo.setEnabled(self.options.export_depth)
+        self.depth_dtype_combo.setEnabled(self.options.export_depth)
 
     def _on_depth_mode_changed(self, text: str) -> None:
         self.options.depth_mode = text
@@ -205,6 +230,11 @@ class FrameExportWindow(QtWidgets.QMainWindow):
         # Sync options from current UI state
         self.options.export_depth = self.depth_checkbox.isChecked()
         self.options.depth_mode = self.depth_mode_combo.currentText()
+        self.options.depth_dtype = self.depth_dtype_combo.currentText()
+        self.options.accurate_drop_counting = not self.seek_checkbox.isChecked()
+        # A running frame count would compete with the export for the disk; the
+        # exporter works without a total (only the progress bar needs it)
+        self._cancel_frame_count()
 
         try:
             ensure_output_root_writable(self.options.output_root)
@@ -288,12 +318,26 @@ class FrameExportWindow(QtWidgets.QMainWindow):
         self.preview_label.setText("Noch kein Frame angezeigt.")
         
         try:
-            self.status_label.setText("SVO wird geladen… bitte warten.")
-            QtWidgets.QApplication.processEvents()
-            meta = SvoIngestor(path).metadata()
-        except Exception as exc:
-            self.source_fps_label.setText(f"Source FPS: Fehler ({exc})")
-            return
+            cache_key = (path, path.stat().st_mtime_ns)
+        except OSError:
+            cache_key = None
+        cached = self._metadata_cache.get(cache_key) if cache_key else None
+        ingestor: Optional[SvoIngestor] = None
+        if cached is not None:
+            meta, counted_frames = cached
+        else:
+            counted_frames = None
+            try:
+                self.status_label.setText("SVO wird geladen… bitte warten.")
+                QtWidgets.QApplication.processEvents()
+                # Keep the camera open so a frame count below reuses the same handle
+                ingestor = SvoIngestor(path)
+                meta = ingestor.metadata(keep_open=True)
+            except Exception as exc:
+                if ingestor is not None:
+                    ingestor.close()
+                self.source_fps_label.setText(f"Source FPS: Fehler ({exc})")
+                return
 
         self.options.source_fps = meta.fps
         self.options.total_frames = meta.total_frames
@@ -317,28 +361,67 @@ class FrameExportWindow(QtWidgets.QMainWindow):
         else:
             self.file_size_label.setText("Dateigröße: -")
 
-        total_frames = meta.total_frames
-        if not total_frames:
-            self.status_label.setText("Frames zählen… (siehe auch Konsole)")
-            QtWidgets.QApplication.processEvents()
-            
-            # Progress callback for frame counting
-            def count_progress(count):
-                print(f"  Gezählte Frames: {count}", flush=True)
-                self.status_label.setText(f"Frames zählen… {count} bisher")
-                QtWidgets.QApplication.processEvents()
-            
-            total_frames = SvoIngestor.fast_count_frames(path, progress_callback=count_progress)
+        total_frames = meta.total_frames or counted_frames
+        if not total_frames and ingestor is not None:
+            # Counting may scan the whole SVO: do it in the background on the same open handle
+            self._start_frame_count(ingestor, cache_key, meta)
+            self.total_frames_label.setText("Frames gesamt: zähle…")
+        else:
+            if ingestor is not None:
+                ingestor.close()
+                if cache_key:
+                    self._metadata_cache[cache_key] = (meta, total_frames)
+            if total_frames:
+                self.total_frames_label.setText(f"Frames gesamt: {total_frames}")
+                self.options.total_frames = total_frames
+            else:
+                self.total_frames_label.setText("Frames gesamt: -")
 
+        self.status_label.setText("Bereit.")
+        self._update_keep_every_label()
+
+    def _start_frame_count(self, ingestor: SvoIngestor, cache_key, meta: SvoMetadata) -> None:
+        """Count frames on a worker thread; the worker takes ownership of ``ingestor``."""
+        self._cancel_frame_count()
+        worker = FrameCountWorker(ingestor, self)
+        worker.count_progress.connect(self._on_count_progress)
+        worker.count_done.connect(functools.partial(self._on_count_done, worker, cache_key, meta))
+        worker.finished.connect(functools.partial(self._count_workers.discard, worker))
+        worker.finished.connect(worker.deleteLater)
+        self._count_worker = worker
+        self._count_workers.add(worker)
+        worker.start()
+
+    def _cancel_frame_count(self) -> None:
+        if self._count_worker is not None:
+            self._count_worker.cancel()
+            self._count_worker = None
+            self.total_frames_label.setText("Frames gesamt: -")
+
+    def closeEvent(self, event: QtGui.QCloseEvent) -> None:
+        # Destroying a running QThread aborts the process: stop counting and wait for it
+        self._cancel_frame_count()
+        for worker in list(self._count_workers):
+            worker.cancel()
+            worker.wait()
+        self._count_workers.clear()
+        super().closeEvent(event)
+
+    def _on_count_progress(self, count: int) -> None:
+        self.total_frames_label.setText(f"Frames gesamt: zähle… {count} bisher")
+
+    def _on_count_done(self, worker: FrameCountWorker, cache_key, meta: SvoMetadata, total_frames: int) -> None:
+        if worker is not self._count_worker:
+            return  # Cancelled or superseded by another file
+        self._count_worker = None
         if total_frames:
             self.total_frames_label.setText(f"Frames gesamt: {total_frames}")
             self.options.total_frames = total_frames
+            if cache_key:
+                self._metadata_cache[cache_key] = (meta, total_frames)
         else:
             self.total_frames_label.setText("Frames gesamt: -")
 
-        self.status_label.setText("Bereit.")
-        self._update_keep_every_label()
-
 
 def run() -> None:
     app = QtWidgets.QApplication(sys.argv)
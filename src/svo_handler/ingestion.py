@@ -27,24 +27,31 @@ class SvoIngestor:
             raise RuntimeError("ZED SDK (python-sl) is required for ingestion.")
         self.svo_path = Path(svo_path)
         self._camera = sl.Camera()
+        self._is_open = False
 
     def open(self) -> None:
+        if self._is_open:
+            return
         init_params = sl.InitParameters()
         init_params.set_from_svo_file(str(self.svo_path))
         init_params.coordinate_units = sl.UNIT.METER
         init_params.depth_mode = sl.DEPTH_MODE.NONE
+        init_params.svo_real_time_mode = False  # Never wait on playback timing
 
         err = self._camera.open(init_params)
         if err != sl.ERROR_CODE.SUCCESS:
             raise RuntimeError(f"Failed to open SVO: {err}")
+        self._is_open = True
 
     def close(self) -> None:
+        self._is_open = False
         try:
             self._camera.close()
         except Exception:
             pass
 
-    def metadata(self) -> SvoMetadata:
+    def metadata(self, keep_open: bool = False) -> SvoMetadata:
+        """Read SVO metadata; with ``keep_open`` the camera stays open for follow-up calls."""
         self.open()
         fps: Optional[int] = None
         resolution: Optional[Tuple[int, int]] = None
@@ -67,12 +74,19 @@ class SvoIngestor:
                 total_frames = info.svo_streaming.total_frames
             except Exception:
                 total_frames = None
+            if not total_frames and hasattr(self._camera, "get_svo_number_of_frames"):
+                # Same open handle: no second SVO open just to count frames
+                try:
+                    total_frames = int(self._camera.get_svo_number_of_frames()) or None
+                except Exception:
+                    total_frames = None
             try:
                 file_size_bytes = info.input_type.get_svo_file_size()
             except Exception:
                 file_size_bytes = None
         finally:
-            self.close()
+            if not keep_open:
+                self.close()
 
         # Fallbacks
         if file_size_bytes is None:
@@ -89,45 +103,63 @@ class SvoIngestor:
             file_size_bytes=file_size_bytes,
         )
 
-    @staticmethod
-    def fast_count_frames(svo_path: Path, progress_callback=None) -> Optional[int]:
-        """Count frames by scanning the SVO when metadata does not provide a total.
+    def count_frames(self, progress_callback=None, should_cancel=None) -> Optional[int]:
+        """Count frames on this ingestor's camera, opening it only if it is not open yet.
 
-        Uses `get_svo_number_of_frames` if available; otherwise performs a quick grab loop.
-        Optionally calls progress_callback(count) every 100 frames during counting.
+        Uses `get_svo_number_of_frames` if available; otherwise performs a quick grab loop
+        (which leaves the playback position at the end of the file).
+        Optionally calls progress_callback(count) every 100 frames during counting and
+        stops early (returning None) once should_cancel() returns True.
         Returns None on failure.
         """
-        if sl is None:
-            return None
-
         try:
-            cam = sl.Camera()
-            init_params = sl.InitParameters()
-            init_params.set_from_svo_file(str(svo_path))
-            init_params.coordinate_units = sl.UNIT.METER
-            init_params.depth_mode = sl.DEPTH_MODE.NONE
-            if cam.open(init_params) != sl.ERROR_CODE.SUCCESS:
-                return None
-
-            # Prefer direct API if present
+            self.open()
+            cam = self._camera
+
+            # Prefer direct API if present (reads the SVO index, no decoding)
             if hasattr(cam, "get_svo_number_of_frames"):
                 try:
-                    total = cam.get_svo_number_of_frames()
-                    cam.close()
-                    return int(total)
+                    total = int(cam.get_svo_number_of_frames())
+                    if total > 0:
+                        return total
                 except Exception:
                     pass
 
+            # Last resort: grab through the file with all per-frame processing disabled
+            runtime = sl.RuntimeParameters()
+            runtime.enable_depth = False
+            grab = cam.grab
+            success = sl.ERROR_CODE.SUCCESS
             count = 0
             if progress_callback:
-                print(f"Counting frames in {svo_path.name}...", flush=True)
-            while cam.grab() == sl.ERROR_CODE.SUCCESS:
+                print(f"Counting frames in {self.svo_path.name}...", flush=True)
+            while grab(runtime) == success:
                 count += 1
-                if progress_callback and count % 100 == 0:
-                    progress_callback(count)
-            cam.close()
+                if count % 100 == 0:
+                    if progress_callback:
+                        progress_callback(count)
+                    if should_cancel and should_cancel():
+                        return None
             if progress_callback:
                 print(f"Total frames counted: {count}", flush=True)
             return count
         except Exception:
             return None
+
+    @staticmethod
+    def fast_count_frames(svo_path: Path, progress_callback=None) -> Optional[int]:
+        """Count frames by scanning the SVO when metadata does not provide a total.
+
+        Opens a temporary ingestor; see `count_frames`. Returns None on failure.
+        """
+        if sl is None:
+            return None
+
+        try:
+            ingestor = SvoIngestor(svo_path)
+        except Exception:
+            return None
+        try:
+            return ingestor.count_frames(progress_callback)
+        finally:
+            ingestor.close()
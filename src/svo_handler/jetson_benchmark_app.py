@@ -16,15 +16,20 @@ Supports multiple benchmark scenarios:
 
 import sys
 import os
+import io
 import json
 import shutil
 import time
 import random
+import itertools
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from dataclasses import dataclass, asdict
 from typing import List, Optional, Tuple
-from collections import deque
+from collections import deque, OrderedDict
 import numpy as np
 
 from PySide6.QtWidgets import (
@@ -33,9 +38,69 @@ from PySide6.QtWidgets import (
     QGroupBox, QMessageBox, QProgressDialog, QScrollArea, QSpinBox, QCheckBox,
     QStackedWidget, QComboBox, QProgressBar, QSizePolicy
 )
-from PySide6.QtCore import Qt, QThread, Signal, QSize
+from PySide6.QtCore import Qt, QThread, Signal, QSize, QRunnable, QThreadPool, QObject, QRect, QTimer
 from PySide6.QtGui import QFont, QPixmap, QImage, QPainter, QPen, QColor, QBrush
 
+try:
+    from nvjpeg import NvJpeg  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    NvJpeg = None  # Optional: hardware JPEG decode (nvjpeg-python) on NVIDIA/Jetson systems.
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None  # Optional: copy-on-write reflinks (FICLONE) on Linux.
+
+_FICLONE = 0x40049409  # linux/fs.h: _IOW(0x94, 9, int)
+
+_JPEG_SUFFIXES = (".jpg", ".jpeg")
+_IMAGE_SUFFIXES = (".jpg", ".jpeg", ".png")
+
+# Jetson core split: GUI thread (Qt + matplotlib) on the first two cores,
+# benchmark workers on the rest, so repaints don't preempt or migrate inference
+_IS_JETSON = Path("/etc/nv_tegra_release").exists()
+_GUI_CORES = {0, 1}
+
+
+def _pin_current_thread(gui: bool) -> None:
+    """Pin the calling thread to the GUI or worker core set (Jetson only)."""
+    cpu_count = os.cpu_count() or 1
+    if not _IS_JETSON or not hasattr(os, 'sched_setaffinity') or cpu_count < 4:
+        return
+    all_cores = set(range(cpu_count))
+    try:
+        # pid 0 = the calling thread on Linux
+        os.sched_setaffinity(0, all_cores & _GUI_CORES if gui else all_cores - _GUI_CORES)
+    except OSError:
+        pass
+
+
+def _list_images(folder: Path) -> List[Path]:
+    """Return the image files in ``folder`` (one scandir pass, case-insensitive suffix)."""
+    with os.scandir(folder) as entries:
+        return [Path(entry.path) for entry in entries
+                if entry.name.lower().endswith(_IMAGE_SUFFIXES) and entry.is_file()]
+
+
+@functools.lru_cache(maxsize=32)
+def _count_images_at(folder: str, mtime_ns: int) -> int:
+    """Scan ``folder`` once per (path, mtime); adding/removing files bumps the mtime.
+    
+    Counts by name only (test folders hold just images), so a plain listdir is
+    enough; _list_images does the file-type check when the images are loaded.
+    """
+    return sum(1 for name in os.listdir(folder) if name.lower().endswith(_IMAGE_SUFFIXES))
+
+
+def _count_images(folder: Path) -> int:
+    """Count the image files in ``folder`` (cached while the folder is unchanged)."""
+    folder = folder.resolve()
+    return _count_images_at(str(folder), folder.stat().st_mtime_ns)
+
+
+# Predicted label line: class x_center y_center width height confidence
+_LABEL_ROW_FMT = ["%d", "%.6f", "%.6f", "%.6f", "%.6f", "%.6f"]
+
 # Configure matplotlib to use Agg backend (non-interactive, no Qt dependency)
 os.environ['MPLBACKEND'] = 'Agg'
 
@@ -46,6 +111,7 @@ try:
     import matplotlib
     matplotlib.use('Agg')  # Force Agg backend before importing pyplot
     from matplotlib.figure import Figure
+    from matplotlib.patches import Polygon
     from matplotlib.backends.backend_agg import FigureCanvasAgg
     MATPLOTLIB_AVAILABLE = True
 except Exception as e:
@@ -56,7 +122,12 @@ except Exception as e:
 
 
 class DepthPlotCanvas(QLabel):
-    """Canvas for plotting depth over time using matplotlib Agg backend."""
+    """Canvas for plotting depth over time using matplotlib Agg backend.
+    
+    Axes, labels and grid are rendered once into a cached background; each
+    update only restores that background and redraws the line + fill artists
+    (blitting). The full figure is redrawn only when the y range changes.
+    """
     
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -70,14 +141,29 @@ class DepthPlotCanvas(QLabel):
             self.axes.set_facecolor('#ffffff')
             self.axes.set_xlabel('Frame', fontsize=9)
             self.axes.set_ylabel('Depth (m)', fontsize=9)
-            self.axes.set_title('Mean Depth (Last 30 Frames)', fontsize=10)
+            self.axes.set_title('Mean Depth (Last 30 Frames)', fontsize=10, fontweight='bold')
             self.axes.grid(True, alpha=0.3)
             self.axes.tick_params(labelsize=8)
-            # Add padding to prevent clipping
-            self.fig.tight_layout(pad=1.5)
             
-            self.depth_data = []
             self.max_points = 30
+            self.depth_data = deque(maxlen=self.max_points)
+            self._x = np.arange(self.max_points, dtype=np.float64)
+            self._y_top = 40.0
+            self.axes.set_xlim(0, self.max_points - 1)
+            self.axes.set_ylim(0, self._y_top)
+            
+            # Data artists are created once; animated=True keeps them out of
+            # the cached background so they can be blitted on top of it
+            self.line, = self.axes.plot([], [], 'b-', linewidth=2, marker='o', markersize=4, animated=True)
+            self.fill = Polygon(np.empty((0, 2)), closed=True, facecolor='C0', edgecolor='none',
+                                alpha=0.3, animated=True)
+            self.axes.add_patch(self.fill)
+            
+            # Add padding to prevent clipping
+            self.fig.tight_layout(pad=1.5)
+            self.canvas = FigureCanvasAgg(self.fig)
+            self._background = None
+            self._redraw_background()
             
             # Render initial empty plot
             self._render_to_pixmap()
@@ -85,19 +171,19 @@ class DepthPlotCanvas(QLabel):
             self.setText("Matplotlib not available")
             self.setStyleSheet("background-color: #f0f0f0; color: #666;")
     
+    def _redraw_background(self):
+        """Fully draw the static figure and cache the axes area for blitting."""
+        self.canvas.draw()
+        self._background = self.canvas.copy_from_bbox(self.axes.bbox)
+    
     def _render_to_pixmap(self):
-        """Render matplotlib figure to QPixmap and display it."""
+        """Convert the current Agg buffer to a QPixmap and display it."""
         if not MATPLOTLIB_AVAILABLE:
             return
         
-        # Create canvas and render figure to buffer
-        canvas = FigureCanvasAgg(self.fig)
-        canvas.draw()
-        
         # Get RGBA buffer and convert to QImage
-        buf = canvas.buffer_rgba()
-        width, height = self.fig.get_size_inches() * self.fig.dpi
-        width, height = int(width), int(height)
+        buf = self.canvas.buffer_rgba()
+        width, height = self.canvas.get_width_height()
         
         qimage = QImage(buf, width, height, QImage.Format.Format_RGBA8888)
         pixmap = QPixmap.fromImage(qimage)
@@ -111,39 +197,39 @@ class DepthPlotCanvas(QLabel):
             return
         
         self.depth_data.append(depth_value if depth_value > 0 else 0)
-        if len(self.depth_data) > self.max_points:
-            self.depth_data.pop(0)
-        
-        self.axes.clear()
-        self.axes.set_facecolor('#ffffff')
-        self.axes.set_xlabel('Frame', fontsize=9)
-        self.axes.set_ylabel('Depth (m)', fontsize=9)
-        self.axes.set_title('Mean Depth (Last 30 Frames)', fontsize=10, fontweight='bold')
-        self.axes.grid(True, alpha=0.3)
-        self.axes.tick_params(labelsize=8)
-        
-        if self.depth_data:
-            x = list(range(len(self.depth_data)))
-            self.axes.plot(x, self.depth_data, 'b-', linewidth=2, marker='o', markersize=4)
-            self.axes.fill_between(x, 0, self.depth_data, alpha=0.3)
-            
-            # Set y-axis limits
-            max_depth = max(self.depth_data) if self.depth_data else 40
-            self.axes.set_ylim(0, min(max_depth * 1.2, 45))
-        
-        self.fig.tight_layout(pad=1.5)
+        count = len(self.depth_data)
+        y = np.fromiter(self.depth_data, dtype=np.float64, count=count)
+        x = self._x[:count]
+        
+        # Rescale (full redraw) only when data leaves the range or shrinks well inside it
+        max_depth = float(y.max())
+        y_top = min(max_depth * 1.2, 45) if max_depth > 0 else 40.0
+        if y_top > self._y_top or y_top < self._y_top * 0.5:
+            self._y_top = y_top
+            self.axes.set_ylim(0, y_top)
+            self._redraw_background()
+        
+        self.line.set_data(x, y)
+        # Area under the curve: data points closed along the x axis
+        self.fill.set_xy(np.column_stack((
+            np.concatenate(([0.0], x, [x[-1]])),
+            np.concatenate(([0.0], y, [0.0])),
+        )))
+        
+        self.canvas.restore_region(self._background)
+        self.axes.draw_artist(self.fill)
+        self.axes.draw_artist(self.line)
         self._render_to_pixmap()
     
     def clear_plot(self):
         """Clear all data."""
         if MATPLOTLIB_AVAILABLE:
-            self.depth_data = []
-            self.axes.clear()
-            self.axes.set_xlabel('Frame', fontsize=9)
-            self.axes.set_ylabel('Depth (m)', fontsize=9)
-            self.axes.set_title('Mean Depth (Last 30 Frames)', fontsize=10)
-            self.axes.grid(True, alpha=0.3)
-            self.fig.tight_layout(pad=1.5)
+            self.depth_data.clear()
+            self.line.set_data([], [])
+            self.fill.set_xy(np.empty((0, 2)))
+            self._y_top = 40.0
+            self.axes.set_ylim(0, self._y_top)
+            self._redraw_background()
             self._render_to_pixmap()
 
 
@@ -228,7 +314,11 @@ class DepthMapViewer(QLabel):
 
 
 class DepthTimePlot(QLabel):
-    """Widget for displaying depth over time as a line chart (60-frame rolling window)."""
+    """Widget for displaying depth over time as a line chart (60-frame rolling window).
+    
+    The figure, axes styling and layout are set up once; updates only swap the
+    line/fill data and touch the y limits when the range changes noticeably.
+    """
     
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -240,35 +330,50 @@ class DepthTimePlot(QLabel):
             self.depth_history = deque(maxlen=60)
             self.frame_history = deque(maxlen=60)
             self.current_frame = 0
+            
+            self.fig = Figure(figsize=(5, 2.5), dpi=80)
+            self.fig.patch.set_facecolor('#f5f5f5')
+            self.ax = self.fig.add_subplot(111)
+            self.ax.set_facecolor('#ffffff')
+            self.ax.set_xlabel('Frames Ago', fontsize=9)
+            self.ax.set_ylabel('Depth (m)', fontsize=9)
+            self.ax.set_title('Target Depth Over Time (Last 60 Frames)', fontsize=10, fontweight='bold')
+            self.ax.grid(True, alpha=0.3, linestyle='--')
+            self.ax.tick_params(labelsize=8)
+            self.ax.set_xlim(0, 60)
+            self._y_top = 40.0
+            self.ax.set_ylim(0, self._y_top)
+            
+            self.line, = self.ax.plot([], [], 'b-', linewidth=2, marker='o', markersize=3, alpha=0.8)
+            self.fill = Polygon(np.empty((0, 2)), closed=True, facecolor='blue', edgecolor='none', alpha=0.2)
+            self.ax.add_patch(self.fill)
+            
+            # Layout never changes (only data does): measure it once
+            self.fig.tight_layout(pad=1.0)
+            self.canvas = FigureCanvasAgg(self.fig)
             self._render_empty_plot()
         else:
             self.setText("Matplotlib not available")
     
+    def _render(self):
+        """Draw the figure and show it in the label."""
+        self.canvas.draw()
+        buf = self.canvas.buffer_rgba()
+        width, height = self.canvas.get_width_height()
+        
+        qimage = QImage(buf, width, height, QImage.Format.Format_RGBA8888)
+        self.setPixmap(QPixmap.fromImage(qimage))
+    
     def _render_empty_plot(self):
         """Render an empty plot."""
         if not MATPLOTLIB_AVAILABLE:
             return
         
-        fig = Figure(figsize=(5, 2.5), dpi=80)
-        fig.patch.set_facecolor('#f5f5f5')
-        ax = fig.add_subplot(111)
-        ax.set_facecolor('#ffffff')
-        ax.set_xlabel('Frame', fontsize=9)
-        ax.set_ylabel('Depth (m)', fontsize=9)
-        ax.set_title('Target Depth Over Time (Last 60 Frames)', fontsize=10, fontweight='bold')
-        ax.grid(True, alpha=0.3, linestyle='--')
-        ax.set_xlim(0, 60)
-        ax.set_ylim(0, 40)
-        fig.tight_layout(pad=1.0)
-        
-        # Render to pixmap
-        canvas = FigureCanvasAgg(fig)
-        canvas.draw()
-        buf = canvas.buffer_rgba()
-        width, height = int(fig.get_figwidth() * fig.dpi), int(fig.get_figheight() * fig.dpi)
-        
-        qimage = QImage(buf, width, height, QImage.Format.Format_RGBA8888)
-        self.setPixmap(QPixmap.fromImage(qimage))
+        self.line.set_data([], [])
+        self.fill.set_xy(np.empty((0, 2)))
+        self._y_top = 40.0
+        self.ax.set_ylim(0, self._y_top)
+        self._render()
     
     def update_plot(self, depth_value: float, frame_number: int):
         """
@@ -288,40 +393,23 @@ class DepthTimePlot(QLabel):
         if len(self.depth_history) < 2:
             return  # Need at least 2 points to plot
         
-        # Create figure
-        fig = Figure(figsize=(5, 2.5), dpi=80)
-        fig.patch.set_facecolor('#f5f5f5')
-        ax = fig.add_subplot(111)
-        ax.set_facecolor('#ffffff')
-        
         # Plot data
-        x_data = list(range(len(self.depth_history)))
-        ax.plot(x_data, list(self.depth_history), 'b-', linewidth=2, marker='o', markersize=3, alpha=0.8)
-        ax.fill_between(x_data, 0, list(self.depth_history), alpha=0.2, color='blue')
-        
-        # Styling
-        ax.set_xlabel('Frames Ago', fontsize=9)
-        ax.set_ylabel('Depth (m)', fontsize=9)
-        ax.set_title('Target Depth Over Time (Last 60 Frames)', fontsize=10, fontweight='bold')
-        ax.grid(True, alpha=0.3, linestyle='--')
-        ax.tick_params(labelsize=8)
-        
-        # Set limits
-        ax.set_xlim(0, max(60, len(self.depth_history)))
-        if self.depth_history:
-            max_depth = max(self.depth_history)
-            ax.set_ylim(0, min(max_depth * 1.2, 45) if max_depth > 0 else 40)
-        
-        fig.tight_layout(pad=1.0)
-        
-        # Render to pixmap
-        canvas = FigureCanvasAgg(fig)
-        canvas.draw()
-        buf = canvas.buffer_rgba()
-        width, height = int(fig.get_figwidth() * fig.dpi), int(fig.get_figheight() * fig.dpi)
-        
-        qimage = QImage(buf, width, height, QImage.Format.Format_RGBA8888)
-        self.setPixmap(QPixmap.fromImage(qimage))
+        y = np.fromiter(self.depth_history, dtype=np.float64, count=len(self.depth_history))
+        x = np.arange(len(y), dtype=np.float64)
+        self.line.set_data(x, y)
+        self.fill.set_xy(np.column_stack((
+            np.concatenate(([0.0], x, [x[-1]])),
+            np.concatenate(([0.0], y, [0.0])),
+        )))
+        
+        # Set limits (only when the range moved by more than 10%)
+        max_depth = float(y.max())
+        y_top = min(max_depth * 1.2, 45) if max_depth > 0 else 40.0
+        if abs(y_top - self._y_top) > 0.1 * self._y_top:
+            self._y_top = y_top
+            self.ax.set_ylim(0, y_top)
+        
+        self._render()
     
     def clear(self):
         """Clear the depth history and reset plot."""
@@ -357,6 +445,59 @@ class DepthVisualizationData:
     mean_depth: float  # mean depth in meters
 
 
+def _read_engine_metadata(engine_path: Path) -> dict:
+    """Return the export metadata Ultralytics prepends to .engine files ({} if absent)."""
+    try:
+        with open(engine_path, 'rb') as f:
+            meta_len = int.from_bytes(f.read(4), byteorder='little')
+            metadata = json.loads(f.read(meta_len).decode('utf-8'))
+    except (OSError, UnicodeDecodeError, ValueError):
+        return {}
+    return metadata if isinstance(metadata, dict) else {}
+
+
+def read_engine_batch(engine_path: Path) -> Optional[int]:
+    """Return the max batch size an Ultralytics engine was exported with (None if unknown).
+    
+    Dynamic engines accept any batch up to this size; static ones exactly this size.
+    """
+    batch = _read_engine_metadata(engine_path).get('batch')
+    return batch if isinstance(batch, int) and batch > 0 else None
+
+
+def read_engine_dynamic(engine_path: Path) -> bool:
+    """Return True if an Ultralytics engine was exported with dynamic shapes (False if unknown)."""
+    args = _read_engine_metadata(engine_path).get('args')
+    return isinstance(args, dict) and bool(args.get('dynamic'))
+
+
+def read_engine_precision(engine_path: Path) -> Optional[str]:
+    """Return the precision an engine was built with ("int8", "fp16", "fp32").
+    
+    Reads the export metadata Ultralytics prepends to .engine files (cheap);
+    for plain TensorRT engines, falls back to deserializing the engine and
+    checking its input tensor dtype. Returns None if it cannot be determined.
+    """
+    args = _read_engine_metadata(engine_path).get('args')
+    if isinstance(args, dict) and ('int8' in args or 'half' in args):
+        return 'int8' if args.get('int8') else 'fp16' if args.get('half') else 'fp32'
+    
+    try:
+        import tensorrt as trt
+        runtime = trt.Runtime(trt.Logger(trt.Logger.ERROR))
+        engine = runtime.deserialize_cuda_engine(Path(engine_path).read_bytes())
+        if engine is None:
+            return None
+        for i in range(engine.num_io_tensors):
+            name = engine.get_tensor_name(i)
+            if engine.get_tensor_mode(name) == trt.TensorIOMode.INPUT:
+                dtype = engine.get_tensor_dtype(name)
+                return {trt.DataType.INT8: 'int8', trt.DataType.HALF: 'fp16'}.get(dtype, 'fp32')
+    except Exception:
+        pass
+    return None
+
+
 class InferenceWorker(QThread):
     """Background worker for running inference on test images."""
     
@@ -365,13 +506,22 @@ class InferenceWorker(QThread):
     inference_failed = Signal(str)  # error_message
     
     def __init__(self, engine_path: Path, test_folder: Path, output_folder: Path, 
-                 conf_threshold: float = 0.25, max_images: Optional[int] = None):
+                 conf_threshold: float = 0.25, max_images: Optional[int] = None,
+                 batch_size: int = 1, copy_workers: int = 4, gpu_decode: bool = True,
+                 model=None):
         super().__init__()
         self.engine_path = engine_path
         self.test_folder = test_folder
         self.output_folder = output_folder
         self.conf_threshold = conf_threshold
         self.max_images = max_images
+        # Images per model() call; engines must be exported with batch >= this (or dynamic)
+        self.batch_size = max(1, batch_size)
+        # IO threads placing and decoding images ahead of inference (see _iter_staged)
+        self.copy_workers = max(1, copy_workers)
+        self.gpu_decode = gpu_decode  # nvJPEG decode when available (see _make_image_reader)
+        # Already loaded YOLO model for engine_path (reused from a previous run), else None
+        self.model = model
         self._cancelled = False
     
     def cancel(self):
@@ -380,28 +530,31 @@ class InferenceWorker(QThread):
     
     def run(self):
         """Run inference on all test images."""
+        _pin_current_thread(gui=False)
+        self.setPriority(QThread.Priority.HighPriority)
         try:
             from ultralytics import YOLO
             import cv2
+            from svo_handler.npy_io import write_buffers
             
-            # Load model
-            model = YOLO(str(self.engine_path))
+            # Load model (unless the app handed over the one from its last run)
+            if self.model is None:
+                self.model = YOLO(str(self.engine_path))
+            model = self.model
             
             # Get list of images
-            image_files = []
-            for ext in ['*.jpg', '*.jpeg', '*.png', '*.JPG', '*.JPEG', '*.PNG']:
-                image_files.extend(self.test_folder.glob(ext))
+            image_files = _list_images(self.test_folder)
             
             if not image_files:
                 self.inference_failed.emit(f"No images found in {self.test_folder}")
                 return
             
-            # Shuffle images for random sampling
-            random.shuffle(image_files)
-            
-            # Limit to max_images if specified
-            if self.max_images:
-                image_files = image_files[:self.max_images]
+            # Random sample of max_images if specified (no full shuffle needed),
+            # otherwise all images in random order
+            if self.max_images and self.max_images < len(image_files):
+                image_files = random.sample(image_files, self.max_images)
+            else:
+                random.shuffle(image_files)
             
             total = len(image_files)
             
@@ -411,66 +564,111 @@ class InferenceWorker(QThread):
             images_dir.mkdir(exist_ok=True)
             labels_dir.mkdir(exist_ok=True)
             
-            # Track statistics
-            detection_counts = []
-            start_time = time.time()
-            
-            # Process each image
-            for idx, img_path in enumerate(image_files):
+            # Track statistics (preallocated, filled by index: n_done images so far)
+            detection_counts = np.zeros(total, dtype=np.int32)
+            infer_ms = np.zeros(total, dtype=np.float32)  # model() time per image (batch time / batch)
+            n_done = 0
+            start_time = time.perf_counter()
+            
+            # Link/copy + decode run ahead on background threads (see _iter_staged)
+            imread = self._make_image_reader(cv2.imread) if self.gpu_decode else cv2.imread
+            input_hw = self._engine_input_hw(self.engine_path)
+            if input_hw is not None:
+                imread = self._fit_to_input(imread, input_hw, cv2)
+            link_modes = set()
+            staged = self._iter_staged(image_files, images_dir, imread,
+                                       prefetch=2 * self.batch_size + self.copy_workers,
+                                       workers=self.copy_workers, link_modes=link_modes)
+            
+            # Static-batch engines only take exactly their batch size: run full
+            # batches and pad short ones (the last one, or after unreadable images)
+            engine_batch = read_engine_batch(self.engine_path)
+            pad_batches = engine_batch is not None and not read_engine_dynamic(self.engine_path)
+            if pad_batches:
+                self.batch_size = engine_batch
+            
+            # Process images in batches: one model() call per batch amortizes the
+            # per-call Python/launch overhead and keeps the GPU busy
+            batch_paths: List[Path] = []
+            batch_imgs: List[np.ndarray] = []
+            for batch_start in range(0, total, self.batch_size):
                 if self._cancelled:
+                    staged.close()
                     self.inference_failed.emit("Cancelled by user")
                     return
                 
-                # Copy image (NEVER modifies source!)
-                # Source file is READ-ONLY in this operation
-                dest_image = images_dir / img_path.name
-                shutil.copy2(img_path, dest_image)
-                
-                # Paranoid check: Verify source file still exists
-                if not img_path.exists():
-                    self.inference_failed.emit(f"Source file disappeared: {img_path}")
-                    return
+                batch_paths.clear()
+                batch_imgs.clear()
+                for img_path, source_ok, img in itertools.islice(staged, self.batch_size):
+                    if not source_ok:
+                        staged.close()
+                        self.inference_failed.emit(f"Source file disappeared: {img_path}")
+                        return
+                    if img is None:
+                        continue
+                    batch_paths.append(img_path)
+                    batch_imgs.append(img)
                 
                 # Run inference
-                img = cv2.imread(str(img_path))
-                if img is None:
-                    continue
-                
-                results = model(img, conf=self.conf_threshold, verbose=False)
-                
-                # Save detections in YOLO format
-                label_file = labels_dir / f"{img_path.stem}.txt"
-                detections = results[0].boxes
-                num_detections = len(detections)
-                detection_counts.append(num_detections)
+                if batch_imgs:
+                    n_real = len(batch_imgs)
+                    if pad_batches and n_real < self.batch_size:
+                        # Repeat the final image; zip() below drops the extra results
+                        batch_imgs.extend([batch_imgs[-1]] * (self.batch_size - n_real))
+                    infer_start = time.perf_counter()
+                    results = model(batch_imgs, conf=self.conf_threshold, verbose=False)
+                    infer_ms[n_done:n_done + n_real] = \
+                        (time.perf_counter() - infer_start) * 1000 / n_real
+                else:
+                    results = []
                 
-                with open(label_file, 'w') as f:
-                    for box in detections:
-                        cls = int(box.cls[0])
-                        conf = float(box.conf[0])
-                        # Convert to YOLO format (x_center, y_center, width, height - normalized)
-                        x1, y1, x2, y2 = box.xyxy[0].tolist()
-                        h, w = img.shape[:2]
-                        x_center = ((x1 + x2) / 2) / w
-                        y_center = ((y1 + y2) / 2) / h
-                        width = (x2 - x1) / w
-                        height = (y2 - y1) / h
-                        f.write(f"{cls} {x_center:.6f} {y_center:.6f} {width:.6f} {height:.6f} {conf:.6f}\n")
+                for img_path, img, result in zip(batch_paths, batch_imgs, results):
+                    # Save detections in YOLO format
+                    label_file = labels_dir / f"{img_path.stem}.txt"
+                    detections = result.boxes
+                    num_detections = len(detections)
+                    detection_counts[n_done] = num_detections
+                    n_done += 1
+                    
+                    # One device->host transfer per image (boxes.data: x1, y1, x2, y2,
+                    # conf, cls) instead of a synchronizing copy each for cls/xywhn/conf;
+                    # YOLO format (x_center, y_center, width, height - normalized to the
+                    # image size) is derived on the host
+                    if num_detections:
+                        data = detections.data.cpu().numpy()
+                        img_h, img_w = result.orig_shape
+                        x1, y1, x2, y2 = data[:, 0], data[:, 1], data[:, 2], data[:, 3]
+                        rows = np.column_stack((
+                            data[:, 5],
+                            (x1 + x2) / (2 * img_w), (y1 + y2) / (2 * img_h),
+                            (x2 - x1) / img_w, (y2 - y1) / img_h,
+                            data[:, 4],
+                        ))
+                    else:
+                        rows = np.empty((0, 6))
+                    # Format the whole file in memory, then a single write syscall
+                    label_buf = io.BytesIO()
+                    np.savetxt(label_buf, rows, fmt=_LABEL_ROW_FMT)
+                    write_buffers(label_file, (label_buf.getbuffer(),))
                 
                 # Calculate current FPS
-                elapsed_so_far = time.time() - start_time
-                current_fps = (idx + 1) / elapsed_so_far if elapsed_so_far > 0 else 0
+                done = min(batch_start + self.batch_size, total)
+                elapsed_so_far = time.perf_counter() - start_time
+                current_fps = done / elapsed_so_far if elapsed_so_far > 0 else 0
                 
-                # Emit progress
-                self.progress_updated.emit(idx + 1, total, img_path.name, current_fps)
+                # Emit progress (once per batch)
+                last_name = batch_paths[-1].name if batch_paths else image_files[done - 1].name
+                self.progress_updated.emit(done, total, last_name, current_fps)
             
-            total_time = time.time() - start_time
+            total_time = time.perf_counter() - start_time
             
-            # Calculate statistics
-            total_detections = sum(detection_counts)
-            images_with_detections = sum(1 for count in detection_counts if count > 0)
-            images_empty = len(detection_counts) - images_with_detections
-            avg_detections = total_detections / len(detection_counts) if detection_counts else 0
+            # Calculate statistics (vectorized over the images actually processed)
+            detection_counts = detection_counts[:n_done]
+            infer_ms = infer_ms[:n_done]
+            total_detections = int(detection_counts.sum())
+            images_with_detections = int(np.count_nonzero(detection_counts))
+            images_empty = n_done - images_with_detections
+            avg_detections = total_detections / n_done if n_done else 0
             
             stats = {
                 'total_images': len(image_files),
@@ -481,7 +679,11 @@ class InferenceWorker(QThread):
                 'images_with_detections': images_with_detections,
                 'images_empty': images_empty,
                 'avg_detections_per_image': avg_detections,
+                'mean_inference_ms_per_image': float(infer_ms.mean()) if n_done else 0.0,
                 'conf_threshold': self.conf_threshold,
+                'batch_size': self.batch_size,
+                # How images/ entries were created: hardlink, reflink, symlink and/or copy
+                'image_link_mode': sorted(link_modes),
                 'engine_path': str(self.engine_path),
                 'test_folder': str(self.test_folder)
             }
@@ -495,6 +697,147 @@ class InferenceWorker(QThread):
             
         except Exception as e:
             self.inference_failed.emit(f"Error during inference: {str(e)}")
+    
+    @staticmethod
+    def _make_image_reader(cv_imread):
+        """Return an imread-compatible callable (path -> BGR array or None).
+        
+        With nvjpeg-python installed, JPEGs are decoded by nvJPEG on the GPU
+        (hardware decoder on Jetson) instead of libjpeg on the CPU cores that
+        also feed inference. PNGs and anything nvJPEG rejects go through OpenCV.
+        """
+        if NvJpeg is None:
+            return cv_imread
+        try:
+            NvJpeg()
+        except Exception:  # No usable CUDA device/driver
+            return cv_imread
+        
+        # One decoder handle per IO thread
+        local = threading.local()
+        
+        def read(path: str):
+            if path.lower().endswith(_JPEG_SUFFIXES):
+                decoder = getattr(local, "decoder", None)
+                if decoder is None:
+                    decoder = local.decoder = NvJpeg()
+                try:
+                    img = decoder.read(path)
+                except Exception:
+                    img = None
+                if img is not None:
+                    return img
+            return cv_imread(path)
+        
+        return read
+    
+    @staticmethod
+    def _engine_input_hw(engine_path: Path) -> Optional[Tuple[int, int]]:
+        """Return the (height, width) the engine was exported with, from its metadata."""
+        imgsz = _read_engine_metadata(engine_path).get('imgsz')
+        if isinstance(imgsz, int):
+            imgsz = [imgsz, imgsz]
+        if isinstance(imgsz, list) and len(imgsz) == 2 and all(isinstance(v, int) and v > 0 for v in imgsz):
+            return imgsz[0], imgsz[1]
+        return None
+    
+    @staticmethod
+    def _fit_to_input(imread, input_hw: Tuple[int, int], cv2):
+        """Wrap ``imread`` so images are also shrunk to fit the engine input.
+        
+        Runs the letterbox resize on the IO threads instead of inside model() on
+        the inference thread: same scale and interpolation as Ultralytics'
+        letterbox, which is then left with padding only. The saved labels are
+        normalized (xywhn), so the uniform scale doesn't change them.
+        """
+        in_h, in_w = input_hw
+        
+        def read(path: str):
+            img = imread(path)
+            if img is None:
+                return None
+            h, w = img.shape[:2]
+            r = min(in_h / h, in_w / w)
+            if r >= 1.0:
+                return img  # Upscaling is left to the letterbox (less data to move)
+            return cv2.resize(img, (int(round(w * r)), int(round(h * r))),
+                              interpolation=cv2.INTER_LINEAR)
+        
+        return read
+    
+    @staticmethod
+    def _link_or_copy(src: Path, dest: Path) -> str:
+        """Place ``src`` at ``dest`` without rewriting it if possible.
+        
+        Tries a hardlink, then a copy-on-write reflink (Btrfs/XFS/F2FS, e.g.
+        when hardlinks are not allowed), then a symlink (e.g. across
+        filesystems), then a real copy. Returns the mode used: "hardlink",
+        "reflink", "symlink" or "copy".
+        """
+        try:
+            os.link(src, dest)
+            return "hardlink"
+        except OSError:
+            pass
+        if InferenceWorker._reflink(src, dest):
+            return "reflink"
+        try:
+            os.symlink(src.resolve(), dest)
+            return "symlink"
+        except OSError:
+            shutil.copy2(src, dest)
+            return "copy"
+    
+    @staticmethod
+    def _reflink(src: Path, dest: Path) -> bool:
+        """Clone ``src`` to ``dest`` sharing its data blocks (FICLONE); False if unsupported."""
+        if fcntl is None:
+            return False
+        try:
+            with open(src, 'rb') as src_file, open(dest, 'xb') as dest_file:
+                try:
+                    fcntl.ioctl(dest_file.fileno(), _FICLONE, src_file.fileno())
+                    return True
+                except OSError:
+                    pass
+            # Filesystem can't clone: drop the empty destination again
+            os.unlink(dest)
+        except OSError:
+            pass
+        return False
+    
+    @staticmethod
+    def _iter_staged(image_files: List[Path], images_dir: Path, imread, prefetch: int,
+                     workers: int = 2, link_modes: Optional[set] = None):
+        """Yield (img_path, source_ok, decoded image or None) in order.
+        
+        Placing each image into the run folder and decoding it run on ``workers``
+        IO threads, up to ``prefetch`` images ahead of the consumer, so disk IO and
+        JPEG decode overlap with inference instead of stalling it. The placement
+        modes used (see _link_or_copy) are collected into ``link_modes``.
+        """
+        def stage(img_path: Path):
+            # Link/copy image (NEVER modifies source!)
+            # Source file is READ-ONLY in this operation
+            mode = InferenceWorker._link_or_copy(img_path, images_dir / img_path.name)
+            if link_modes is not None:
+                link_modes.add(mode)
+            
+            # Paranoid check: Verify source file still exists
+            if not img_path.exists():
+                return False, None
+            return True, imread(str(img_path))
+        
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bench-io") as pool:
+            remaining = iter(image_files)
+            pending = deque((path, pool.submit(stage, path)) for path in itertools.islice(remaining, prefetch))
+            while pending:
+                img_path, future = pending.popleft()
+                next_path = next(remaining, None)
+                if next_path is not None:
+                    pending.append((next_path, pool.submit(stage, next_path)))
+                source_ok, img = future.result()
+                yield img_path, source_ok, img
 
 
 class SVOScenarioWorker(QThread):
@@ -514,6 +857,9 @@ class SVOScenarioWorker(QThread):
     skip_frames_requested = Signal(int)  # Request to skip N frames
     frames_skipped = Signal(int, int)  # Frames skipped, new position
     
+    # Minimum interval between progress_updated emits (20 Hz is plenty for the UI)
+    PROGRESS_EMIT_INTERVAL = 0.05
+    
     def __init__(self, engine_path: Path, svo_path: Path, output_folder: Path,
                  conf_threshold: float = 0.25, save_images: bool = False,
                  save_annotations_only: bool = False, depth_mode: str = "NEURAL_PLUS",
@@ -530,7 +876,10 @@ class SVOScenarioWorker(QThread):
         self._cancelled = False
         self._paused = False  # Flag for pause/resume functionality
         self._start_benchmark = False  # Flag to start benchmark phase
+        self._start_event = threading.Event()  # Wakes run() as soon as start/cancel is requested
         self._skip_frames = 0  # Number of frames to skip (set by signal)
+        self._preview_pending = False  # A preview frame is queued and not yet shown
+        self.preview_size = None  # Max (width, height) of emitted preview frames
         self.scenario = None
         
         # Rolling window timing for 4-stage pipeline
@@ -548,18 +897,34 @@ class SVOScenarioWorker(QThread):
     def cancel(self):
         """Request cancellation of the worker."""
         self._cancelled = True
+        self._start_event.set()  # Unblock a worker still waiting for start
+    
+    def request_start(self):
+        """Start the benchmark phase once loading is done (safe to call from the GUI thread)."""
+        self._start_benchmark = True
+        self._start_event.set()
     
     def _set_start_flag(self):
         """Set flag to start benchmark processing."""
         print("[DEBUG] _set_start_flag called - setting _start_benchmark to True")
-        self._start_benchmark = True
+        self.request_start()
     
     def _set_skip_frames(self, count: int):
         """Set number of frames to skip (called from signal)."""
         self._skip_frames = count
     
+    def set_preview_size(self, width: int, height: int):
+        """Downscale emitted preview frames to fit (width, height); call before start()."""
+        self.preview_size = (width, height)
+    
+    def preview_consumed(self):
+        """Called by the GUI once it has displayed the last preview frame."""
+        self._preview_pending = False
+    
     def run(self):
         """Run SVO2 pipeline benchmark."""
+        _pin_current_thread(gui=False)
+        self.setPriority(QThread.Priority.HighPriority)
         try:
             from svo_handler.benchmark_scenarios import SVOPipelineScenario
             import numpy as np
@@ -570,10 +935,15 @@ class SVOScenarioWorker(QThread):
                     return
                 self.loading_progress.emit(progress, message)
             
-            def preview_callback(img_rgb: np.ndarray):
-                if self._cancelled:
-                    return
+            def preview_callback(img_rgb: np.ndarray) -> bool:
+                # Drop frames while the GUI is still behind on the previous one.
+                # img_rgb is one of the scenario's two reused buffers: returning
+                # False lets it refill the same buffer, never the one being shown.
+                if self._cancelled or self._preview_pending:
+                    return False
+                self._preview_pending = True
                 self.frame_processed.emit(img_rgb)
+                return True
             
             # Create and setup scenario
             self.scenario = SVOPipelineScenario()
@@ -592,7 +962,8 @@ class SVOScenarioWorker(QThread):
                 'depth_mode': self.depth_mode,
                 'depth_hz': self.depth_hz,
                 'loading_progress_callback': loading_callback,
-                'preview_callback': preview_callback  # Always provide callback, worker decides if to use it
+                'preview_callback': preview_callback,  # Always provide callback, worker decides if to use it
+                'preview_size': self.preview_size
             }
             
             if not self.scenario.setup(config):
@@ -608,12 +979,9 @@ class SVOScenarioWorker(QThread):
             
             # Phase 2: Wait for start signal
             print("[DEBUG] Worker: Waiting for start signal (_start_benchmark flag)...")
-            wait_count = 0
-            while not self._start_benchmark and not self._cancelled:
-                self.msleep(100)  # Wait 100ms
-                wait_count += 1
-                if wait_count % 10 == 0:  # Print every second
-                    print(f"[DEBUG] Still waiting... ({wait_count * 100}ms elapsed)")
+            wait_start = time.monotonic()
+            while not self._start_event.wait(timeout=1.0):
+                print(f"[DEBUG] Still waiting... ({(time.monotonic() - wait_start) * 1000:.0f}ms elapsed)")
             
             print(f"[DEBUG] Wait loop exited: _start_benchmark={self._start_benchmark}, _cancelled={self._cancelled}")
             
@@ -641,16 +1009,18 @@ class SVOScenarioWorker(QThread):
             start_time = time.time()
             total_frames = self.scenario.total_frames
             frames_processed = 0
-            detection_counts = []
-            all_timings = {'grab': [], 'inference': [], 'depth': [], 'housekeeping': []}
             
-            # Frame-to-frame timing
-            frame_intervals = []
-            last_frame_time = None
+            # Per-frame samples, preallocated for the whole SVO (grown if skips/
+            # frame counts ever exceed it): grab, inference, depth, housekeeping, frame ms
+            component_keys = ('grab', 'inference', 'depth', 'housekeeping')
+            FRAME_MS = len(component_keys)
+            capacity = max(total_frames, 1)
+            samples = np.empty((capacity, FRAME_MS + 1), dtype=np.float32)
+            detection_counts = np.empty(capacity, dtype=np.int32)
             
-            # Detection vs no-detection timing
-            frames_with_detections_times = []
-            frames_empty_times = []
+            # GUI progress throttling
+            emit_interval = self.PROGRESS_EMIT_INTERVAL
+            last_emit_time = 0.0
             
             # Process entire SVO file
             while not self._cancelled:
@@ -694,17 +1064,25 @@ class SVOScenarioWorker(QThread):
                 if result.get('skipped'):
                     continue
                 
+                if frames_processed == capacity:
+                    samples = np.concatenate((samples, np.empty_like(samples)))
+                    detection_counts = np.concatenate((detection_counts, np.empty_like(detection_counts)))
+                    capacity *= 2
+                row = samples[frames_processed]
                 frames_processed += 1
                 
                 # Get actual frame index from scenario (important for skip functionality)
                 actual_frame_index = result.get('frame_index', frames_processed)
                 
                 detections = result.get('detections', [])
-                detection_counts.append(len(detections))
+                detection_counts[frames_processed - 1] = len(detections)
                 
-                # Get mean depth from detections
-                depths = [d.get('depth_mean', -1) for d in detections if d.get('depth_mean', -1) > 0]
-                mean_depth = sum(depths) / len(depths) if depths else -1.0
+                # Get mean depth from detections (one masked reduction over the scenario's array)
+                depth_means = result.get('depth_means')
+                if depth_means is None:
+                    depth_means = np.array([d.get('depth_mean', -1) for d in detections], dtype=np.float32)
+                valid_depths = depth_means[depth_means > 0]
+                mean_depth = float(valid_depths.mean()) if valid_depths.size else -1.0
                 
                 # === HOUSEKEEPING STAGE START ===
                 housekeeping_start = time.time()
@@ -715,9 +1093,9 @@ class SVOScenarioWorker(QThread):
                 depth_time = result.get('timings', {}).get('depth', 0) * 1000
                 
                 # Accumulate timings for statistics
-                all_timings['grab'].append(grab_time)
-                all_timings['inference'].append(inference_time)
-                all_timings['depth'].append(depth_time)
+                row[0] = grab_time
+                row[1] = inference_time
+                row[2] = depth_time
                 
                 # Add to rolling windows
                 self.timing_windows['grab'].append(grab_time)
@@ -727,7 +1105,19 @@ class SVOScenarioWorker(QThread):
                 # Calculate housekeeping time (everything after depth extraction)
                 housekeeping_time = (time.time() - housekeeping_start) * 1000  # Convert to ms
                 self.timing_windows['housekeeping'].append(housekeeping_time)
-                all_timings['housekeeping'].append(housekeeping_time)
+                row[3] = housekeeping_time
+                
+                # Calculate FPS and frame timing
+                frame_time = time.time() - frame_start
+                fps = 1.0 / frame_time if frame_time > 0 else 0
+                row[FRAME_MS] = frame_time * 1000  # Convert to ms
+                
+                # Everything below only feeds the GUI: skip it between throttled emits
+                # (never for the last frame, so the final position always reaches the GUI)
+                now = time.monotonic()
+                if now - last_emit_time < emit_interval and actual_frame_index < total_frames - 1:
+                    continue
+                last_emit_time = now
                 
                 # Calculate rolling average percentages
                 component_percentages = {}
@@ -747,22 +1137,6 @@ class SVOScenarioWorker(QThread):
                             'housekeeping': (sum(self.timing_windows['housekeeping']) / len(self.timing_windows['housekeeping']) / total_avg) * 100
                         }
                 
-                # Calculate FPS and frame timing
-                frame_time = time.time() - frame_start
-                fps = 1.0 / frame_time if frame_time > 0 else 0
-                
-                # Track frame-to-frame intervals
-                if last_frame_time is not None:
-                    interval = frame_time
-                    frame_intervals.append(interval * 1000)  # Convert to ms
-                last_frame_time = frame_time
-                
-                # Track timing by detection status
-                if len(detections) > 0:
-                    frames_with_detections_times.append(frame_time * 1000)
-                else:
-                    frames_empty_times.append(frame_time * 1000)
-                
                 # Prepare depth visualization data if we have detections
                 depth_data = None
                 if len(detections) > 0 and mean_depth > 0:
@@ -791,43 +1165,44 @@ class SVOScenarioWorker(QThread):
             
             total_time = time.time() - start_time
             
-            # Calculate statistics
-            total_detections = sum(detection_counts)
-            frames_with_detections = sum(1 for count in detection_counts if count > 0)
-            frames_empty = len(detection_counts) - frames_with_detections
+            # Calculate statistics (float64 accumulation over the filled rows)
+            samples = samples[:frames_processed].astype(np.float64)
+            detection_counts = detection_counts[:frames_processed]
+            frame_times = samples[:, FRAME_MS]
+            has_detections = detection_counts > 0
+            
+            total_detections = int(detection_counts.sum())
+            frames_with_detections = int(has_detections.sum())
+            frames_empty = frames_processed - frames_with_detections
             
             # Component timing averages
-            component_times = {
-                key: sum(times) / len(times) if times else 0.0
-                for key, times in all_timings.items()
-            }
+            component_means = samples[:, :FRAME_MS].mean(axis=0) if frames_processed else np.zeros(FRAME_MS)
+            component_times = {key: float(value) for key, value in zip(component_keys, component_means)}
             
-            # Frame-to-frame interval statistics
-            import statistics
+            # Frame-to-frame interval statistics (from the second frame on)
+            frame_intervals = frame_times[1:]
             frame_interval_stats = {}
-            if frame_intervals:
+            if frame_intervals.size:
                 frame_interval_stats = {
-                    'mean': statistics.mean(frame_intervals),
-                    'median': statistics.median(frame_intervals),
-                    'stdev': statistics.stdev(frame_intervals) if len(frame_intervals) > 1 else 0.0,
-                    'min': min(frame_intervals),
-                    'max': max(frame_intervals)
+                    'mean': float(frame_intervals.mean()),
+                    'median': float(np.median(frame_intervals)),
+                    'stdev': float(frame_intervals.std(ddof=1)) if frame_intervals.size > 1 else 0.0,
+                    'min': float(frame_intervals.min()),
+                    'max': float(frame_intervals.max())
                 }
             
             # Detection vs no-detection timing comparison
-            detection_timing_comparison = {
-                'frames_with_detections': {
-                    'count': len(frames_with_detections_times),
-                    'mean_ms': statistics.mean(frames_with_detections_times) if frames_with_detections_times else 0.0,
-                    'median_ms': statistics.median(frames_with_detections_times) if frames_with_detections_times else 0.0,
-                    'stdev_ms': statistics.stdev(frames_with_detections_times) if len(frames_with_detections_times) > 1 else 0.0
-                },
-                'frames_empty': {
-                    'count': len(frames_empty_times),
-                    'mean_ms': statistics.mean(frames_empty_times) if frames_empty_times else 0.0,
-                    'median_ms': statistics.median(frames_empty_times) if frames_empty_times else 0.0,
-                    'stdev_ms': statistics.stdev(frames_empty_times) if len(frames_empty_times) > 1 else 0.0
+            def timing_summary(times: np.ndarray) -> dict:
+                return {
+                    'count': int(times.size),
+                    'mean_ms': float(times.mean()) if times.size else 0.0,
+                    'median_ms': float(np.median(times)) if times.size else 0.0,
+                    'stdev_ms': float(times.std(ddof=1)) if times.size > 1 else 0.0
                 }
+            
+            detection_timing_comparison = {
+                'frames_with_detections': timing_summary(frame_times[has_detections]),
+                'frames_empty': timing_summary(frame_times[~has_detections])
             }
             
             stats = {
@@ -865,6 +1240,77 @@ class SVOScenarioWorker(QThread):
                 self.scenario.cleanup()
 
 
+class _JsonDumpTask(QRunnable):
+    """Write a JSON snapshot on the thread pool (atomically, via a temp file)."""
+    
+    def __init__(self, path: Path, data: dict):
+        super().__init__()
+        self.path = path
+        self.data = data
+    
+    def run(self):
+        tmp_path = self.path.with_suffix(self.path.suffix + '.tmp')
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(self.data, f, indent=2)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"Warning: could not write {self.path}: {e}")
+
+
+# Separator lines for the validation summary dialog / summary text file
+_SUMMARY_RULE = "=" * 60
+_SUMMARY_SUBRULE = "-" * 60
+_REPORT_RULE = "=" * 70
+_REPORT_SUBRULE = "-" * 70
+
+# Validation viewer display size (images are fitted into this box)
+_VIEW_SIZE = (1400, 800)
+
+
+def _load_validation_frame(img_path: Path, label_path: Path) -> Tuple[QImage, np.ndarray]:
+    """Decode + fit an image to the viewer size and parse its label file.
+    
+    Returns the scaled QImage and an (N, 6) array of class, x_center, y_center,
+    width, height (normalized) and confidence. Safe to call off the GUI thread.
+    """
+    image = QImage(str(img_path))
+    if not image.isNull():
+        image = image.scaled(_VIEW_SIZE[0], _VIEW_SIZE[1], Qt.AspectRatioMode.KeepAspectRatio,
+                             Qt.TransformationMode.SmoothTransformation)
+    
+    try:
+        text = label_path.read_text()
+    except OSError:
+        text = ""
+    # Ground-truth style lines have no confidence column: pad it with 0
+    rows = [parts[:6] + ['0'] * (6 - len(parts)) for parts in map(str.split, text.splitlines()) if len(parts) >= 5]
+    try:
+        boxes = np.array(rows, dtype=np.float64).reshape(-1, 6)
+    except ValueError:
+        boxes = np.empty((0, 6))
+    return image, boxes
+
+
+class _FrameLoadSignals(QObject):
+    """Signal carrier for background frame loads (QRunnable cannot emit)."""
+    loaded = Signal(str, QImage, object)  # (image path, scaled image, boxes)
+
+
+class _FrameLoader(QRunnable):
+    """Prefetch a validation frame on the thread pool."""
+    
+    def __init__(self, img_path: Path, label_path: Path, signals: _FrameLoadSignals):
+        super().__init__()
+        self.img_path = img_path
+        self.label_path = label_path
+        self.signals = signals
+    
+    def run(self):
+        image, boxes = _load_validation_frame(self.img_path, self.label_path)
+        self.signals.loaded.emit(str(self.img_path), image, boxes)
+
+
 class ValidationViewer(QWidget):
     """Widget for manually validating inference results."""
     
@@ -877,10 +1323,7 @@ class ValidationViewer(QWidget):
         self.labels_dir = run_folder / "labels"
         
         # Load image list
-        self.image_files = []
-        for ext in ['*.jpg', '*.jpeg', '*.png', '*.JPG', '*.JPEG', '*.PNG']:
-            self.image_files.extend(self.images_dir.glob(ext))
-        self.image_files.sort()
+        self.image_files = sorted(_list_images(self.images_dir)) if self.images_dir.is_dir() else []
         
         # Check if we have images
         if not self.image_files:
@@ -894,8 +1337,28 @@ class ValidationViewer(QWidget):
         
         self.current_index = 0
         
+        # Drawing resources, built once
+        self._class_names = {0: 'target_close', 1: 'target_far'}
+        self._status_pens = {
+            'correct': QPen(QColor(76, 175, 80), 3),  # Green
+            'correct_plus_false': QPen(QColor(139, 195, 74), 3),  # Light green
+            'missed': QPen(QColor(255, 152, 0), 3),  # Orange
+            'false': QPen(QColor(244, 67, 54), 3),  # Red
+            'pending': QPen(QColor(33, 150, 243), 3)  # Blue
+        }
+        
+        # LRU of decoded frames: image path -> (scaled QPixmap, boxes array)
+        self._frame_cache: "OrderedDict[str, Tuple[QPixmap, np.ndarray]]" = OrderedDict()
+        self._frame_cache_size = 16
+        self._prefetching = set()
+        self._frame_signals = _FrameLoadSignals()
+        self._frame_signals.loaded.connect(self._on_frame_loaded)
+        
         # Load existing validations if any
+        # validations.json is the full snapshot written on finish; validations.jsonl
+        # is the per-click append log, replayed on top (later lines win)
         self.validations_file = run_folder / "validations.json"
+        self.validations_log = run_folder / "validations.jsonl"
         self.validations = {}
         if self.validations_file.exists():
             with open(self.validations_file, 'r') as f:
@@ -905,6 +1368,14 @@ class ValidationViewer(QWidget):
                     self.validations = loaded
                 else:
                     self.validations = {}
+        if self.validations_log.exists():
+            with open(self.validations_log, 'r') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                        self.validations[entry['img']] = entry['status']
+                    except (ValueError, KeyError, TypeError):
+                        continue  # Torn/corrupted line (e.g. crash mid-write)
         
         # Validation status options
         # 'correct': Perfect detection
@@ -989,88 +1460,113 @@ class ValidationViewer(QWidget):
         finish_btn.clicked.connect(self._finish_validation)
         layout.addWidget(finish_btn)
     
+    def _cache_frame(self, key: str, pixmap: QPixmap, boxes: np.ndarray):
+        """Insert a frame into the LRU, evicting the oldest entries."""
+        self._frame_cache[key] = (pixmap, boxes)
+        self._frame_cache.move_to_end(key)
+        while len(self._frame_cache) > self._frame_cache_size:
+            self._frame_cache.popitem(last=False)
+    
+    def _get_frame(self, img_path: Path) -> Tuple[QPixmap, np.ndarray]:
+        """Return the (scaled pixmap, boxes) for an image, loading it if not cached."""
+        key = str(img_path)
+        cached = self._frame_cache.get(key)
+        if cached is not None:
+            self._frame_cache.move_to_end(key)
+            return cached
+        image, boxes = _load_validation_frame(img_path, self.labels_dir / f"{img_path.stem}.txt")
+        pixmap = QPixmap.fromImage(image)
+        self._cache_frame(key, pixmap, boxes)
+        return pixmap, boxes
+    
+    def _prefetch(self, index: int):
+        """Load a neighbouring frame into the cache on the thread pool."""
+        if not 0 <= index < len(self.image_files):
+            return
+        img_path = self.image_files[index]
+        key = str(img_path)
+        if key in self._frame_cache or key in self._prefetching:
+            return
+        self._prefetching.add(key)
+        QThreadPool.globalInstance().start(
+            _FrameLoader(img_path, self.labels_dir / f"{img_path.stem}.txt", self._frame_signals))
+    
+    def _on_frame_loaded(self, key: str, image: QImage, boxes: np.ndarray):
+        """Store a prefetched frame (QPixmaps may only be created on the GUI thread)."""
+        self._prefetching.discard(key)
+        if key not in self._frame_cache:
+            self._cache_frame(key, QPixmap.fromImage(image), boxes)
+    
     def _load_image(self):
         """Load and display current image with detections."""
         if not self.image_files:
             return
         
         img_path = self.image_files[self.current_index]
-        label_path = self.labels_dir / f"{img_path.stem}.txt"
         
         # Update info
         self.counter_label.setText(f"Image {self.current_index + 1} / {len(self.image_files)}")
         self.filename_label.setText(img_path.name)
         
-        # Load image
-        pixmap = QPixmap(str(img_path))
+        # Load image (already fitted to the view) and its parsed detections
+        base_pixmap, boxes = self._get_frame(img_path)
+        pixmap = base_pixmap.copy()
         
-        # Load detections and draw boxes
-        if label_path.exists():
+        # Draw boxes
+        if len(boxes):
             painter = QPainter(pixmap)
             
+            # Axis-aligned outlines gain nothing from antialiasing
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing, False)
+            
             # Get current validation status for color
             img_name = img_path.name
             status = self.validations.get(img_name, 'pending')
-            
-            # Color based on status
-            color_map = {
-                'correct': QColor(76, 175, 80),  # Green
-                'correct_plus_false': QColor(139, 195, 74),  # Light green
-                'missed': QColor(255, 152, 0),  # Orange
-                'false': QColor(244, 67, 54),  # Red
-                'pending': QColor(33, 150, 243)  # Blue
-            }
-            color = color_map.get(status, QColor(33, 150, 243))
-            
-            pen = QPen(color, 3)
-            painter.setPen(pen)
+            painter.setPen(self._status_pens.get(status, self._status_pens['pending']))
             
             img_w = pixmap.width()
             img_h = pixmap.height()
             
-            with open(label_path, 'r') as f:
-                for line in f:
-                    parts = line.strip().split()
-                    if len(parts) < 5:
-                        continue
-                    
-                    cls_id = int(parts[0])
-                    x_center = float(parts[1]) * img_w
-                    y_center = float(parts[2]) * img_h
-                    width = float(parts[3]) * img_w
-                    height = float(parts[4]) * img_h
-                    conf = float(parts[5]) if len(parts) > 5 else 0.0
-                    
-                    x1 = int(x_center - width / 2)
-                    y1 = int(y_center - height / 2)
-                    x2 = int(x_center + width / 2)
-                    y2 = int(y_center + height / 2)
-                    
-                    painter.drawRect(x1, y1, x2 - x1, y2 - y1)
-                    
-                    # Draw label
-                    class_names = ['target_close', 'target_far']
-                    label = f"{class_names[cls_id] if cls_id < len(class_names) else f'class_{cls_id}'} {conf:.2f}"
-                    painter.drawText(x1, y1 - 5, label)
+            # Corner coordinates in display pixels for all boxes at once
+            x_center = boxes[:, 1] * img_w
+            y_center = boxes[:, 2] * img_h
+            half_w = boxes[:, 3] * img_w / 2
+            half_h = boxes[:, 4] * img_h / 2
+            x1 = (x_center - half_w).astype(int)
+            y1 = (y_center - half_h).astype(int)
+            x2 = (x_center + half_w).astype(int)
+            y2 = (y_center + half_h).astype(int)
+            
+            # All outlines in one call, then the labels
+            painter.drawRects([QRect(bx1, by1, bx2 - bx1, by2 - by1)
+                               for bx1, by1, bx2, by2 in zip(x1.tolist(), y1.tolist(), x2.tolist(), y2.tolist())])
+            
+            class_names = self._class_names
+            for cls_id, conf, bx1, by1 in zip(boxes[:, 0].astype(int).tolist(), boxes[:, 5].tolist(),
+                                             x1.tolist(), y1.tolist()):
+                name = class_names.get(cls_id) or f'class_{cls_id}'
+                painter.drawText(bx1, by1 - 5, f"{name} {conf:.2f}")
             
             painter.end()
         
-        # Scale image to fit window while maintaining aspect ratio
-        scaled_pixmap = pixmap.scaled(1400, 800, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-        self.image_label.setPixmap(scaled_pixmap)
+        self.image_label.setPixmap(pixmap)
         
         # Update button states
         self.prev_btn.setEnabled(self.current_index > 0)
         self.next_btn.setEnabled(self.current_index < len(self.image_files) - 1)
+        
+        # Warm the cache for Prev/Next
+        self._prefetch(self.current_index + 1)
+        self._prefetch(self.current_index - 1)
     
     def _mark_validation(self, status: str):
         """Mark current image with validation status."""
         img_name = self.image_files[self.current_index].name
         self.validations[img_name] = status
         
-        # Save validations
-        with open(self.validations_file, 'w') as f:
-            json.dump(self.validations, f, indent=2)
+        # Append to the log (one small write per click instead of re-dumping everything)
+        with open(self.validations_log, 'a') as f:
+            f.write(json.dumps({'img': img_name, 'status': status}) + "\n")
         
         # Reload to update color
         self._load_image()
@@ -1109,6 +1605,9 @@ class ValidationViewer(QWidget):
             if reply == QMessageBox.StandardButton.No:
                 return
         
+        # Write the full snapshot off the GUI thread
+        QThreadPool.globalInstance().start(_JsonDumpTask(self.validations_file, dict(self.validations)))
+        
         # Generate report
         report_data = self._generate_report()
         
@@ -1134,8 +1633,14 @@ class ValidationViewer(QWidget):
             status = self.validations.get(img_file.name, 'pending')
             status_counts[status] = status_counts.get(status, 0) + 1
         
+        # Bind the counts/lookups used repeatedly below to locals
+        sc = status_counts
+        pending = sc['pending']
+        validated = total - pending
+        now = datetime.now()
+        
         # Calculate success rate (correct + correct_plus_false)
-        successful = status_counts['correct'] + status_counts['correct_plus_false']
+        successful = sc['correct'] + sc['correct_plus_false']
         success_rate = (successful / total * 100) if total > 0 else 0
         
         # Load inference stats if available
@@ -1148,52 +1653,57 @@ class ValidationViewer(QWidget):
         # Create report
         report = {
             'run_folder': str(self.run_folder),
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': now.isoformat(),
             'total_images': total,
-            'validated_images': total - status_counts['pending'],
+            'validated_images': validated,
             'validation_status_counts': status_counts,
             'success_rate_percent': round(success_rate, 2),
             'inference_stats': inference_stats
         }
         
-        # Save JSON report
+        # Save JSON report (machine-readable, so compact; validation_summary.txt is for humans)
         report_file = self.run_folder / "validation_report.json"
         with open(report_file, 'w') as f:
-            json.dump(report, f, indent=2)
+            f.write(json.dumps(report, separators=(',', ':')))
         
-        # Save human-readable summary
+        # Save human-readable summary (built in memory, one write)
         summary_file = self.run_folder / "validation_summary.txt"
-        with open(summary_file, 'w') as f:
-            f.write("=" * 70 + "\n")
-            f.write("VALIDATION SUMMARY\n")
-            f.write("=" * 70 + "\n\n")
-            f.write(f"Run Folder: {self.run_folder}\n")
-            f.write(f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-            f.write(f"Total Images: {total}\n")
-            f.write(f"Validated: {total - status_counts['pending']}\n")
-            f.write(f"Pending: {status_counts['pending']}\n\n")
-            f.write("-" * 70 + "\n")
-            f.write("VALIDATION RESULTS\n")
-            f.write("-" * 70 + "\n")
-            f.write(f"✓ Correct Detections: {status_counts['correct']}\n")
-            f.write(f"✓+ Correct + False Positives: {status_counts['correct_plus_false']}\n")
-            f.write(f"✗ Missed Detections: {status_counts['missed']}\n")
-            f.write(f"⚠ False Detections Only: {status_counts['false']}\n\n")
-            f.write(f"Overall Success Rate: {success_rate:.2f}%\n")
-            f.write(f"  (Correct + Correct w/ False Positives)\n\n")
-            
-            if inference_stats:
-                f.write("-" * 70 + "\n")
-                f.write("INFERENCE PERFORMANCE\n")
-                f.write("-" * 70 + "\n")
-                f.write(f"Mean FPS: {inference_stats.get('mean_fps', 0):.2f}\n")
-                f.write(f"Mean Latency: {inference_stats.get('mean_latency_ms', 0):.2f} ms\n")
-                f.write(f"Total Detections: {inference_stats.get('total_detections', 0)}\n")
-                f.write(f"Images with Detections: {inference_stats.get('images_with_detections', 0)}\n")
-                f.write(f"Images Empty: {inference_stats.get('images_empty', 0)}\n")
-                f.write(f"Avg Detections per Image: {inference_stats.get('avg_detections_per_image', 0):.2f}\n\n")
-            
-            f.write("=" * 70 + "\n")
+        buf = io.StringIO()
+        write = buf.write
+        write(_REPORT_RULE + "\n")
+        write("VALIDATION SUMMARY\n")
+        write(_REPORT_RULE + "\n\n")
+        write(f"Run Folder: {self.run_folder}\n")
+        write(f"Date: {now:%Y-%m-%d %H:%M:%S}\n\n")
+        write(f"Total Images: {total}\n")
+        write(f"Validated: {validated}\n")
+        write(f"Pending: {pending}\n\n")
+        write(_REPORT_SUBRULE + "\n")
+        write("VALIDATION RESULTS\n")
+        write(_REPORT_SUBRULE + "\n")
+        write(f"✓ Correct Detections: {sc['correct']}\n")
+        write(f"✓+ Correct + False Positives: {sc['correct_plus_false']}\n")
+        write(f"✗ Missed Detections: {sc['missed']}\n")
+        write(f"⚠ False Detections Only: {sc['false']}\n\n")
+        write(f"Overall Success Rate: {success_rate:.2f}%\n")
+        write(f"  (Correct + Correct w/ False Positives)\n\n")
+        
+        if inference_stats:
+            ist = inference_stats.get
+            write(_REPORT_SUBRULE + "\n")
+            write("INFERENCE PERFORMANCE\n")
+            write(_REPORT_SUBRULE + "\n")
+            write(f"Mean FPS: {ist('mean_fps', 0):.2f}\n")
+            write(f"Mean Latency: {ist('mean_latency_ms', 0):.2f} ms\n")
+            write(f"Total Detections: {ist('total_detections', 0)}\n")
+            write(f"Images with Detections: {ist('images_with_detections', 0)}\n")
+            write(f"Images Empty: {ist('images_empty', 0)}\n")
+            write(f"Avg Detections per Image: {ist('avg_detections_per_image', 0):.2f}\n\n")
+        
+        write(_REPORT_RULE + "\n")
+        
+        with open(summary_file, 'w', buffering=1 << 16) as f:
+            f.write(buf.getvalue())
         
         # Return report data for summary dialog
         return report
@@ -1205,51 +1715,91 @@ class ValidationViewer(QWidget):
         total = report['total_images']
         inference_stats = report.get('inference_stats', {})
         
+        # Hoisted counts and a single guarded scale factor for the percentages
+        correct = status_counts['correct']
+        correct_false = status_counts['correct_plus_false']
+        missed = status_counts['missed']
+        false_only = status_counts['false']
+        pending = status_counts['pending']
+        to_percent = 100.0 / total if total else 0.0
+        
         # Build summary message
-        summary = "=" * 60 + "\n"
-        summary += "📊 VALIDATION SUMMARY\n"
-        summary += "=" * 60 + "\n\n"
+        buf = io.StringIO()
+        buf.write(_SUMMARY_RULE + "\n")
+        buf.write("📊 VALIDATION SUMMARY\n")
+        buf.write(_SUMMARY_RULE + "\n\n")
         
-        summary += f"✅ Overall Success Rate: {success_rate:.1f}%\n"
-        summary += f"   ({status_counts['correct'] + status_counts['correct_plus_false']} of {total} images)\n\n"
+        buf.write(f"✅ Overall Success Rate: {success_rate:.1f}%\n")
+        buf.write(f"   ({correct + correct_false} of {total} images)\n\n")
         
-        summary += "VALIDATION BREAKDOWN:\n"
-        summary += f"  ✓  Perfect Detections:      {status_counts['correct']:>3} ({status_counts['correct']/total*100:.1f}%)\n"
-        summary += f"  ✓+ Correct + False Pos:     {status_counts['correct_plus_false']:>3} ({status_counts['correct_plus_false']/total*100:.1f}%)\n"
-        summary += f"  ✗  Missed Detections:       {status_counts['missed']:>3} ({status_counts['missed']/total*100:.1f}%)\n"
-        summary += f"  ⚠  False Detections Only:   {status_counts['false']:>3} ({status_counts['false']/total*100:.1f}%)\n"
+        buf.write("VALIDATION BREAKDOWN:\n")
+        buf.write(f"  ✓  Perfect Detections:      {correct:>3} ({correct * to_percent:.1f}%)\n")
+        buf.write(f"  ✓+ Correct + False Pos:     {correct_false:>3} ({correct_false * to_percent:.1f}%)\n")
+        buf.write(f"  ✗  Missed Detections:       {missed:>3} ({missed * to_percent:.1f}%)\n")
+        buf.write(f"  ⚠  False Detections Only:   {false_only:>3} ({false_only * to_percent:.1f}%)\n")
         
-        if status_counts['pending'] > 0:
-            summary += f"  ⏸  Pending (not validated): {status_counts['pending']:>3}\n"
+        if pending > 0:
+            buf.write(f"  ⏸  Pending (not validated): {pending:>3}\n")
         
         if inference_stats:
-            summary += "\n" + "-" * 60 + "\n"
-            summary += "⚡ PERFORMANCE METRICS:\n"
-            summary += f"  Mean FPS:            {inference_stats.get('mean_fps', 0):.2f}\n"
-            summary += f"  Mean Latency:        {inference_stats.get('mean_latency_ms', 0):.2f} ms\n"
-            summary += f"  Total Detections:    {inference_stats.get('total_detections', 0)}\n"
-            summary += f"  Images w/ Objects:   {inference_stats.get('images_with_detections', 0)}\n"
-            summary += f"  Images Empty:        {inference_stats.get('images_empty', 0)}\n"
-        
-        summary += "\n" + "=" * 60 + "\n"
-        summary += f"📁 Reports saved to:\n   {self.run_folder}\n"
-        summary += "=" * 60
+            ist = inference_stats.get
+            buf.write("\n" + _SUMMARY_SUBRULE + "\n")
+            buf.write("⚡ PERFORMANCE METRICS:\n")
+            buf.write(f"  Mean FPS:            {ist('mean_fps', 0):.2f}\n")
+            buf.write(f"  Mean Latency:        {ist('mean_latency_ms', 0):.2f} ms\n")
+            buf.write(f"  Total Detections:    {ist('total_detections', 0)}\n")
+            buf.write(f"  Images w/ Objects:   {ist('images_with_detections', 0)}\n")
+            buf.write(f"  Images Empty:        {ist('images_empty', 0)}\n")
+        
+        buf.write("\n" + _SUMMARY_RULE + "\n")
+        buf.write(f"📁 Reports saved to:\n   {self.run_folder}\n")
+        buf.write(_SUMMARY_RULE)
         
         # Show in dialog with monospace font for alignment
         msg_box = QMessageBox(self)
         msg_box.setWindowTitle("Validation Complete ✅")
         msg_box.setText("Validation completed successfully!")
-        msg_box.setDetailedText(summary)
+        msg_box.setDetailedText(buf.getvalue())
         msg_box.setIcon(QMessageBox.Icon.Information)
         
-        # Set monospace font for detailed text
-        font = QFont("Courier New", 9)
+        # One font instance shared by all dialog buttons
+        button_font = QFont("Arial", 10)
         for button in msg_box.buttons():
-            button.setFont(QFont("Arial", 10))
+            button.setFont(button_font)
         
         msg_box.exec()
 
 
+class _ImageCountSignals(QObject):
+    """Signal carrier for background image counts (QRunnable cannot emit)."""
+    count_ready = Signal(int, int)  # (scan token, image count or -1 if unreadable)
+
+
+class _ImageCountTask(QRunnable):
+    """Count the images in a folder on the thread pool."""
+    
+    def __init__(self, folder: Path, token: int, signals: _ImageCountSignals):
+        super().__init__()
+        self.folder = folder
+        self.token = token
+        self.signals = signals
+    
+    def run(self):
+        try:
+            count = _count_images(self.folder)
+        except OSError:
+            count = -1
+        self.signals.count_ready.emit(self.token, count)
+
+
+# Button stylesheets shared by several widgets (the pause button swaps between two at runtime)
+_QSS_BTN_START = "background-color: #4CAF50; color: white; font-size: 13px; padding: 12px;"
+_QSS_BTN_LOAD = "background-color: #2196F3; color: white; font-size: 12px; padding: 10px;"
+_QSS_BTN_PAUSE = "background-color: #FF9800; color: white; font-size: 11px; padding: 8px;"
+_QSS_BTN_RESUME = "background-color: #4CAF50; color: white; font-size: 11px; padding: 8px;"
+_QSS_BTN_STOP = "background-color: #F44336; color: white; font-size: 11px; padding: 8px;"
+
+
 class JetsonBenchmarkApp(QMainWindow):
     """Main application window for Jetson benchmarking."""
     
@@ -1260,6 +1810,33 @@ class JetsonBenchmarkApp(QMainWindow):
         
         self.worker = None
         self.validation_viewer = None
+        # Loaded model of the last inference run: (engine path, engine mtime_ns, YOLO model).
+        # Reused by the next run on the same unchanged engine, skipping engine deserialization
+        self._cached_model = None
+        
+        # Rescan the test folder only once typing pauses (textChanged fires per keystroke)
+        self._folder_debounce = QTimer(self)
+        self._folder_debounce.setSingleShot(True)
+        self._folder_debounce.setInterval(250)
+        self._folder_debounce.timeout.connect(self._do_folder_scan)
+        
+        # Log lines are buffered and appended to the output in one block per
+        # 100 ms (each QTextEdit.append relayouts the document)
+        self._log_buffer: deque = deque()
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(100)
+        self._log_timer.timeout.connect(self._flush_logs)
+        self._last_status_update = 0.0  # Inference progress status bar throttling (see _on_progress)
+        
+        # SVO progress widget/log throttling (see _on_svo_progress)
+        self._last_ui_update = 0.0
+        self._last_log_time = 0.0
+        self._loading_log: List[str] = []  # SVO loading steps, logged once loading ends
+        self._last_load_pct = -5  # Last loading progress shown in the dialog
+        self._scan_token = 0  # Latest scan; results of older scans are dropped
+        self._scan_signals = _ImageCountSignals()
+        self._scan_signals.count_ready.connect(self._update_image_count)
         
         # Use stacked widget to switch between views
         self.stacked_widget = QStackedWidget()
@@ -1312,8 +1889,13 @@ class JetsonBenchmarkApp(QMainWindow):
         engine_browse_btn = QPushButton("Browse")
         engine_browse_btn.clicked.connect(self._browse_engine)
         engine_browse_btn.setMaximumWidth(80)
+        reload_engine_btn = QPushButton("Reload")
+        reload_engine_btn.setToolTip("Drop the cached engine; the next run loads it from disk again")
+        reload_engine_btn.clicked.connect(self._reload_engine)
+        reload_engine_btn.setMaximumWidth(80)
         engine_layout.addWidget(self.engine_edit)
         engine_layout.addWidget(engine_browse_btn)
+        engine_layout.addWidget(reload_engine_btn)
         engine_group.setLayout(engine_layout)
         left_layout.addWidget(engine_group)
         
@@ -1357,6 +1939,26 @@ class JetsonBenchmarkApp(QMainWindow):
         self.use_all_check = QCheckBox("Use all")
         self.use_all_check.toggled.connect(self._toggle_max_images)
         images_control_layout.addWidget(self.use_all_check)
+        
+        self.batch_size_spin = QSpinBox()
+        self.batch_size_spin.setRange(1, 32)
+        self.batch_size_spin.setValue(1)
+        self.batch_size_spin.setToolTip(
+            "Images per inference call.\n"
+            "Values > 1 need an engine exported with that batch size (or dynamic=True)."
+        )
+        images_control_layout.addWidget(QLabel("Batch:"))
+        images_control_layout.addWidget(self.batch_size_spin)
+        
+        self.gpu_decode_check = QCheckBox("GPU JPEG decode")
+        self.gpu_decode_check.setChecked(NvJpeg is not None)
+        self.gpu_decode_check.setEnabled(NvJpeg is not None)
+        self.gpu_decode_check.setToolTip(
+            "Decode JPEGs with nvJPEG (Jetson hardware decoder) instead of OpenCV on the CPU."
+            if NvJpeg is not None else
+            "Needs nvjpeg-python (pip install nvjpeg-python)."
+        )
+        images_control_layout.addWidget(self.gpu_decode_check)
         images_control_layout.addStretch()
         
         images_layout.addLayout(images_control_layout)
@@ -1430,18 +2032,18 @@ class JetsonBenchmarkApp(QMainWindow):
         
         # Control buttons
         self.run_btn = QPushButton("▶ Run Benchmark")
-        self.run_btn.setStyleSheet("background-color: #4CAF50; color: white; font-size: 13px; padding: 12px;")
+        self.run_btn.setStyleSheet(_QSS_BTN_START)
         self.run_btn.clicked.connect(self._run_benchmark)
         left_layout.addWidget(self.run_btn)
         
         self.svo_load_btn = QPushButton("🔄 Initialize SVO2")
-        self.svo_load_btn.setStyleSheet("background-color: #2196F3; color: white; font-size: 12px; padding: 10px;")
+        self.svo_load_btn.setStyleSheet(_QSS_BTN_LOAD)
         self.svo_load_btn.clicked.connect(self._load_svo)
         self.svo_load_btn.setVisible(False)
         left_layout.addWidget(self.svo_load_btn)
         
         self.svo_start_btn = QPushButton("▶ Start Processing")
-        self.svo_start_btn.setStyleSheet("background-color: #4CAF50; color: white; font-size: 13px; padding: 12px;")
+        self.svo_start_btn.setStyleSheet(_QSS_BTN_START)
         self.svo_start_btn.clicked.connect(self._start_svo_processing)
         self.svo_start_btn.setVisible(False)
         self.svo_start_btn.setEnabled(False)
@@ -1451,14 +2053,14 @@ class JetsonBenchmarkApp(QMainWindow):
         control_layout = QHBoxLayout()
         
         self.pause_btn = QPushButton("⏸ Pause")
-        self.pause_btn.setStyleSheet("background-color: #FF9800; color: white; font-size: 11px; padding: 8px;")
+        self.pause_btn.setStyleSheet(_QSS_BTN_PAUSE)
         self.pause_btn.clicked.connect(self._toggle_pause)
         self.pause_btn.setVisible(False)
         self.pause_btn.setEnabled(False)
         control_layout.addWidget(self.pause_btn)
         
         self.stop_btn = QPushButton("⏹ Stop")
-        self.stop_btn.setStyleSheet("background-color: #F44336; color: white; font-size: 11px; padding: 8px;")
+        self.stop_btn.setStyleSheet(_QSS_BTN_STOP)
         self.stop_btn.clicked.connect(self._stop_benchmark)
         self.stop_btn.setVisible(False)
         self.stop_btn.setEnabled(False)
@@ -1632,9 +2234,7 @@ class JetsonBenchmarkApp(QMainWindow):
         output_group.setLayout(output_layout)
         main_layout.addWidget(output_group)
         
-        self.output_text.append("Ready. Select scenario and configure settings.")
-        
-        self.output_text.append("Ready. Select scenario, engine, and input to begin.")
+        self._log("Ready. Select scenario, engine, and input to begin.")
         
         # Initialize with Pure Inference mode
         self._on_scenario_changed(0)
@@ -1643,6 +2243,18 @@ class JetsonBenchmarkApp(QMainWindow):
         self.svo_worker = None
         self.svo_loaded = False
     
+    def _log(self, text: str):
+        """Queue a line for the output log (flushed by _log_timer)."""
+        self._log_buffer.append(text)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+    
+    def _flush_logs(self):
+        """Append all queued log lines to the output log at once."""
+        if self._log_buffer:
+            self.output_text.append("\n".join(self._log_buffer))
+            self._log_buffer.clear()
+    
     def _lock_svo_options(self):
         """Lock SVO2 options during initialization/processing."""
         self.depth_mode_combo.setEnabled(False)
@@ -1773,25 +2385,25 @@ class JetsonBenchmarkApp(QMainWindow):
         }
         depth_hz = depth_hz_map.get(self.depth_hz_combo.currentIndex(), None)
         
-        self.output_text.append("\n" + "=" * 70)
-        self.output_text.append("🎬 SVO2 PIPELINE BENCHMARK")
-        self.output_text.append("=" * 70)
-        self.output_text.append(f"📹 SVO2 File: {svo_path.name}")
-        self.output_text.append(f"🤖 Engine: {engine_path.name}")
-        self.output_text.append(f"📁 Output: {run_folder}")
-        self.output_text.append(f"🧠 Depth Mode: {depth_mode}")
+        self._log("\n" + "=" * 70)
+        self._log("🎬 SVO2 PIPELINE BENCHMARK")
+        self._log("=" * 70)
+        self._log(f"📹 SVO2 File: {svo_path.name}")
+        self._log(f"🤖 Engine: {engine_path.name}")
+        self._log(f"📁 Output: {run_folder}")
+        self._log(f"🧠 Depth Mode: {depth_mode}")
         
         if depth_hz is None:
-            self.output_text.append(f"⚡ Depth Refresh: Every frame (highest accuracy)")
+            self._log(f"⚡ Depth Refresh: Every frame (highest accuracy)")
         else:
-            self.output_text.append(f"⚡ Depth Refresh: {depth_hz} Hz (frame skipping enabled)")
+            self._log(f"⚡ Depth Refresh: {depth_hz} Hz (frame skipping enabled)")
         
-        self.output_text.append("\n⏳ Loading SVO2 file with AI depth...")
-        self.output_text.append("   This can take 30-60 seconds for initialization...")
+        self._log("\n⏳ Loading SVO2 file with AI depth...")
+        self._log("   This can take 30-60 seconds for initialization...")
         
         # Clean up old worker if exists
         if self.svo_worker is not None:
-            self.output_text.append("⚠️ Cleaning up previous SVO2 worker...")
+            self._log("⚠️ Cleaning up previous SVO2 worker...")
             self.svo_worker.cancel()
             if self.svo_worker.scenario:
                 self.svo_worker.scenario.cleanup()
@@ -1806,6 +2418,7 @@ class JetsonBenchmarkApp(QMainWindow):
         
         # Show progress dialog
         self.loading_dialog = QProgressDialog("Initializing SVO2 file...", "Cancel", 0, 100, self)
+        self._last_load_pct = -5
         self.loading_dialog.setWindowTitle("Loading SVO2")
         self.loading_dialog.setWindowModality(Qt.WindowModality.WindowModal)
         self.loading_dialog.setMinimumDuration(0)
@@ -1818,6 +2431,9 @@ class JetsonBenchmarkApp(QMainWindow):
                                             conf_threshold=0.25, save_images=save_images,
                                             save_annotations_only=save_annotations_only,
                                             depth_mode=depth_mode, depth_hz=depth_hz)
+        # Previews never need more pixels than the preview label can show
+        self.svo_worker.set_preview_size(self.preview_label.maximumWidth(),
+                                         self.preview_label.maximumHeight())
         self.svo_worker.loading_progress.connect(self._on_svo_loading_progress)
         self.svo_worker.loading_complete.connect(self._on_svo_loading_complete)
         self.svo_worker.loading_failed.connect(self._on_svo_loading_failed)
@@ -1826,9 +2442,21 @@ class JetsonBenchmarkApp(QMainWindow):
     
     def _on_svo_loading_progress(self, progress: int, message: str):
         """Handle SVO loading progress."""
+        # Logged in one block once loading finishes (see _flush_loading_log)
+        self._loading_log.append(f"   [{progress}%] {message}")
+        
+        # Only repaint the dialog for steps of at least 5% (and always at 100%)
+        if progress - self._last_load_pct < 5 and progress < 100:
+            return
+        self._last_load_pct = progress
         self.loading_dialog.setValue(progress)
         self.loading_dialog.setLabelText(message)
-        self.output_text.append(f"   [{progress}%] {message}")
+    
+    def _flush_loading_log(self):
+        """Queue the collected loading steps for the output log in one go."""
+        if self._loading_log:
+            self._log("\n".join(self._loading_log))
+            self._loading_log.clear()
     
     def _on_svo_loading_complete(self):
         """Handle SVO loading completion."""
@@ -1836,9 +2464,12 @@ class JetsonBenchmarkApp(QMainWindow):
         self.svo_loaded = True
         self.svo_start_btn.setEnabled(True)
         
-        self.output_text.append("\n✅ SVO2 file loaded successfully!")
-        self.output_text.append(f"📊 Total frames: {self.svo_worker.scenario.total_frames}")
-        self.output_text.append("\n👉 Click 'Start Processing' to begin benchmark")
+        self._flush_loading_log()
+        self._log(
+            "\n✅ SVO2 file loaded successfully!\n"
+            f"📊 Total frames: {self.svo_worker.scenario.total_frames}\n"
+            "\n👉 Click 'Start Processing' to begin benchmark"
+        )
         
         QMessageBox.information(
             self,
@@ -1853,12 +2484,13 @@ class JetsonBenchmarkApp(QMainWindow):
         self.loading_dialog.close()
         self.svo_load_btn.setEnabled(True)
         self._unlock_svo_options()  # Unlock options on failure
-        self.output_text.append(f"\n❌ Loading failed: {error_msg}")
+        self._flush_loading_log()
+        self._log(f"\n❌ Loading failed: {error_msg}")
         QMessageBox.critical(self, "Loading Failed", f"Failed to load SVO2 file:\n\n{error_msg}")
     
     def _on_frames_skipped(self, skipped_count: int, new_position: int):
         """Handle frames skipped notification."""
-        self.output_text.append(f"✅ Skipped {skipped_count} frames → Now at frame {new_position}")
+        self._log(f"✅ Skipped {skipped_count} frames → Now at frame {new_position}")
         self.statusBar().showMessage(f"Skipped to frame {new_position}")
     
     def _start_svo_processing(self):
@@ -1867,7 +2499,7 @@ class JetsonBenchmarkApp(QMainWindow):
             QMessageBox.warning(self, "Error", "SVO2 file not loaded")
             return
         
-        self.output_text.append("\n🚀 Starting SVO2 processing...")
+        self._log("\n🚀 Starting SVO2 processing...")
         
         # Reset statistics
         self.progress_bar.setValue(0)
@@ -1899,9 +2531,9 @@ class JetsonBenchmarkApp(QMainWindow):
         self.svo_worker.benchmark_complete.connect(self._on_svo_benchmark_complete)
         self.svo_worker.benchmark_failed.connect(self._on_svo_benchmark_failed)
         
-        # Set flag directly instead of using signal (more reliable)
+        # Set flag directly instead of using signal (more reliable); also wakes the waiting worker
         print("[DEBUG] GUI: Setting start flag directly...")
-        self.svo_worker._start_benchmark = True
+        self.svo_worker.request_start()
         print("[DEBUG] GUI: Start flag set")
     
     def _toggle_pause(self):
@@ -1913,15 +2545,15 @@ class JetsonBenchmarkApp(QMainWindow):
         
         if self.svo_worker._paused:
             self.pause_btn.setText("▶ Resume")
-            self.pause_btn.setStyleSheet("background-color: #4CAF50; color: white; font-size: 11px; padding: 8px;")
+            self.pause_btn.setStyleSheet(_QSS_BTN_RESUME)
             self.skip_widget.setVisible(True)  # Show skip controls when paused
-            self.output_text.append("⏸ Benchmark paused - You can now skip frames")
+            self._log("⏸ Benchmark paused - You can now skip frames")
             self.statusBar().showMessage("Benchmark paused - Use skip controls")
         else:
             self.pause_btn.setText("⏸ Pause")
-            self.pause_btn.setStyleSheet("background-color: #FF9800; color: white; font-size: 11px; padding: 8px;")
+            self.pause_btn.setStyleSheet(_QSS_BTN_PAUSE)
             self.skip_widget.setVisible(False)  # Hide skip controls when resumed
-            self.output_text.append("▶ Benchmark resumed")
+            self._log("▶ Benchmark resumed")
             self.statusBar().showMessage("Benchmark resumed")
     
     def _skip_frames(self):
@@ -1939,7 +2571,7 @@ class JetsonBenchmarkApp(QMainWindow):
         # Signal the worker to skip frames
         self.svo_worker.skip_frames_requested.emit(skip_count)
         
-        self.output_text.append(f"⏭ Skipping {skip_count} frames...")
+        self._log(f"⏭ Skipping {skip_count} frames...")
         self.statusBar().showMessage(f"Skipping {skip_count} frames...")
     
     def _stop_benchmark(self):
@@ -1956,7 +2588,7 @@ class JetsonBenchmarkApp(QMainWindow):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            self.output_text.append("⏹ Stopping benchmark...")
+            self._log("⏹ Stopping benchmark...")
             self.statusBar().showMessage("Stopping benchmark...")
             
             # Request cancellation
@@ -1978,15 +2610,21 @@ class JetsonBenchmarkApp(QMainWindow):
         
         if is_checked:
             self.toggle_depthmap_btn.setText("📊 Hide Depth Heatmap")
-            self.output_text.append("📊 Depth heatmap visualization enabled")
+            self._log("📊 Depth heatmap visualization enabled")
         else:
             self.toggle_depthmap_btn.setText("📊 Show Depth Heatmap")
-            self.output_text.append("📊 Depth heatmap visualization disabled")
+            self._log("📊 Depth heatmap visualization disabled")
             self.depth_map_viewer.clear()
     
     def _on_svo_progress(self, current: int, total: int, status: str, fps: float, num_objects: int, 
                          mean_depth: float, component_percentages: dict, depth_data: object):
         """Handle SVO processing progress with detailed stats."""
+        # Repaint widgets at most every 100 ms (the last frame always gets through)
+        now = time.monotonic()
+        if now - self._last_ui_update < 0.1 and current < total - 1:  # Last frame index is total - 1
+            return
+        self._last_ui_update = now
+        
         # Update status bar
         self.statusBar().showMessage(f"{status} | FPS: {fps:.1f} | Objects: {num_objects}")
         
@@ -2019,26 +2657,41 @@ class JetsonBenchmarkApp(QMainWindow):
             if self.toggle_depthmap_btn.isChecked() and self.depth_map_viewer.isVisible():
                 self.depth_map_viewer.update_depth_map(depth_data.depth_array, depth_data.bbox)
         
-        # Log every 10 frames
-        if current % 10 == 0:
-            self.output_text.append(f"   {status} | FPS: {fps:.1f} | Obj: {num_objects}")
+        # Log about once per second (updates arrive throttled, so frame-number
+        # based logging would be irregular)
+        if now - self._last_log_time >= 1.0:
+            self._last_log_time = now
+            self._log(f"   {status} | FPS: {fps:.1f} | Obj: {num_objects}")
 
     
     def _on_frame_preview(self, img_rgb):
         """Update preview with latest processed frame."""
-        import numpy as np
-        
-        # Convert numpy array to QPixmap
+        # Wrap the numpy array (no copy): the scenario double-buffers previews and
+        # won't rewrite this buffer until preview_consumed() has been called
+        img_rgb = np.ascontiguousarray(img_rgb)  # No-op for the scenario's buffers
         height, width, channel = img_rgb.shape
         bytes_per_line = 3 * width
         q_image = QImage(img_rgb.data, width, height, bytes_per_line, QImage.Format.Format_RGB888)
-        pixmap = QPixmap.fromImage(q_image)
         
-        # Scale to fit preview label while maintaining aspect ratio
-        scaled = pixmap.scaled(self.preview_label.width(), self.preview_label.height(), 
-                               Qt.AspectRatioMode.KeepAspectRatio, 
-                               Qt.TransformationMode.SmoothTransformation)
-        self.preview_label.setPixmap(scaled)
+        # Scale to fit preview label while maintaining aspect ratio, straight from
+        # the wrapped frame (no full-resolution QPixmap copy first). Nearest-neighbour
+        # is indistinguishable at preview size and far cheaper than smooth filtering
+        scaled = q_image.scaled(self.preview_label.width(), self.preview_label.height(), 
+                                Qt.AspectRatioMode.KeepAspectRatio, 
+                                Qt.TransformationMode.FastTransformation)
+        if scaled.size() == q_image.size():
+            # scaled() returns a shallow copy at unchanged size (the usual case, as the
+            # worker already downscales to the label size): detach from the numpy buffer
+            scaled = scaled.copy()
+        
+        # RGB888 is already a pixmap-friendly format: skip Qt's conversion pass
+        pixmap = QPixmap.fromImage(scaled, Qt.ImageConversionFlag.NoFormatConversion)
+        
+        if self.svo_worker is not None:
+            # Nothing references the worker's buffer any more: let it queue the next preview
+            self.svo_worker.preview_consumed()
+        
+        self.preview_label.setPixmap(pixmap)
     
     def _on_svo_benchmark_complete(self, run_folder: str, total_time: float, stats: dict):
         """Handle SVO benchmark completion."""
@@ -2051,75 +2704,60 @@ class JetsonBenchmarkApp(QMainWindow):
         self.stop_btn.setVisible(False)
         self.stop_btn.setEnabled(False)
         
-        self.output_text.append(f"\n✅ Benchmark complete in {total_time:.1f}s")
-        self.output_text.append("\n" + "-" * 70)
-        self.output_text.append("SVO2 PIPELINE STATISTICS:")
-        self.output_text.append(f"  Total Frames: {stats['total_frames']}")
-        self.output_text.append(f"  Frames w/ Detections: {stats['frames_with_detections']}")
-        self.output_text.append(f"  Frames Empty: {stats['frames_empty']}")
-        self.output_text.append(f"  Total Detections: {stats['total_detections']}")
-        self.output_text.append(f"  Avg Detections per Frame: {stats['avg_detections_per_frame']:.2f}")
-        self.output_text.append(f"  Mean FPS: {stats['mean_fps']:.2f}")
-        self.output_text.append(f"  Mean Latency: {stats['mean_latency_ms']:.2f} ms")
-        
-        self.output_text.append("\nCOMPONENT TIMING BREAKDOWN:")
-        for component, time_ms in stats['component_times_ms'].items():
-            self.output_text.append(f"  {component.capitalize()}: {time_ms:.2f} ms")
+        # Collect the report and append it in one go (each append relayouts the document)
+        lines = []
+        log = lines.append
+        log(f"\n✅ Benchmark complete in {total_time:.1f}s")
+        log("\n" + "-" * 70)
+        log("SVO2 PIPELINE STATISTICS:")
+        log(f"  Total Frames: {stats['total_frames']}")
+        log(f"  Frames w/ Detections: {stats['frames_with_detections']}")
+        log(f"  Frames Empty: {stats['frames_empty']}")
+        log(f"  Total Detections: {stats['total_detections']}")
+        log(f"  Avg Detections per Frame: {stats['avg_detections_per_frame']:.2f}")
+        log(f"  Mean FPS: {stats['mean_fps']:.2f}")
+        log(f"  Mean Latency: {stats['mean_latency_ms']:.2f} ms")
+        
+        # Formatted once, shared by the log and the summary dialog
+        comp_lines = [f"  {component.capitalize()}: {time_ms:.2f} ms"
+                      for component, time_ms in stats['component_times_ms'].items()]
+        log("\nCOMPONENT TIMING BREAKDOWN:")
+        lines.extend(comp_lines)
         
         # Frame-to-frame interval statistics
         if 'frame_interval_stats_ms' in stats and stats['frame_interval_stats_ms']:
             interval_stats = stats['frame_interval_stats_ms']
-            self.output_text.append("\nFRAME-TO-FRAME TIMING:")
-            self.output_text.append(f"  Mean: {interval_stats.get('mean', 0):.2f} ms")
-            self.output_text.append(f"  Median: {interval_stats.get('median', 0):.2f} ms")
-            self.output_text.append(f"  Std Dev: {interval_stats.get('stdev', 0):.2f} ms")
-            self.output_text.append(f"  Min: {interval_stats.get('min', 0):.2f} ms")
-            self.output_text.append(f"  Max: {interval_stats.get('max', 0):.2f} ms")
+            log("\nFRAME-TO-FRAME TIMING:")
+            log(f"  Mean: {interval_stats.get('mean', 0):.2f} ms")
+            log(f"  Median: {interval_stats.get('median', 0):.2f} ms")
+            log(f"  Std Dev: {interval_stats.get('stdev', 0):.2f} ms")
+            log(f"  Min: {interval_stats.get('min', 0):.2f} ms")
+            log(f"  Max: {interval_stats.get('max', 0):.2f} ms")
         
         # Detection vs no-detection comparison
+        detection_info = ""
         if 'detection_timing_comparison' in stats:
             comparison = stats['detection_timing_comparison']
-            self.output_text.append("\nDETECTION vs EMPTY FRAME TIMING:")
+            log("\nDETECTION vs EMPTY FRAME TIMING:")
             
             with_det = comparison.get('frames_with_detections', {})
             empty = comparison.get('frames_empty', {})
             
-            self.output_text.append(f"  Frames WITH detections ({with_det.get('count', 0)} frames):")
-            self.output_text.append(f"    Mean: {with_det.get('mean_ms', 0):.2f} ms")
-            self.output_text.append(f"    Median: {with_det.get('median_ms', 0):.2f} ms")
-            self.output_text.append(f"    Std Dev: {with_det.get('stdev_ms', 0):.2f} ms")
+            log(f"  Frames WITH detections ({with_det.get('count', 0)} frames):")
+            log(f"    Mean: {with_det.get('mean_ms', 0):.2f} ms")
+            log(f"    Median: {with_det.get('median_ms', 0):.2f} ms")
+            log(f"    Std Dev: {with_det.get('stdev_ms', 0):.2f} ms")
             
-            self.output_text.append(f"  Frames EMPTY ({empty.get('count', 0)} frames):")
-            self.output_text.append(f"    Mean: {empty.get('mean_ms', 0):.2f} ms")
-            self.output_text.append(f"    Median: {empty.get('median_ms', 0):.2f} ms")
-            self.output_text.append(f"    Std Dev: {empty.get('stdev_ms', 0):.2f} ms")
+            log(f"  Frames EMPTY ({empty.get('count', 0)} frames):")
+            log(f"    Mean: {empty.get('mean_ms', 0):.2f} ms")
+            log(f"    Median: {empty.get('median_ms', 0):.2f} ms")
+            log(f"    Std Dev: {empty.get('stdev_ms', 0):.2f} ms")
             
             # Calculate time difference
             if with_det.get('mean_ms', 0) > 0 and empty.get('mean_ms', 0) > 0:
                 diff = with_det['mean_ms'] - empty['mean_ms']
                 diff_pct = (diff / empty['mean_ms']) * 100
-                self.output_text.append(f"\n  ➜ Frames with detections are {diff:.2f} ms ({diff_pct:+.1f}%) {'slower' if diff > 0 else 'faster'}")
-        
-        self.output_text.append("-" * 70)
-        
-        if stats.get('images_saved'):
-            self.output_text.append(f"💾 Saved frames to: {Path(run_folder) / 'frames'}")
-        
-        self.statusBar().showMessage(f"Benchmark complete - {stats['mean_fps']:.2f} FPS")
-        
-        # Show enhanced summary
-        component_summary = "\n".join([f"  {k}: {v:.2f} ms" for k, v in stats['component_times_ms'].items()])
-        
-        # Add detection comparison to dialog
-        detection_info = ""
-        if 'detection_timing_comparison' in stats:
-            comparison = stats['detection_timing_comparison']
-            with_det = comparison.get('frames_with_detections', {})
-            empty = comparison.get('frames_empty', {})
-            
-            if with_det.get('mean_ms', 0) > 0 and empty.get('mean_ms', 0) > 0:
-                diff = with_det['mean_ms'] - empty['mean_ms']
-                diff_pct = (diff / empty['mean_ms']) * 100
+                log(f"\n  ➜ Frames with detections are {diff:.2f} ms ({diff_pct:+.1f}%) {'slower' if diff > 0 else 'faster'}")
                 detection_info = (
                     f"\n\nTiming Comparison:\n"
                     f"  With detections: {with_det['mean_ms']:.2f} ms ({with_det['count']} frames)\n"
@@ -2127,9 +2765,17 @@ class JetsonBenchmarkApp(QMainWindow):
                     f"  Difference: {diff:+.2f} ms ({diff_pct:+.1f}%)"
                 )
         
-        QMessageBox.information(
-            self,
-            "Benchmark Complete",
+        log("-" * 70)
+        
+        if stats.get('images_saved'):
+            log(f"💾 Saved frames to: {Path(run_folder) / 'frames'}")
+        self._log("\n".join(lines))
+        
+        self.statusBar().showMessage(f"Benchmark complete - {stats['mean_fps']:.2f} FPS")
+        
+        # Show enhanced summary
+        component_summary = "\n".join(comp_lines)
+        msg = (
             f"SVO2 Pipeline benchmark completed!\n\n"
             f"Processed {stats['total_frames']} frames in {total_time:.1f}s\n"
             f"Mean FPS: {stats['mean_fps']:.2f}\n"
@@ -2137,6 +2783,7 @@ class JetsonBenchmarkApp(QMainWindow):
             f"Component Breakdown:\n{component_summary}"
             f"{detection_info}"
         )
+        QMessageBox.information(self, "Benchmark Complete", msg)
     
     def _on_svo_benchmark_failed(self, error_msg: str):
         """Handle SVO benchmark failure."""
@@ -2149,7 +2796,7 @@ class JetsonBenchmarkApp(QMainWindow):
         self.stop_btn.setVisible(False)
         self.stop_btn.setEnabled(False)
         
-        self.output_text.append(f"\n❌ Benchmark failed: {error_msg}")
+        self._log(f"\n❌ Benchmark failed: {error_msg}")
         self.statusBar().showMessage("Benchmark failed")
         QMessageBox.critical(self, "Benchmark Failed", error_msg)
     
@@ -2172,6 +2819,50 @@ class JetsonBenchmarkApp(QMainWindow):
         )
         if file_path:
             self.engine_edit.setText(file_path)
+            self._check_engine_precision(Path(file_path))
+            self._check_engine_batch(Path(file_path))
+    
+    def _reload_engine(self):
+        """Forget the cached model so the next run deserializes the engine again."""
+        if self._cached_model is not None:
+            self._cached_model = None
+            self._log("🔄 Cached engine released; it will be reloaded on the next run")
+    
+    def _check_engine_precision(self, engine_path: Path):
+        """Log the engine precision and warn about FP32 engines."""
+        precision = read_engine_precision(engine_path)
+        if precision is None:
+            self._log(f"ℹ️ Engine precision unknown: {engine_path.name}")
+        elif precision == 'fp32':
+            self._log(f"⚠️ {engine_path.name} is an FP32 engine")
+            QMessageBox.warning(
+                self, "FP32 Engine",
+                "This engine was built in FP32.\n\n"
+                "FP16 (or INT8) engines run substantially faster on Jetson Tensor Cores.\n"
+                "Rebuild with the TensorRT Engine Builder (FP16 enabled) for realistic benchmarks."
+            )
+        else:
+            self._log(f"✓ Engine precision: {precision.upper()}")
+    
+    def _check_engine_batch(self, engine_path: Path):
+        """Match the batch size spinner to the engine's batch profile.
+        
+        Dynamic engines take any batch up to their max (defaulting to the max);
+        static engines only their exact batch size, so the spinner is locked to it.
+        """
+        engine_batch = read_engine_batch(engine_path)
+        if engine_batch is None:
+            self.batch_size_spin.setRange(1, 32)
+            return
+        if read_engine_dynamic(engine_path):
+            self.batch_size_spin.setRange(1, engine_batch)
+            kind = "max batch"
+        else:
+            self.batch_size_spin.setRange(engine_batch, engine_batch)
+            kind = "static batch"
+        self.batch_size_spin.setValue(engine_batch)
+        if engine_batch > 1:
+            self._log(f"✓ Engine {kind}: {engine_batch} (batch size set to match)")
     
     def _browse_test_folder(self):
         """Browse for test images folder."""
@@ -2184,20 +2875,27 @@ class JetsonBenchmarkApp(QMainWindow):
             self.test_folder_edit.setText(folder_path)
     
     def _on_folder_changed(self):
-        """Called when test folder path changes."""
+        """Called when test folder path changes (restarts the scan debounce)."""
+        self._folder_debounce.start()
+    
+    def _do_folder_scan(self):
+        """Count images in the current test folder path on the thread pool."""
         folder_text = self.test_folder_edit.text().strip()
-        if folder_text and Path(folder_text).exists():
-            self._update_image_count(Path(folder_text))
+        self._scan_token += 1
+        if folder_text:
+            QThreadPool.globalInstance().start(
+                _ImageCountTask(Path(folder_text), self._scan_token, self._scan_signals))
         else:
             self.image_count_label.setText("")
     
-    def _update_image_count(self, folder: Path):
-        """Count and display number of images in folder."""
-        count = 0
-        for ext in ['*.jpg', '*.jpeg', '*.png', '*.JPG', '*.JPEG', '*.PNG']:
-            count += len(list(folder.glob(ext)))
+    def _update_image_count(self, token: int, count: int):
+        """Display the image count of a finished scan (stale scans are ignored)."""
+        if token != self._scan_token:
+            return
         
-        if count > 0:
+        if count < 0:  # Folder missing/unreadable
+            self.image_count_label.setText("")
+        elif count > 0:
             self.image_count_label.setText(f"📊 Found {count} images in folder")
         else:
             self.image_count_label.setText("⚠ No images found in folder")
@@ -2225,7 +2923,7 @@ class JetsonBenchmarkApp(QMainWindow):
                 )
                 return
             
-            self.output_text.append(f"\n📂 Loading previous run: {run_folder}")
+            self._log(f"\n📂 Loading previous run: {run_folder}")
             self._start_validation(run_folder)
     
     def _run_inference(self):
@@ -2244,52 +2942,91 @@ class JetsonBenchmarkApp(QMainWindow):
         # Get max images setting
         max_images = None if self.use_all_check.isChecked() else self.max_images_spin.value()
         
+        # Batches outside the engine's profile would fail on the first call: at most
+        # the max batch for dynamic engines, exactly the batch size for static ones
+        batch_size = self.batch_size_spin.value()
+        engine_batch = read_engine_batch(engine_path)
+        if engine_batch is not None:
+            if not read_engine_dynamic(engine_path) and batch_size != engine_batch:
+                self._log(f"⚠️ Static-batch engine: using batch size {engine_batch} "
+                          f"instead of {batch_size}")
+                batch_size = engine_batch
+            elif batch_size > engine_batch:
+                self._log(f"⚠️ Batch size {batch_size} exceeds the engine's max batch, "
+                          f"using {engine_batch}")
+                batch_size = engine_batch
+        
         # Create benchmark run folder
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         run_folder = Path.home() / "jetson_benchmarks" / f"run_{timestamp}"
         run_folder.mkdir(parents=True, exist_ok=True)
         
-        self.output_text.append("\n" + "=" * 70)
-        self.output_text.append("⚠️  IMPORTANT: SOURCE FILES ARE NEVER MODIFIED")
-        self.output_text.append("   All images are COPIED (not moved) to benchmark folder")
-        self.output_text.append("   Your original test images remain untouched")
-        self.output_text.append("=" * 70)
-        self.output_text.append(f"📁 Created benchmark run: {run_folder}")
+        self._log("\n" + "=" * 70)
+        self._log("⚠️  IMPORTANT: SOURCE FILES ARE NEVER MODIFIED")
+        self._log("   Images are HARDLINKED (read-only reference) into the benchmark folder")
+        self._log("   (reflinked, symlinked or copied where hardlinks are not possible)")
+        self._log("   Your original test images remain untouched")
+        self._log("=" * 70)
+        self._log(f"📁 Created benchmark run: {run_folder}")
         if max_images:
-            self.output_text.append(f"📊 Testing on {max_images} RANDOMLY SELECTED images")
+            self._log(f"📊 Testing on {max_images} RANDOMLY SELECTED images")
         else:
-            self.output_text.append("📊 Testing on ALL images in folder (random order)")
-        self.output_text.append("🚀 Starting inference...")
+            self._log("📊 Testing on ALL images in folder (random order)")
+        self._log("🚀 Starting inference...")
         
         # Disable UI
         self.run_btn.setEnabled(False)
         
+        # Reuse the model from the last run if it used this engine and the file is unchanged
+        engine_key = (str(engine_path.resolve()), engine_path.stat().st_mtime_ns)
+        model = None
+        if self._cached_model is not None and self._cached_model[:2] == engine_key:
+            model = self._cached_model[2]
+            self._log("♻️ Reusing the engine loaded by the previous run")
+        self._cached_model = None  # Handed to the worker; stored again when the run completes
+        
         # Start worker
-        self.worker = InferenceWorker(engine_path, test_folder, run_folder, max_images=max_images)
+        self.worker = InferenceWorker(engine_path, test_folder, run_folder, max_images=max_images,
+                                      batch_size=batch_size,
+                                      gpu_decode=self.gpu_decode_check.isChecked(),
+                                      model=model)
         self.worker.progress_updated.connect(self._on_progress)
         self.worker.inference_complete.connect(self._on_inference_complete)
         self.worker.inference_failed.connect(self._on_inference_failed)
         self.worker.start()
     
     def _on_progress(self, current: int, total: int, image_name: str, fps: float):
-        """Handle progress updates."""
+        """Handle progress updates (status bar refreshed at most every 100 ms, and at the end)."""
+        now = time.monotonic()
+        if current != total and now - self._last_status_update < 0.1:
+            return
+        self._last_status_update = now
         self.statusBar().showMessage(f"Processing {current}/{total}: {image_name} | Current FPS: {fps:.1f}")
     
     def _on_inference_complete(self, run_folder: str, total_time: float, stats: dict):
         """Handle inference completion."""
         self.run_btn.setEnabled(True)
         
-        self.output_text.append(f"\n✅ Inference complete in {total_time:.1f}s")
-        self.output_text.append("\n" + "-" * 70)
-        self.output_text.append("STATISTICS:")
-        self.output_text.append(f"  Total Images: {stats['total_images']}")
-        self.output_text.append(f"  Images w/ Detections: {stats['images_with_detections']}")
-        self.output_text.append(f"  Images Empty: {stats['images_empty']}")
-        self.output_text.append(f"  Total Detections: {stats['total_detections']}")
-        self.output_text.append(f"  Avg Detections per Image: {stats['avg_detections_per_image']:.2f}")
-        self.output_text.append(f"  Mean FPS: {stats['mean_fps']:.2f}")
-        self.output_text.append(f"  Mean Latency: {stats['mean_latency_ms']:.2f} ms")
-        self.output_text.append("-" * 70)
+        # Keep the loaded model for the next run on the same engine
+        if self.worker is not None and self.worker.model is not None:
+            engine_path = self.worker.engine_path
+            try:
+                self._cached_model = (str(engine_path.resolve()), engine_path.stat().st_mtime_ns,
+                                      self.worker.model)
+            except OSError:
+                self._cached_model = None
+        
+        self._log(f"\n✅ Inference complete in {total_time:.1f}s")
+        self._log("\n" + "-" * 70)
+        self._log("STATISTICS:")
+        self._log(f"  Total Images: {stats['total_images']}")
+        self._log(f"  Images w/ Detections: {stats['images_with_detections']}")
+        self._log(f"  Images Empty: {stats['images_empty']}")
+        self._log(f"  Total Detections: {stats['total_detections']}")
+        self._log(f"  Avg Detections per Image: {stats['avg_detections_per_image']:.2f}")
+        self._log(f"  Mean FPS: {stats['mean_fps']:.2f}")
+        self._log(f"  Mean Latency: {stats['mean_latency_ms']:.2f} ms")
+        self._log("-" * 70)
         
         self.statusBar().showMessage(f"Inference complete - {stats['mean_fps']:.2f} FPS")
         
@@ -2311,7 +3048,7 @@ class JetsonBenchmarkApp(QMainWindow):
     def _on_inference_failed(self, error_msg: str):
         """Handle inference failure."""
         self.run_btn.setEnabled(True)
-        self.output_text.append(f"\n❌ Error: {error_msg}")
+        self._log(f"\n❌ Error: {error_msg}")
         self.statusBar().showMessage("Inference failed")
         QMessageBox.critical(self, "Inference Failed", error_msg)
     
@@ -2326,11 +3063,11 @@ class JetsonBenchmarkApp(QMainWindow):
             self.stacked_widget.addWidget(self.validation_viewer)
             self.stacked_widget.setCurrentWidget(self.validation_viewer)
             
-            self.output_text.append(f"\n🔍 Starting validation for {len(self.validation_viewer.image_files)} images")
+            self._log(f"\n🔍 Starting validation for {len(self.validation_viewer.image_files)} images")
             self.statusBar().showMessage("Validation mode - Review each image")
         except ValueError as e:
             # Validation viewer initialization failed (no images)
-            self.output_text.append(f"\n❌ Cannot start validation: {str(e)}")
+            self._log(f"\n❌ Cannot start validation: {str(e)}")
             QMessageBox.critical(
                 self,
                 "Validation Error",
@@ -2340,7 +3077,7 @@ class JetsonBenchmarkApp(QMainWindow):
     
     def _on_validation_complete(self):
         """Handle validation completion."""
-        self.output_text.append("\n✅ Validation complete! Report generated.")
+        self._log("\n✅ Validation complete! Report generated.")
         self.statusBar().showMessage("Validation complete - Ready for next benchmark")
         
         # Switch back to main widget
@@ -2356,6 +3093,7 @@ class JetsonBenchmarkApp(QMainWindow):
 def main():
     """Main entry point."""
     app = QApplication(sys.argv)
+    _pin_current_thread(gui=True)
     window = JetsonBenchmarkApp()
     window.show()
     sys.exit(app.exec())
@@ -0,0 +1,60 @@
+"""Minimal raw file writers for the frame export (JPEG payloads, ``.npy`` depth maps).
+
+``save_npy`` produces standard NPY v1.0 files (readable with ``np.load``) but skips the
+header formatting/validation ``np.save`` repeats for every call: exported depth
+maps all share one dtype and shape, so the header is built once and reused.
+"""
+from __future__ import annotations
+
+import functools
+import os
+from pathlib import Path
+from typing import Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+_NPY_MAGIC = b"\x93NUMPY\x01\x00"
+_NPY_ALIGN = 64
+_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+_HAS_WRITEV = hasattr(os, "writev")
+
+
+@functools.lru_cache(maxsize=8)
+def _npy_header(descr: str, shape: Tuple[int, ...]) -> bytes:
+    """Return the complete NPY v1.0 preamble (magic, length, padded dict)."""
+    header = f"{{'descr': '{descr}', 'fortran_order': False, 'shape': {shape!r}, }}"
+    # Pad with spaces so magic + length + dict + newline ends on an aligned offset
+    preamble_len = len(_NPY_MAGIC) + 2
+    padding = -(preamble_len + len(header) + 1) % _NPY_ALIGN
+    header = (header + " " * padding + "\n").encode("latin1")
+    return _NPY_MAGIC + len(header).to_bytes(2, "little") + header
+
+
+def write_buffers(path: Union[str, Path], buffers: Sequence, dir_fd: Optional[int] = None) -> None:
+    """Write ``buffers`` (bytes-like, C-contiguous) back to back into ``path``.
+
+    Uses raw fd writes (a single ``writev`` where available) instead of a
+    buffered file object, so the payload is not copied into Python's buffer.
+    With ``dir_fd``, ``path`` is resolved relative to that open directory.
+    """
+    views = [memoryview(buf).cast("B") for buf in buffers]
+    fd = os.open(path, _OPEN_FLAGS, 0o644, dir_fd=dir_fd)
+    try:
+        done = os.writev(fd, views) if _HAS_WRITEV else 0
+        # Finish whatever a short writev left over
+        for view in views:
+            if done >= len(view):
+                done -= len(view)
+                continue
+            view, done = view[done:], 0
+            while view:
+                view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def save_npy(path: Union[str, Path], array: np.ndarray, dir_fd: Optional[int] = None) -> None:
+    """Write ``array`` to ``path`` in NPY format (C order, raw buffer, no pickling)."""
+    array = np.ascontiguousarray(array)
+    header = _npy_header(np.lib.format.dtype_to_descr(array.dtype), array.shape)
+    write_buffers(path, (header, array), dir_fd)
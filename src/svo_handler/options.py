@@ -1,15 +1,15 @@
 """Data models for frame export options."""
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
-from .config import DEFAULT_OUTPUT_ROOT, STREAM_LEFT, DEFAULT_DEPTH_MODE
+from .config import pick_default_output_root, STREAM_LEFT, DEFAULT_DEPTH_MODE, DEFAULT_DEPTH_DTYPE
 
 
 @dataclass
 class FrameExportOptions:
     svo_path: Path
-    output_root: Path = DEFAULT_OUTPUT_ROOT
+    output_root: Path = field(default_factory=pick_default_output_root)  # Mount probe runs per instance, not at import
     stream: str = STREAM_LEFT
     source_fps: Optional[int] = None
     total_frames: Optional[int] = None
@@ -17,6 +17,10 @@ class FrameExportOptions:
     export_depth: bool = False
     depth_format: str = "npy"  # future: allow raw/bin
     depth_mode: str = DEFAULT_DEPTH_MODE
+    depth_dtype: str = DEFAULT_DEPTH_DTYPE  # see config.DEPTH_DTYPES
+    # False: jump keep_every frames with set_svo_position instead of grabbing every frame
+    # (much less decoding, but dropped frames in the SVO are no longer skipped exactly)
+    accurate_drop_counting: bool = True
 
     @property
     def keep_every(self) -> int:
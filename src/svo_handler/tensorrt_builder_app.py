@@ -8,6 +8,7 @@ to optimized TensorRT engines for Jetson deployment.
 
 import sys
 from pathlib import Path
+from typing import Optional
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QLineEdit, QFileDialog, QTextEdit,
@@ -24,11 +25,17 @@ class TensorRTBuildWorker(QThread):
     build_complete = Signal(str)    # Engine path
     build_failed = Signal(str)      # Error message
     
-    def __init__(self, export_folder: Path, fp16: bool, workspace: int):
+    def __init__(self, export_folder: Path, fp16: bool, workspace: int,
+                 int8: bool = False, calib_data: Optional[Path] = None,
+                 batch: int = 1, dynamic: bool = False):
         super().__init__()
         self.export_folder = export_folder
         self.fp16 = fp16
         self.workspace = workspace
+        self.int8 = int8
+        self.calib_data = calib_data
+        self.batch = batch
+        self.dynamic = dynamic
         self._cancelled = False
     
     def cancel(self):
@@ -53,6 +60,14 @@ class TensorRTBuildWorker(QThread):
             if not self.fp16:
                 cmd.append("--no-fp16")
             
+            if self.int8:
+                cmd += ["--int8", f"--calib-data={self.calib_data}"]
+            
+            if self.batch > 1:
+                cmd.append(f"--batch={self.batch}")
+            if self.dynamic:
+                cmd.append("--dynamic")
+            
             self.progress_updated.emit("🔨 Starting TensorRT build...")
             self.progress_updated.emit(f"Command: {' '.join(cmd)}\n")
             
@@ -144,6 +159,39 @@ class TensorRTBuilderApp(QMainWindow):
         self.fp16_check.setChecked(True)
         options_layout.addWidget(self.fp16_check)
         
+        # INT8 precision (needs calibration images)
+        self.int8_check = QCheckBox("Enable INT8 precision (fastest, needs calibration data)")
+        self.int8_check.toggled.connect(self._on_int8_toggled)
+        options_layout.addWidget(self.int8_check)
+        
+        calib_row = QHBoxLayout()
+        calib_row.addWidget(QLabel("Calibration data (YAML):"))
+        self.calib_edit = QLineEdit()
+        self.calib_edit.setPlaceholderText("data.yaml of the training dataset (val images are used)")
+        calib_row.addWidget(self.calib_edit)
+        self.calib_browse_btn = QPushButton("Browse...")
+        self.calib_browse_btn.clicked.connect(self._browse_calib_data)
+        calib_row.addWidget(self.calib_browse_btn)
+        options_layout.addLayout(calib_row)
+        self._on_int8_toggled(False)
+        
+        # Batch size baked into the engine
+        batch_row = QHBoxLayout()
+        batch_row.addWidget(QLabel("Max batch size:"))
+        self.batch_spin = QSpinBox()
+        self.batch_spin.setRange(1, 32)
+        self.batch_spin.setValue(1)
+        batch_row.addWidget(self.batch_spin)
+        self.dynamic_check = QCheckBox("Dynamic batch")
+        self.dynamic_check.setToolTip(
+            "Optimization profile min=1, opt=max/2, max=batch size.\n"
+            "Max batch 16 (opt 8) suits batched benchmarks on Jetson Orin."
+        )
+        self.dynamic_check.toggled.connect(self._on_dynamic_toggled)
+        batch_row.addWidget(self.dynamic_check)
+        batch_row.addStretch()
+        options_layout.addLayout(batch_row)
+        
         # Workspace size
         workspace_row = QHBoxLayout()
         workspace_row.addWidget(QLabel("Workspace size (GB):"))
@@ -193,6 +241,27 @@ class TensorRTBuilderApp(QMainWindow):
             self.folder_edit.setText(folder)
             self._validate_folder(Path(folder))
     
+    def _on_int8_toggled(self, checked: bool):
+        """Enable calibration data selection only for INT8 builds."""
+        self.calib_edit.setEnabled(checked)
+        self.calib_browse_btn.setEnabled(checked)
+    
+    def _on_dynamic_toggled(self, checked: bool):
+        """Suggest a batch-16 profile when switching to a dynamic build."""
+        if checked and self.batch_spin.value() == 1:
+            self.batch_spin.setValue(16)
+    
+    def _browse_calib_data(self):
+        """Open file dialog for the INT8 calibration dataset YAML."""
+        file_path, _ = QFileDialog.getOpenFileName(
+            self,
+            "Select Calibration Dataset",
+            str(Path.home()),
+            "Dataset YAML (*.yaml *.yml)"
+        )
+        if file_path:
+            self.calib_edit.setText(file_path)
+    
     def _validate_folder(self, folder: Path) -> bool:
         """Validate export folder structure."""
         models_dir = folder / "models"
@@ -220,6 +289,13 @@ class TensorRTBuilderApp(QMainWindow):
         if not self._validate_folder(folder):
             return
         
+        calib_data = None
+        if self.int8_check.isChecked():
+            calib_data = Path(self.calib_edit.text().strip())
+            if not calib_data.is_file():
+                self.output_text.append("❌ INT8 needs a calibration dataset YAML")
+                return
+        
         # Disable UI during build
         self.build_btn.setEnabled(False)
         self.progress_bar.setVisible(True)
@@ -230,7 +306,11 @@ class TensorRTBuilderApp(QMainWindow):
         self.worker = TensorRTBuildWorker(
             folder,
             self.fp16_check.isChecked(),
-            self.workspace_spin.value()
+            self.workspace_spin.value(),
+            int8=self.int8_check.isChecked(),
+            calib_data=calib_data,
+            batch=self.batch_spin.value(),
+            dynamic=self.dynamic_check.isChecked()
         )
         self.worker.progress_updated.connect(self._on_progress)
         self.worker.build_complete.connect(self._on_complete)
@@ -1202,6 +1202,11 @@ class ViewerWindow(QtWidgets.QMainWindow):
         except Exception as exc:
             self.depth_view.setText(f"Depth laden fehlgeschlagen: {exc}")
             return
+        # Exports may store uint16 millimetres or float16 meters; work in float32 meters
+        if np.issubdtype(data.dtype, np.integer):
+            data = data.astype(np.float32) / 1000.0
+        elif data.dtype != np.float32:
+            data = data.astype(np.float32)
         # Placeholder: simple min/max clamp and grayscale mapping
         vmin = self.min_slider.value()
         vmax = max(self.max_slider.value(), vmin + 1)